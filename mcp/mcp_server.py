@@ -148,6 +148,7 @@ def pipeline(file_path: str, author: str = "ai-assistant") -> str:
         "summary": result.summary,
         "stopped_at": result.stopped_at,
         "gates": gates,
+        "gate_timings": result.gate_timings,
     }, ensure_ascii=False, indent=2)
 
 
@@ -211,11 +212,12 @@ def architecture_check(file_path: str) -> str:
 @mcp.tool()
 def code_search(query: str, top_k: int = 5) -> str:
     """자연어로 코드베이스를 검색합니다.
-    '인증 처리하는 함수', 'DB 연결 설정' 등 의미 기반으로 관련 코드를 찾습니다.
+    '인증 처리하는 함수', 'DB 연결 설정' 등 의미 기반 질의와
+    '_detect_overlap' 같은 정확한 식별자 질의를 모두 지원합니다 (벡터 + BM25).
     먼저 index_codebase로 인덱싱이 되어 있어야 합니다."""
-    from src.layer2_rag.searcher import CodeSearcher
+    from src.layer2_rag.registry import get_searcher
 
-    searcher = CodeSearcher(_config)
+    searcher = get_searcher(_config)
     results = searcher.search(query, top_k=top_k)
 
     if not results:
@@ -238,18 +240,24 @@ def code_search(query: str, top_k: int = 5) -> str:
 # Tool 6: 코드베이스 인덱싱
 # ================================================================
 @mcp.tool()
-def index_codebase(path: str = ".") -> str:
+def index_codebase(path: str = ".", full: bool = False) -> str:
     """프로젝트 코드베이스를 벡터 DB에 인덱싱합니다.
-    코드 검색(code_search)을 사용하기 전에 먼저 실행해야 합니다."""
+    코드 검색(code_search)을 사용하기 전에 먼저 실행해야 합니다.
+    기본은 변경된 파일만 재인덱싱하며, full=True면 전체를 다시 인덱싱합니다."""
     from src.layer2_rag.indexer import CodebaseIndexer
+    from src.layer2_rag.registry import get_store
 
-    indexer = CodebaseIndexer(_config)
+    indexer = CodebaseIndexer(_config, store=get_store(_config))
     target = Path(path).resolve()
-    stats = indexer.index_project(target)
+    stats = indexer.index_project(target, full=full)
 
     return json.dumps({
         "total_files": stats.total_files,
         "indexed": stats.indexed_files,
+        "unchanged": stats.unchanged_files,
+        "deleted": stats.deleted_files,
+        "split_chunks": stats.split_chunks,
+        "truncated_chunks": stats.truncated_chunks,
         "skipped": stats.skipped_files,
         "chunks": stats.total_chunks,
         "errors": len(stats.errors),
@@ -380,7 +388,7 @@ def meta_batch(directory: str = "") -> str:
     """디렉토리 내 모든 소스 파일의 .meta.json을 일괄 생성하고 Vector DB에 인덱싱합니다.
     directory를 비우면 프로젝트 전체(src/)를 대상으로 합니다."""
     from src.layer2_rag.meta_generator import MetaGenerator
-    from src.layer2_rag.vector_db import VectorStore
+    from src.layer2_rag.registry import get_store
 
     gen = MetaGenerator(_config)
     target = Path(directory) if directory else VIBE_X_ROOT / "src"
@@ -389,7 +397,7 @@ def meta_batch(directory: str = "") -> str:
     chunks = gen.index_all_metas()
     indexed = 0
     if chunks:
-        store = VectorStore(_config)
+        store = get_store(_config)
         for chunk in chunks:
             store.delete_by_file(chunk.file_path)
         indexed = store.add_chunks(chunks)
@@ -628,4 +636,8 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    # 첫 code_search 호출이 모델 로드를 기다리지 않도록 미리 초기화
+    from src.layer2_rag.registry import warm_up_in_background
+
+    warm_up_in_background(_config)
     mcp.run(transport=args.transport)
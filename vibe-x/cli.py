@@ -2,11 +2,14 @@
 
 사용법:
     python cli.py index [경로]       - 코드베이스 인덱싱
+    python cli.py watch [경로]       - 파일 변경 감시 + 실시간 증분 인덱싱
     python cli.py search <질의>      - 시맨틱 검색
     python cli.py gate <파일>        - 품질 게이트 실행 (Gate 1-2)
     python cli.py pipeline <파일>    - 6-Gate 전체 파이프라인 실행
+    python cli.py pipeline --staged  - 스테이징된 변경 세트 배치 파이프라인
     python cli.py review <파일>      - Gate 4 코드 리뷰 단독 실행
     python cli.py arch <파일>        - Gate 5 아키텍처 검증 단독 실행
+    python cli.py coverage-map       - Gate 3 테스트 선별용 커버리지 맵 기록
     python cli.py zone <명령>        - 작업 영역 관리
     python cli.py decision <텍스트>  - 설계 결정 추출
     python cli.py mcp-status         - MCP 서버 상태 조회
@@ -50,8 +53,9 @@ def cli() -> None:
 
 @cli.command()
 @click.argument("path", default=".", type=click.Path(exists=True))
-def index(path: str) -> None:
-    """코드베이스를 벡터 DB에 인덱싱한다."""
+@click.option("--full", is_flag=True, help="매니페스트를 무시하고 전체 재인덱싱")
+def index(path: str, full: bool) -> None:
+    """코드베이스를 벡터 DB에 인덱싱한다 (기본: 변경 파일만)."""
     from src.layer2_rag.indexer import CodebaseIndexer
 
     config = _get_config()
@@ -70,7 +74,7 @@ def index(path: str) -> None:
         console=console,
     ) as progress:
         task = progress.add_task("인덱싱 중...", total=None)
-        stats = indexer.index_project(target)
+        stats = indexer.index_project(target, full=full)
         progress.update(task, description="완료!")
 
     # 결과 테이블
@@ -79,10 +83,19 @@ def index(path: str) -> None:
     table.add_column("값", justify="right")
     table.add_row("전체 파일", str(stats.total_files))
     table.add_row("인덱싱 완료", f"[green]{stats.indexed_files}[/green]")
+    table.add_row("변경 없음", str(stats.unchanged_files))
+    table.add_row("삭제 반영", str(stats.deleted_files))
+    table.add_row("스트리밍 청킹", str(stats.streamed_files))
+    table.add_row("토큰 초과 분할", str(stats.split_chunks))
+    table.add_row("토큰 초과 절단", str(stats.truncated_chunks))
+    table.add_row("긴 라인 절단", str(stats.truncated_lines))
     table.add_row("스킵", str(stats.skipped_files))
     table.add_row("에러", f"[red]{len(stats.errors)}[/red]" if stats.errors else "0")
     table.add_row("총 청크", f"[cyan]{stats.total_chunks}[/cyan]")
+    table.add_row("청킹 워커", str(stats.workers))
     table.add_row("소요 시간", f"{stats.duration_seconds}s")
+    for stage, seconds in stats.stage_seconds.items():
+        table.add_row(f"  {stage}", f"[dim]{seconds}s[/dim]")
     console.print(table)
 
     if stats.errors:
@@ -91,12 +104,52 @@ def index(path: str) -> None:
             console.print(f"  - {err}")
 
 
+@cli.command()
+@click.argument("path", default=".", type=click.Path(exists=True, file_okay=False))
+@click.option("--debounce", type=float, default=None, help="마지막 저장 후 대기 시간(초)")
+@click.option("--no-sync", is_flag=True, help="시작 시 증분 인덱싱을 건너뜀")
+def watch(path: str, debounce: float | None, no_sync: bool) -> None:
+    """파일 변경을 감시하며 저장된 파일을 실시간으로 재인덱싱한다."""
+    from dataclasses import replace
+
+    from src.layer2_rag.watcher import IndexWatcher
+
+    config = _get_config()
+    if debounce is not None:
+        config = replace(config, rag=replace(config.rag, watch_debounce_seconds=debounce))
+    target = Path(path).resolve()
+
+    console.print(Panel(
+        f"[bold cyan]감시 대상:[/bold cyan] {target}\n"
+        f"[dim]debounce {config.rag.watch_debounce_seconds}s · Ctrl+C로 종료[/dim]",
+        title="VIBE-X Watch",
+        border_style="cyan",
+    ))
+
+    watcher = IndexWatcher(config)
+    try:
+        watcher.run(target, sync=not no_sync)
+    except KeyboardInterrupt:
+        watcher.stop()
+    console.print(
+        f"[green]재인덱싱 {watcher.indexed_files}개[/green], "
+        f"제거 {watcher.removed_files}개"
+    )
+
+
 @cli.command()
 @click.argument("query")
 @click.option("-k", "--top-k", default=5, help="반환할 결과 수")
 @click.option("-f", "--file-filter", default=None, help="파일 경로 필터")
 @click.option("-l", "--lang", default=None, help="언어 필터")
-def search(query: str, top_k: int, file_filter: str | None, lang: str | None) -> None:
+@click.option(
+    "-m", "--mode", default="hybrid",
+    type=click.Choice(["hybrid", "vector", "keyword"]),
+    help="검색 모드 (hybrid: 벡터 + BM25 융합)",
+)
+def search(
+    query: str, top_k: int, file_filter: str | None, lang: str | None, mode: str
+) -> None:
     """자연어로 코드베이스를 검색한다."""
     from src.layer2_rag.searcher import CodeSearcher
 
@@ -109,7 +162,7 @@ def search(query: str, top_k: int, file_filter: str | None, lang: str | None) ->
         border_style="cyan",
     ))
 
-    results = searcher.search(query, top_k, file_filter, lang)
+    results = searcher.search(query, top_k, file_filter, lang, mode=mode)
 
     if not results:
         console.print("[yellow]검색 결과가 없습니다. 먼저 인덱싱을 실행하세요.[/yellow]")
@@ -220,12 +273,26 @@ def reset() -> None:
 # Phase 3 Commands: 6-Gate Pipeline, Review, Arch, Zone, Decision
 # ============================================================
 
+def _gate_status_str(status: GateStatus) -> str:
+    if status == GateStatus.PASSED:
+        return "[green]PASS[/green]"
+    if status == GateStatus.WARNING:
+        return "[yellow]WARN[/yellow]"
+    if status == GateStatus.FAILED:
+        return "[red]FAIL[/red]"
+    return "[dim]SKIP[/dim]"
+
+
 @cli.command()
-@click.argument("file_path", type=click.Path(exists=True))
+@click.argument("file_paths", nargs=-1, type=click.Path(exists=True))
+@click.option("--staged", is_flag=True, help="git에 스테이징된 파일 전체를 배치로 검증")
 @click.option("--author", default="current", help="작업자 식별자")
 @click.option("--bypass", is_flag=True, help="전체 Gate를 WARN 모드로 실행 (핫픽스용)")
-def pipeline(file_path: str, author: str, bypass: bool) -> None:
-    """6-Gate 전체 파이프라인을 실행한다 (Gate 1-6)."""
+def pipeline(file_paths: tuple[str, ...], staged: bool, author: str, bypass: bool) -> None:
+    """6-Gate 전체 파이프라인을 실행한다 (Gate 1-6).
+
+    파일이 여러 개이거나 --staged면 배치 모드: Gate 3, 6은 변경 세트 전체에 한 번만 실행한다.
+    """
     from src.layer3_agents.gate_runner import GateChainRunner, FailPolicy
 
     config = _get_config()
@@ -236,7 +303,23 @@ def pipeline(file_path: str, author: str, bypass: bool) -> None:
             runner.set_policy(g, FailPolicy.BYPASS)
         console.print("[yellow]BYPASS 모드: 모든 Gate 실패를 무시합니다.[/yellow]")
 
-    target = Path(file_path)
+    targets = [Path(f) for f in file_paths]
+    if staged:
+        from src.shared.file_walker import staged_files
+
+        try:
+            targets += staged_files(Path.cwd(), config.rag.supported_extensions)
+        except RuntimeError as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(1)
+    if not targets:
+        console.print("[yellow]검증할 파일이 없습니다.[/yellow]")
+        return
+    if staged or len(targets) > 1:
+        _run_batch_pipeline(runner, targets, author)
+        return
+
+    target = targets[0]
     console.print(Panel(
         f"[bold cyan]대상:[/bold cyan] {target}\n"
         f"[bold cyan]작업자:[/bold cyan] {author}",
@@ -251,19 +334,15 @@ def pipeline(file_path: str, author: str, bypass: bool) -> None:
     table.add_column("Gate", style="bold", width=8)
     table.add_column("이름", width=22)
     table.add_column("상태", width=8)
+    table.add_column("시간", justify="right", width=7)
     table.add_column("메시지")
 
     for gr in result.gate_results:
-        if gr.status == GateStatus.PASSED:
-            status_str = "[green]PASS[/green]"
-        elif gr.status == GateStatus.WARNING:
-            status_str = "[yellow]WARN[/yellow]"
-        elif gr.status == GateStatus.FAILED:
-            status_str = "[red]FAIL[/red]"
-        else:
-            status_str = "[dim]SKIP[/dim]"
-
-        table.add_row(str(gr.gate_number), gr.gate_name, status_str, gr.message)
+        seconds = result.gate_timings.get(gr.gate_number)
+        time_str = f"{seconds:.2f}s" if seconds is not None else "-"
+        table.add_row(
+            str(gr.gate_number), gr.gate_name, _gate_status_str(gr.status), time_str, gr.message
+        )
 
     console.print(table)
     console.print(
@@ -275,6 +354,56 @@ def pipeline(file_path: str, author: str, bypass: bool) -> None:
         console.print(f"[red]Gate {result.stopped_at}에서 파이프라인 중단[/red]")
 
 
+def _run_batch_pipeline(runner, targets: list[Path], author: str) -> None:
+    """배치 파이프라인을 실행하고 파일별 + 변경 세트 결과를 출력한다."""
+    console.print(Panel(
+        f"[bold cyan]대상:[/bold cyan] {len(targets)}개 파일\n"
+        f"[bold cyan]작업자:[/bold cyan] {author}",
+        title="VIBE-X 6-Gate Batch Pipeline",
+        border_style="cyan",
+    ))
+
+    batch = runner.run_batch(targets, author=author)
+
+    file_table = Table(title="파일별 결과 (Gate 1, 2, 4, 5)", border_style="cyan")
+    file_table.add_column("파일")
+    for number in (1, 2, 4, 5):
+        file_table.add_column(f"G{number}", width=6)
+    file_table.add_column("종합", width=8)
+    for file_path, result in batch.file_results.items():
+        by_gate = {gr.gate_number: gr.status for gr in result.gate_results}
+        cells = [
+            _gate_status_str(by_gate[n]) if n in by_gate else "[dim]-[/dim]"
+            for n in (1, 2, 4, 5)
+        ]
+        file_table.add_row(file_path, *cells, _gate_status_str(result.overall_status))
+    console.print(file_table)
+
+    changeset = batch.changeset_result
+    if changeset.gate_results:
+        table = Table(title="변경 세트 결과 (Gate 3, 6)", border_style="cyan")
+        table.add_column("Gate", style="bold", width=8)
+        table.add_column("이름", width=22)
+        table.add_column("상태", width=8)
+        table.add_column("시간", justify="right", width=7)
+        table.add_column("메시지")
+        for gr in changeset.gate_results:
+            seconds = changeset.gate_timings.get(gr.gate_number)
+            time_str = f"{seconds:.2f}s" if seconds is not None else "-"
+            table.add_row(
+                str(gr.gate_number), gr.gate_name, _gate_status_str(gr.status),
+                time_str, gr.message,
+            )
+        console.print(table)
+
+    console.print(
+        f"\n[bold]종합:[/bold] [{batch.overall_status.value}] {batch.summary}"
+    )
+    for file_path in batch.stopped_files:
+        stopped_at = batch.file_results[file_path].stopped_at
+        console.print(f"[red]{file_path}: Gate {stopped_at}에서 중단[/red]")
+
+
 @cli.command()
 @click.argument("file_path", type=click.Path(exists=True))
 def review(file_path: str) -> None:
@@ -315,6 +444,37 @@ def arch(file_path: str) -> None:
     _display_gate_result(result)
 
 
+@cli.command(name="coverage-map")
+@click.argument("targets", nargs=-1)
+def coverage_map(targets: tuple[str, ...]) -> None:
+    """Gate 3 선별용 테스트별 커버리지 맵을 기록한다 (기본 대상: tests)."""
+    from src.layer3_agents.coverage_map import CoverageMap
+
+    config = _get_config()
+    coverage = CoverageMap(config)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("테스트별 실행 라인 기록 중...", total=None)
+        try:
+            summary = coverage.record(list(targets) or None)
+        except RuntimeError as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(1)
+        progress.update(task, description="완료!")
+
+    console.print(
+        f"[green]테스트 {summary['tests']}개, 파일 {summary['files']}개 기록[/green] "
+        f"[dim](pytest 종료 코드 {summary['returncode']})[/dim]"
+    )
+    console.print(f"[dim]저장: {config.paths.coverage_map_path}[/dim]")
+    if not config.gate.coverage_selection:
+        console.print("[yellow]gate.coverage_selection을 켜야 Gate 3이 이 맵을 사용합니다.[/yellow]")
+
+
 @cli.command()
 @click.argument("action", type=click.Choice(["declare", "release", "list", "map"]))
 @click.option("--author", default="current", help="작업자 식별자")
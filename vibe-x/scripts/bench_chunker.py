@@ -0,0 +1,93 @@
+"""CodeChunker 구조적 청킹 마이크로벤치마크.
+
+합성 Python 파일(1만~10만 라인)에 대해 라인 번호 계산 방식을 비교한다.
+- naive: 매치마다 content[:pos].count("\\n") (기존 방식, O(n^2))
+- index: LineIndex 오프셋 테이블 + 이진 탐색 (현재 방식)
+
+실행: python scripts/bench_chunker.py [--lines 10000,50000,100000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.shared.config import load_config
+from src.shared.line_index import LineIndex
+from src.layer2_rag.chunker import PATTERNS, CodeChunker
+
+DEF_EVERY_LINES = 8
+
+
+def make_source(line_count: int) -> str:
+    """DEF_EVERY_LINES 라인마다 함수 정의가 있는 합성 소스를 만든다."""
+    lines: list[str] = []
+    i = 0
+    while len(lines) < line_count:
+        lines.append(f"def generated_{i}(value: int) -> int:")
+        lines.extend(f"    value = value + {j}" for j in range(DEF_EVERY_LINES - 2))
+        lines.append("    return value")
+        i += 1
+    return "\n".join(lines[:line_count])
+
+
+def naive_boundaries(content: str) -> list[int]:
+    """기존 방식: 매치마다 앞부분 개행을 다시 센다."""
+    result: list[int] = []
+    for pattern in PATTERNS["python"].values():
+        for match in pattern.finditer(content):
+            result.append(content[: match.start()].count("\n") + 1)
+    return sorted(result)
+
+
+def indexed_boundaries(content: str) -> list[int]:
+    """현재 방식: 오프셋 테이블을 한 번 만들고 이진 탐색한다."""
+    index = LineIndex(content)
+    result: list[int] = []
+    for pattern in PATTERNS["python"].values():
+        for match in pattern.finditer(content):
+            result.append(index.line_of(match.start()))
+    return sorted(result)
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    """repeat회 실행 중 최소 소요 시간(초)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", default="10000,25000,50000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    chunker = CodeChunker(load_config())
+    sizes = [int(n) for n in args.lines.split(",")]
+
+    print(f"{'lines':>8} {'naive(s)':>10} {'index(s)':>10} {'speedup':>8} {'structure(s)':>13}")
+    for size in sizes:
+        content = make_source(size)
+        assert naive_boundaries(content) == indexed_boundaries(content)
+
+        naive = best_of(args.repeat, naive_boundaries, content)
+        indexed = best_of(args.repeat, indexed_boundaries, content)
+        full = best_of(
+            args.repeat, chunker._chunk_by_structure, "bench.py", LineIndex(content), "python"
+        )
+        print(
+            f"{size:>8} {naive:>10.3f} {indexed:>10.4f} "
+            f"{naive / indexed:>7.0f}x {full:>13.4f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
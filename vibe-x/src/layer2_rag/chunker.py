@@ -5,14 +5,22 @@
 """
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.line_index import LineIndex
 from src.shared.logger import get_logger
 from src.shared.types import CodeChunk, ChunkType
+from src.layer2_rag.python_chunker import PythonAstChunker
+from src.layer2_rag.token_budget import TokenBudget, TokenCounter, TokenFitStats
 
 logger = get_logger("chunker")
 
+# 스트리밍 모드에서 한 라인으로 읽는 최대 문자 수.
+# 임베딩 토큰 한도를 훨씬 넘는 길이라 나머지는 어차피 벡터에 반영되지 않는다.
+MAX_STREAM_LINE_CHARS = 8192
+
 # 언어별 확장자 매핑
 EXTENSION_TO_LANGUAGE: dict[str, str] = {
     ".py": "python",
@@ -58,23 +66,73 @@ class CodeChunker:
     """코드를 의미 있는 청크로 분할하는 엔진.
 
     전략:
-    1. 함수/클래스 단위 분할 (구조적 청킹)
-    2. 구조 인식 불가 시 고정 라인 수 블록 분할 (폴백)
-    3. 문서 파일은 전체를 하나의 청크로 처리
+    1. Python은 AST 스코프 기반 분할 (함수/메서드별, Class.method 이름)
+    2. 그 외 언어 또는 구문 오류 시 정규식 기반 함수/클래스 분할
+    3. 구조 인식 불가 시 고정 라인 수 블록 분할 (폴백)
+    4. 문서 파일은 전체를 하나의 청크로 처리
+
+    모든 청크는 임베딩 모델 토큰 한도(chunk_max_tokens)에 맞춰 추가 분할된다.
+    stream_threshold_bytes보다 큰 파일은 전체를 메모리에 올리지 않고
+    라인 단위로 읽어 청크를 순차 생성한다 (iter_chunks).
     """
 
     def __init__(self, config: VibeXConfig | None = None) -> None:
         self._config = config or load_config()
+        rag = self._config.rag
+        self._python_chunker = PythonAstChunker(rag.chunk_max_lines)
+        self._token_budget: TokenBudget | None = None
+        if rag.chunk_max_tokens > 0:
+            self._token_budget = TokenBudget(
+                TokenCounter(rag.embedding_model),
+                rag.chunk_max_tokens,
+                rag.chunk_overlap_lines,
+            )
 
-    def chunk_file(self, file_path: Path) -> list[CodeChunk]:
+    def chunk_file(
+        self, file_path: Path, token_stats: TokenFitStats | None = None
+    ) -> list[CodeChunk]:
         """파일을 청크 목록으로 분할한다.
 
         Args:
             file_path: 대상 파일 경로
+            token_stats: 토큰 한도로 분할/절단된 청크 수를 누적할 통계 (선택)
 
         Returns:
             분할된 코드 청크 목록
         """
+        return list(self.iter_chunks(file_path, token_stats))
+
+    def iter_chunks(
+        self, file_path: Path, token_stats: TokenFitStats | None = None
+    ) -> Iterator[CodeChunk]:
+        """청크를 순차적으로 생성한다.
+
+        대용량 파일은 스트리밍 모드로 처리되어 메모리 사용량이 파일 크기와 무관하다.
+        """
+        stats = token_stats or TokenFitStats()
+        if self.should_stream(file_path):
+            chunks: Iterator[CodeChunk] = self._stream_chunks(file_path, stats)
+        else:
+            chunks = iter(self._chunk_content(file_path))
+
+        for chunk in chunks:
+            if self._token_budget is None:
+                yield chunk
+            else:
+                yield from self._token_budget.fit([chunk], stats)
+
+    def should_stream(self, file_path: Path) -> bool:
+        """파일 크기가 스트리밍 임계값을 넘는지 확인한다."""
+        threshold = self._config.rag.stream_threshold_bytes
+        if threshold <= 0:
+            return False
+        try:
+            return file_path.stat().st_size > threshold
+        except OSError:
+            return False
+
+    def _chunk_content(self, file_path: Path) -> list[CodeChunk]:
+        """언어별 전략으로 파일을 구조/라인 단위 청크로 나눈다."""
         try:
             content = file_path.read_text(encoding="utf-8", errors="replace")
         except (OSError, UnicodeDecodeError) as e:
@@ -87,30 +145,36 @@ class CodeChunker:
         language = EXTENSION_TO_LANGUAGE.get(file_path.suffix, "text")
         rel_path = str(file_path)
 
+        # 라인 분할 + 오프셋 테이블은 파일당 한 번만 만든다
+        index = LineIndex(content)
+
         # 문서 파일은 전체를 하나의 청크로
         if language in ("markdown", "json", "yaml", "html", "css"):
-            return self._chunk_as_document(rel_path, content, language)
+            return self._chunk_as_document(rel_path, index, language)
 
-        # 코드 파일은 구조적 청킹 시도
-        chunks = self._chunk_by_structure(rel_path, content, language)
+        # 코드 파일은 구조적 청킹 시도 (Python은 AST 우선, 구문 오류 시 정규식)
+        chunks: list[CodeChunk] | None = None
+        if language == "python":
+            chunks = self._python_chunker.chunk(rel_path, index)
+        if chunks is None:
+            chunks = self._chunk_by_structure(rel_path, index, language)
 
         # 구조적 청킹 결과가 없으면 블록 청킹으로 폴백
         if not chunks:
-            chunks = self._chunk_by_lines(rel_path, content, language)
+            chunks = self._chunk_by_lines(rel_path, index, language)
 
         return chunks
 
     def _chunk_as_document(
-        self, file_path: str, content: str, language: str
+        self, file_path: str, index: LineIndex, language: str
     ) -> list[CodeChunk]:
         """파일 전체를 하나의 문서 청크로 생성한다."""
-        lines = content.split("\n")
         return [
             CodeChunk(
                 file_path=file_path,
-                content=content[:3000],  # 문서는 3000자 제한
+                content=index.content[:3000],  # 문서는 3000자 제한
                 start_line=1,
-                end_line=len(lines),
+                end_line=len(index),
                 chunk_type=ChunkType.DOCUMENT,
                 language=language,
                 name=Path(file_path).name,
@@ -118,14 +182,14 @@ class CodeChunker:
         ]
 
     def _chunk_by_structure(
-        self, file_path: str, content: str, language: str
+        self, file_path: str, index: LineIndex, language: str
     ) -> list[CodeChunk]:
         """함수/클래스 단위로 구조적 청킹을 수행한다."""
         patterns = PATTERNS.get(language)
         if not patterns:
             return []
 
-        lines = content.split("\n")
+        content = index.content
         chunks: list[CodeChunk] = []
         boundaries: list[tuple[int, str, ChunkType]] = []
 
@@ -135,7 +199,7 @@ class CodeChunker:
                 ChunkType.FUNCTION if chunk_type_str == "function" else ChunkType.CLASS
             )
             for match in pattern.finditer(content):
-                line_num = content[:match.start()].count("\n") + 1
+                line_num = index.line_of(match.start())
                 # 매칭된 그룹에서 이름 추출
                 name = next((g for g in match.groups() if g), "anonymous")
                 boundaries.append((line_num, name, chunk_type))
@@ -151,9 +215,9 @@ class CodeChunker:
             if i + 1 < len(boundaries):
                 end_line = boundaries[i + 1][0] - 1
             else:
-                end_line = len(lines)
+                end_line = len(index)
 
-            chunk_content = "\n".join(lines[start_line - 1 : end_line])
+            chunk_content = index.slice(start_line, end_line)
 
             if chunk_content.strip():
                 chunks.append(
@@ -171,10 +235,10 @@ class CodeChunker:
         return chunks
 
     def _chunk_by_lines(
-        self, file_path: str, content: str, language: str
+        self, file_path: str, index: LineIndex, language: str
     ) -> list[CodeChunk]:
         """고정 라인 수 기반 블록 청킹 (폴백 전략)."""
-        lines = content.split("\n")
+        lines = index.lines
         max_lines = self._config.rag.chunk_max_lines
         overlap = self._config.rag.chunk_overlap_lines
         chunks: list[CodeChunk] = []
@@ -182,7 +246,7 @@ class CodeChunker:
         start = 0
         while start < len(lines):
             end = min(start + max_lines, len(lines))
-            chunk_content = "\n".join(lines[start:end])
+            chunk_content = index.slice(start + 1, end)
 
             if chunk_content.strip():
                 chunks.append(
@@ -199,3 +263,95 @@ class CodeChunker:
             start = end - overlap if end < len(lines) else len(lines)
 
         return chunks
+
+    def _stream_chunks(
+        self, file_path: Path, stats: TokenFitStats
+    ) -> Iterator[CodeChunk]:
+        """라인 이터레이터로 파일을 읽으며 블록 청크를 생성한다.
+
+        함수/클래스 패턴이 있는 언어는 정의 시작 라인에서 새 청크를 시작하고,
+        그 외에는 chunk_max_lines 단위로 overlap을 두고 자른다.
+        """
+        language = EXTENSION_TO_LANGUAGE.get(file_path.suffix, "text")
+        patterns = PATTERNS.get(language, {})
+        max_lines = self._config.rag.chunk_max_lines
+        overlap = min(self._config.rag.chunk_overlap_lines, max_lines - 1)
+        rel_path = str(file_path)
+
+        window: list[str] = []
+        start_line = 1
+        name = ""
+        chunk_type = ChunkType.BLOCK
+
+        def emit() -> Iterator[CodeChunk]:
+            content = "\n".join(window)
+            if content.strip():
+                yield CodeChunk(
+                    file_path=rel_path,
+                    content=content,
+                    start_line=start_line,
+                    end_line=start_line + len(window) - 1,
+                    chunk_type=chunk_type,
+                    language=language,
+                    name=name,
+                )
+
+        for line_no, line in self._iter_lines(file_path, stats):
+            boundary = self._match_boundary(patterns, line)
+            if window and (boundary is not None or len(window) >= max_lines):
+                yield from emit()
+                if boundary is None:
+                    # 같은 정의의 이어지는 블록: 겹침 라인 유지
+                    window = window[len(window) - overlap :] if overlap else []
+                    chunk_type = ChunkType.BLOCK
+                else:
+                    window = []
+                start_line = line_no - len(window)
+            if boundary is not None:
+                chunk_type, name = boundary
+            window.append(line)
+
+        if window:
+            yield from emit()
+
+    @staticmethod
+    def _match_boundary(
+        patterns: dict[str, re.Pattern], line: str
+    ) -> tuple[ChunkType, str] | None:
+        """라인이 함수/클래스 정의 시작이면 (유형, 이름)을 반환한다."""
+        for chunk_type_str, pattern in patterns.items():
+            match = pattern.match(line)
+            if match:
+                chunk_type = (
+                    ChunkType.FUNCTION if chunk_type_str == "function" else ChunkType.CLASS
+                )
+                # 마지막 그룹이 이름 (앞 그룹은 async 등 수식어)
+                name = next((g for g in reversed(match.groups()) if g), "anonymous")
+                return chunk_type, name
+        return None
+
+    @staticmethod
+    def _iter_lines(
+        file_path: Path, stats: TokenFitStats
+    ) -> Iterator[tuple[int, str]]:
+        """(라인 번호, 내용)을 순차 반환한다. 너무 긴 라인은 잘라낸다."""
+        try:
+            f = file_path.open(encoding="utf-8", errors="replace")
+        except OSError as e:
+            logger.warning(f"파일 읽기 실패: {file_path} - {e}")
+            return
+
+        with f:
+            line_no = 0
+            while True:
+                line = f.readline(MAX_STREAM_LINE_CHARS)
+                if not line:
+                    break
+                line_no += 1
+                if len(line) == MAX_STREAM_LINE_CHARS and not line.endswith("\n"):
+                    # 남은 부분은 읽고 버린다 (압축된 번들 JS 등)
+                    stats.truncated_lines += 1
+                    rest = f.readline(MAX_STREAM_LINE_CHARS)
+                    while rest and not rest.endswith("\n"):
+                        rest = f.readline(MAX_STREAM_LINE_CHARS)
+                yield line_no, line.rstrip("\n")
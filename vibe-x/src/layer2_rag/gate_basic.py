@@ -9,11 +9,19 @@ import re
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.file_context import FileAnalysisContext
+from src.shared.literal_matcher import LiteralMatcher
 from src.shared.logger import get_logger
 from src.shared.types import GateResult, GateStatus
 
 logger = get_logger("gate")
 
+# 코드 파일 규칙 (파일 전체를 한 번 스캔, 한 라인 안에서만 매치)
+CODE_RULES = re.compile(
+    r"(?P<magic>[=<>][^\S\n]*\d{3,})"  # 매직 넘버 (단독 숫자 사용)
+    r"|(?P<any>: any)"  # any 타입 (TypeScript)
+)
+
 
 class BasicGate:
     """Gate 1 + Gate 2 기본 품질 검증기.
@@ -25,13 +33,19 @@ class BasicGate:
     def __init__(self, config: VibeXConfig | None = None) -> None:
         self._config = config or load_config()
 
-    def run_gate1(self, file_path: Path) -> GateResult:
-        """Gate 1: Syntax Agent - 기본 문법/구조 검사."""
+    def run_gate1(
+        self, file_path: Path, context: FileAnalysisContext | None = None
+    ) -> GateResult:
+        """Gate 1: Syntax Agent - 기본 문법/구조 검사.
+
+        context를 주면 파일을 다시 읽지 않고 공유된 내용을 사용한다.
+        """
         issues: list[str] = []
+        context = context or FileAnalysisContext.from_path(file_path)
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+        if context.read_error is not None:
+            raise context.read_error
+        if context.decode_error is not None:
             return GateResult(
                 gate_number=1,
                 gate_name="Syntax Agent",
@@ -39,7 +53,8 @@ class BasicGate:
                 message=f"인코딩 오류: {file_path}",
             )
 
-        lines = content.split("\n")
+        content = context.content
+        lines = context.lines
 
         # 빈 파일 검사
         if not content.strip():
@@ -72,13 +87,14 @@ class BasicGate:
             details=issues,
         )
 
-    def run_gate2(self, file_path: Path) -> GateResult:
+    def run_gate2(
+        self, file_path: Path, context: FileAnalysisContext | None = None
+    ) -> GateResult:
         """Gate 2: Rules Agent - 팀 코딩 규칙 준수 검사."""
         issues: list[str] = []
+        context = context or FileAnalysisContext.from_path(file_path)
 
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
+        if context.read_error is not None or context.decode_error is not None:
             return GateResult(
                 gate_number=2,
                 gate_name="Rules Agent",
@@ -86,21 +102,17 @@ class BasicGate:
                 message=f"파일 읽기 불가: {file_path}",
             )
 
-        lines = content.split("\n")
         suffix = file_path.suffix
 
         # 금지 패턴 검사
-        for pattern in self._config.gate.forbidden_patterns:
-            for i, line in enumerate(lines, 1):
-                if pattern in line:
-                    issues.append(f"L{i}: 금지 패턴 '{pattern}' 발견")
+        issues.extend(self._check_forbidden_patterns(context))
 
         # Python/TypeScript 전용 검사
         if suffix in (".py", ".ts", ".tsx", ".js", ".jsx"):
-            issues.extend(self._check_code_rules(lines, suffix))
+            issues.extend(self._check_code_rules(context, suffix))
 
         # 함수 길이 검사
-        issues.extend(self._check_function_length(lines, suffix))
+        issues.extend(self._check_function_length(context))
 
         if not issues:
             status = GateStatus.PASSED
@@ -120,50 +132,54 @@ class BasicGate:
             details=issues,
         )
 
-    def run_all(self, file_path: Path) -> list[GateResult]:
-        """Gate 1 + Gate 2를 순차 실행한다."""
-        return [self.run_gate1(file_path), self.run_gate2(file_path)]
-
-    def _check_code_rules(self, lines: list[str], suffix: str) -> list[str]:
+    def run_all(
+        self, file_path: Path, context: FileAnalysisContext | None = None
+    ) -> list[GateResult]:
+        """Gate 1 + Gate 2를 순차 실행한다 (파일은 한 번만 읽는다)."""
+        context = context or FileAnalysisContext.from_path(file_path)
+        return [self.run_gate1(file_path, context), self.run_gate2(file_path, context)]
+
+    def _check_forbidden_patterns(self, context: FileAnalysisContext) -> list[str]:
+        """금지 패턴을 결합 정규식 한 번의 스캔으로 찾는다 (패턴 순 → 라인 순 보고)."""
+        patterns = tuple(self._config.gate.forbidden_patterns)
+        index = context.line_index
+        hits = {
+            (pattern_index, index.line_of(pos))
+            for pos, pattern_index in LiteralMatcher.compile(patterns).finditer(context.content)
+        }
+        return [f"L{line}: 금지 패턴 '{patterns[p]}' 발견" for p, line in sorted(hits)]
+
+    def _check_code_rules(self, context: FileAnalysisContext, suffix: str) -> list[str]:
         """코드 파일 전용 규칙을 검사한다."""
-        issues: list[str] = []
+        index = context.line_index
+        lines = context.lines
+        magic_lines: set[int] = set()
+        any_lines: set[int] = set()
+
+        for match in CODE_RULES.finditer(context.content):
+            line_num = index.line_of(match.start())
+            if match.lastgroup == "magic":
+                if "port" not in lines[line_num - 1].lower():
+                    magic_lines.add(line_num)
+            elif suffix in (".ts", ".tsx"):
+                any_lines.add(line_num)
 
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            # 매직 넘버 검사 (단독 숫자 사용)
-            if re.search(r"[=<>]\s*\d{3,}", stripped) and "port" not in stripped.lower():
+        issues: list[str] = []
+        for i in sorted(magic_lines | any_lines):
+            if i in magic_lines:
                 issues.append(f"L{i}: 매직 넘버 의심 - 상수로 추출 권장")
-
-            # any 타입 검사 (TypeScript)
-            if suffix in (".ts", ".tsx") and ": any" in stripped:
+            if i in any_lines:
                 issues.append(f"L{i}: 'any' 타입 사용 - 구체적 타입 또는 'unknown' 사용")
-
         return issues
 
-    def _check_function_length(self, lines: list[str], suffix: str) -> list[str]:
-        """함수 길이 제한을 검사한다."""
-        issues: list[str] = []
+    def _check_function_length(self, context: FileAnalysisContext) -> list[str]:
+        """함수 길이 제한을 검사한다 (def 라인 ~ end_lineno, 중첩 함수 포함)."""
         max_lines = self._config.gate.max_function_lines
-
-        # Python 함수 길이 검사
-        if suffix == ".py":
-            func_start: int | None = None
-            func_name = ""
-            indent_level = 0
-
-            for i, line in enumerate(lines):
-                match = re.match(r"^(\s*)(async\s+)?def\s+(\w+)", line)
-                if match:
-                    if func_start is not None:
-                        length = i - func_start
-                        if length > max_lines:
-                            issues.append(
-                                f"L{func_start + 1}: '{func_name}' 함수 "
-                                f"{length}줄 (최대 {max_lines}줄)"
-                            )
-                    func_start = i
-                    func_name = match.group(3)
-                    indent_level = len(match.group(1))
-
+        issues: list[str] = []
+        for span in context.function_spans:
+            length = span.end - span.lineno + 1
+            if length > max_lines:
+                issues.append(
+                    f"L{span.lineno}: '{span.qualname}' 함수 {length}줄 (최대 {max_lines}줄)"
+                )
         return issues
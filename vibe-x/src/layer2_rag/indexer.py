@@ -2,19 +2,84 @@
 
 프로젝트 전체를 스캔하여 벡터 DB에 인덱싱한다.
 증분 인덱싱을 지원하여 변경된 파일만 재처리한다.
+파일별 크기/mtime/해시는 매니페스트(.index-manifest.db)에 기록된다.
 """
 
+import functools
+import os
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.file_walker import walk_files
 from src.shared.logger import get_logger
-from src.shared.types import IndexStats
-from src.layer2_rag.vector_db import VectorStore
+from src.shared.progress import ProgressCallback, ProgressTracker
+from src.shared.types import CodeChunk, IndexStats
+from src.layer2_rag.vector_db import BulkWriter, VectorStore, unique_chunks
 from src.layer2_rag.chunker import CodeChunker
+from src.layer2_rag.manifest import FileManifest, hash_file
+from src.layer2_rag.token_budget import TokenFitStats
 
 logger = get_logger("indexer")
 
+# 이보다 적은 파일은 프로세스 풀 기동 비용이 더 커서 단일 프로세스로 처리
+PARALLEL_MIN_FILES = 64
+POOL_CHUNKSIZE = 16
+
+
+@dataclass
+class ChunkOutcome:
+    """워커 프로세스의 파일 단위 청킹 결과."""
+    file_path: Path
+    content_hash: str = ""
+    chunks: list[CodeChunk] = field(default_factory=list)
+    seconds: float = 0.0
+    split_chunks: int = 0
+    truncated_chunks: int = 0
+    truncated_lines: int = 0
+    error: str | None = None
+
+
+def chunk_one(chunker: CodeChunker, file_path: Path) -> ChunkOutcome:
+    """파일 하나를 해시 + 청킹한다. 예외는 결과에 담아 반환한다."""
+    start = time.perf_counter()
+    token_stats = TokenFitStats()
+    try:
+        content_hash = hash_file(file_path)
+        # 통계와 매니페스트가 실제로 저장되는 청크와 일치하도록 중복 ID를 먼저 제거
+        chunks = unique_chunks(chunker.chunk_file(file_path, token_stats))
+    except Exception as e:
+        return ChunkOutcome(file_path=file_path, error=str(e))
+    return ChunkOutcome(
+        file_path=file_path,
+        content_hash=content_hash,
+        chunks=chunks,
+        seconds=time.perf_counter() - start,
+        split_chunks=token_stats.split_chunks,
+        truncated_chunks=token_stats.truncated_chunks,
+        truncated_lines=token_stats.truncated_lines,
+    )
+
+
+_worker_chunker: CodeChunker | None = None
+
+
+def _init_worker(config: VibeXConfig) -> None:
+    """워커 프로세스마다 청커를 한 번만 생성한다."""
+    global _worker_chunker
+    _worker_chunker = CodeChunker(config)
+
+
+def _chunk_in_worker(file_path: Path) -> ChunkOutcome:
+    """프로세스 풀 워커 진입점."""
+    assert _worker_chunker is not None
+    return chunk_one(_worker_chunker, file_path)
+
 
 class CodebaseIndexer:
     """코드베이스를 벡터 DB에 인덱싱하는 엔진.
@@ -22,94 +87,348 @@ class CodebaseIndexer:
     기능:
     - 전체 인덱싱: 프로젝트 내 모든 지원 파일을 인덱싱
     - 증분 인덱싱: 변경된 파일만 재인덱싱
+    - 병렬 청킹: 프로세스 풀이 청킹, 단일 writer가 벡터 DB에 저장
+    - 스트리밍 청킹: 대용량 파일은 청크를 순차 생성하여 바로 저장
     - 파일 필터링: 지원 확장자 + 무시 디렉토리 적용
     """
 
-    def __init__(self, config: VibeXConfig | None = None) -> None:
+    def __init__(
+        self, config: VibeXConfig | None = None, store: VectorStore | None = None
+    ) -> None:
         self._config = config or load_config()
-        self._store = VectorStore(self._config)
+        self._store = store or VectorStore(self._config)
         self._chunker = CodeChunker(self._config)
+        self._manifest = FileManifest(self._config)
 
-    def index_project(self, project_path: Path | None = None) -> IndexStats:
+    def index_project(
+        self,
+        project_path: Path | None = None,
+        full: bool = False,
+        progress: ProgressCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> IndexStats:
         """프로젝트 전체를 인덱싱한다.
 
+        매니페스트와 비교하여 추가/변경된 파일만 재청킹하고,
+        디스크에서 사라진 파일의 청크는 벡터 DB에서 제거한다.
+
         Args:
             project_path: 프로젝트 루트 경로 (None이면 현재 디렉토리)
+            full: True면 매니페스트를 무시하고 전체 재인덱싱
+            progress: 진행 상황 콜백 (처리 파일 수, 저장 청크 수, ETA)
+            cancel: 설정되면 파일 경계에서 멈춘다. 이미 저장한 파일은 매니페스트에
+                기록되어 다음 실행에서 이어서 처리된다.
 
         Returns:
             인덱싱 통계
         """
-        root = project_path or self._config.paths.project_root
+        root = (project_path or self._config.paths.project_root).resolve()
         start_time = time.time()
         stats = IndexStats()
+        tracker = ProgressTracker(progress)
 
         logger.info(f"인덱싱 시작: [bold]{root}[/bold]")
 
+        # 컬렉션 또는 키워드 색인이 초기화된 경우 매니페스트도 무효.
+        # 비우기 전 경로는 남겨 두었다가 디스크에서 사라진 파일의 청크를 지운다
+        forgotten: set[str] = set()
+        if full or (len(self._manifest) and self._needs_rebuild()):
+            forgotten = self._manifest.paths_under(root)
+            self._manifest.clear()
+
         # 대상 파일 수집
+        stage_start = time.perf_counter()
         files = self._collect_files(root)
         stats.total_files = len(files)
+        stats.stage_seconds["collect"] = round(time.perf_counter() - stage_start, 3)
         logger.info(f"대상 파일: {stats.total_files}개")
+        tracker.emit("collect")
 
-        # 파일별 청킹 + 저장
+        # 변경 여부 판정 (stat 비교라 메인 프로세스에서 처리)
+        stage_start = time.perf_counter()
+        changed: list[tuple[Path, os.stat_result]] = []
         for file_path in files:
             try:
-                chunks = self._chunker.chunk_file(file_path)
-                if chunks:
-                    # 증분 인덱싱: 기존 청크 삭제 후 재저장
-                    self._store.delete_by_file(str(file_path))
-                    self._store.add_chunks(chunks)
+                stat = file_path.stat()
+            except OSError as e:
+                stats.errors.append(f"{file_path}: {e}")
+                continue
+            if self._manifest.is_unchanged(file_path, stat):
+                stats.unchanged_files += 1
+            else:
+                changed.append((file_path, stat))
+        stats.stage_seconds["diff"] = round(time.perf_counter() - stage_start, 3)
+
+        # 대용량 파일은 워커로 청크 목록을 넘기지 않고 메인 프로세스에서 스트리밍 처리
+        streamed = [(p, st) for p, st in changed if self._chunker.should_stream(p)]
+        if streamed:
+            streamed_paths = {p for p, _ in streamed}
+            changed = [(p, st) for p, st in changed if p not in streamed_paths]
+        tracker.total = len(changed) + len(streamed)
+        tracker.emit("diff")
+
+        # 생산자: 프로세스 풀이 청킹 / 소비자: 단일 writer가 벡터 DB에 일괄 저장
+        # (이전 청크 삭제와 매니페스트 기록은 배치 저장 성공 후 → 실패 시 다음 실행에서 재처리됨)
+        stat_by_path = dict(changed)
+        chunk_seconds = 0.0
+        write_seconds = 0.0
+        stage_start = time.perf_counter()
+        with self._store.bulk_writer() as writer, closing(
+            self._chunk_files([p for p, _ in changed], stats)
+        ) as outcomes:
+            for outcome in outcomes:
+                if cancel is not None and cancel.is_set():
+                    stats.cancelled = True
+                    break
+                chunk_seconds += outcome.seconds
+                if outcome.error is not None:
+                    error_msg = f"{outcome.file_path}: {outcome.error}"
+                    stats.errors.append(error_msg)
+                    logger.warning(f"인덱싱 실패 - {error_msg}")
+                    tracker.advance("chunk")
+                    continue
+
+                write_start = time.perf_counter()
+                writer.add(
+                    outcome.chunks,
+                    on_stored=functools.partial(
+                        self._commit_file,
+                        outcome.file_path,
+                        stat_by_path[outcome.file_path],
+                        outcome.content_hash,
+                        self._previous_ids(outcome.file_path),
+                        [c.chunk_id for c in outcome.chunks],
+                    ),
+                )
+                stats.split_chunks += outcome.split_chunks
+                stats.truncated_chunks += outcome.truncated_chunks
+                stats.truncated_lines += outcome.truncated_lines
+                if outcome.chunks:
                     stats.indexed_files += 1
-                    stats.total_chunks += len(chunks)
+                    stats.total_chunks += len(outcome.chunks)
                 else:
                     stats.skipped_files += 1
+                write_seconds += time.perf_counter() - write_start
+                tracker.advance("chunk", len(outcome.chunks))
+
+            stream_start = time.perf_counter()
+            for file_path, stat in streamed:
+                if cancel is not None and cancel.is_set():
+                    stats.cancelled = True
+                    break
+                tracker.advance("stream", self._index_streamed(file_path, stat, writer, stats))
+            if streamed:
+                stats.stage_seconds["stream"] = round(time.perf_counter() - stream_start, 3)
+
+            # 블록 종료 시 마지막 flush 시간도 write 단계에 포함
+            write_start = time.perf_counter()
+        write_seconds += time.perf_counter() - write_start
+        stats.stage_seconds["chunk_cpu"] = round(chunk_seconds, 3)
+        stats.stage_seconds["write"] = round(write_seconds, 3)
+        stats.stage_seconds["pipeline"] = round(time.perf_counter() - stage_start, 3)
+
+        # 삭제된 파일의 청크 제거 (취소 시 다음 실행으로 미룸, 단 비운 매니페스트에만
+        # 있던 경로는 다음 실행에서 알 수 없으므로 지금 지운다)
+        stage_start = time.perf_counter()
+        current = {str(f) for f in files}
+        stale_paths = forgotten - current
+        if not stats.cancelled:
+            stale_paths |= self._manifest.paths_under(root) - current
+        for stale_path in sorted(stale_paths):
+            try:
+                self._purge_file(stale_path)
+                stats.deleted_files += 1
             except Exception as e:
-                error_msg = f"{file_path}: {e}"
-                stats.errors.append(error_msg)
-                logger.warning(f"인덱싱 실패 - {error_msg}")
+                stats.errors.append(f"{stale_path}: {e}")
+                logger.warning(f"청크 삭제 실패 - {stale_path}: {e}")
+        stats.stage_seconds["purge"] = round(time.perf_counter() - stage_start, 3)
+
+        self._manifest.save()
 
         stats.duration_seconds = round(time.time() - start_time, 2)
+        tracker.emit("cancelled" if stats.cancelled else "done")
         self._log_stats(stats)
         return stats
 
     def index_file(self, file_path: Path) -> int:
-        """단일 파일을 인덱싱한다 (Git Hook 연동용).
+        """단일 파일을 인덱싱한다 (Git Hook / watch 데몬 연동용).
+
+        파일이 없으면 청크를 제거하고, 매니페스트 기준 변경이 없으면 다시 청킹하지 않는다.
 
         Args:
             file_path: 인덱싱할 파일 경로
 
         Returns:
-            생성된 청크 수
+            파일의 청크 수 (변경 없음이면 기존 청크 수)
         """
-        if not self._is_supported(file_path):
+        file_path = file_path.resolve()
+        if not self.is_supported(file_path):
             return 0
 
-        chunks = self._chunker.chunk_file(file_path)
-        if not chunks:
+        if not file_path.exists():
+            self._purge_file(str(file_path))
+            self._manifest.save()
             return 0
 
-        self._store.delete_by_file(str(file_path))
+        stat = file_path.stat()
+        if self._manifest.is_unchanged(file_path, stat):
+            self._manifest.save()
+            entry = self._manifest.get(str(file_path))
+            return len(entry.chunk_ids) if entry else 0
+
+        if self._chunker.should_stream(file_path):
+            stats = IndexStats()
+            with self._store.bulk_writer() as writer:
+                count = self._index_streamed(file_path, stat, writer, stats)
+            if stats.errors:
+                raise RuntimeError(stats.errors[0])
+            self._manifest.save()
+            return count
+
+        content_hash = hash_file(file_path)
+        chunks = unique_chunks(self._chunker.chunk_file(file_path))
+        previous_ids = self._previous_ids(file_path)
         self._store.add_chunks(chunks)
-        logger.info(f"파일 인덱싱: {file_path} → {len(chunks)}개 청크")
+        self._commit_file(
+            file_path, stat, content_hash, previous_ids, [c.chunk_id for c in chunks]
+        )
+        self._manifest.save()
+
+        if chunks:
+            logger.info(f"파일 인덱싱: {file_path} → {len(chunks)}개 청크")
         return len(chunks)
 
-    def _collect_files(self, root: Path) -> list[Path]:
-        """인덱싱 대상 파일을 수집한다."""
-        files: list[Path] = []
-        ignored = set(self._config.rag.ignored_dirs)
-        supported = set(self._config.rag.supported_extensions)
+    def _index_streamed(
+        self, file_path: Path, stat: os.stat_result, writer: BulkWriter, stats: IndexStats
+    ) -> int:
+        """대용량 파일을 스트리밍 청킹하여 writer에 바로 흘려보낸다.
 
-        for item in root.rglob("*"):
-            # 무시 디렉토리 필터링
-            if any(part in ignored for part in item.parts):
-                continue
+        청크 목록 전체를 메모리에 두지 않으며, 배치 단위로 저장된다.
+        """
+        token_stats = TokenFitStats()
+        # 중복 ID는 나중 청크가 덮어쓰므로 한 번만 센다
+        chunk_ids: dict[str, None] = {}
+        streamed = 0
+        try:
+            content_hash = hash_file(file_path)
+            previous_ids = self._previous_ids(file_path)
+            for chunk in self._chunker.iter_chunks(file_path, token_stats):
+                writer.add([chunk])
+                chunk_ids[chunk.chunk_id] = None
+                streamed += 1
+        except Exception as e:
+            error_msg = f"{file_path}: {e}"
+            stats.errors.append(error_msg)
+            logger.warning(f"인덱싱 실패 - {error_msg}")
+            return 0
+
+        if streamed > len(chunk_ids):
+            logger.warning(f"중복 chunk_id {streamed - len(chunk_ids)}개 제거: {file_path}")
+
+        # 마지막 청크까지 저장된 뒤 이전 청크 삭제 + 매니페스트 기록
+        writer.add([], on_stored=functools.partial(
+            self._commit_file, file_path, stat, content_hash, previous_ids, list(chunk_ids)
+        ))
+        stats.streamed_files += 1
+        stats.split_chunks += token_stats.split_chunks
+        stats.truncated_chunks += token_stats.truncated_chunks
+        stats.truncated_lines += token_stats.truncated_lines
+        if chunk_ids:
+            stats.indexed_files += 1
+            stats.total_chunks += len(chunk_ids)
+        else:
+            stats.skipped_files += 1
+        logger.info(f"스트리밍 인덱싱: {file_path} → {len(chunk_ids)}개 청크")
+        return len(chunk_ids)
+
+    def _chunk_files(
+        self, files: list[Path], stats: IndexStats
+    ) -> Iterator[ChunkOutcome]:
+        """파일을 청킹하여 결과를 순서대로 내보낸다.
+
+        파일 수가 충분하면 프로세스 풀에서 병렬 처리하고,
+        그렇지 않으면 현재 프로세스에서 순차 처리한다.
+        """
+        workers = self._worker_count()
+        if workers <= 1 or len(files) < PARALLEL_MIN_FILES:
+            stats.workers = 1
+            for file_path in files:
+                yield chunk_one(self._chunker, file_path)
+            return
+
+        stats.workers = workers
+        logger.info(f"병렬 청킹: 워커 {workers}개")
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._config,),
+        )
+        try:
+            yield from pool.map(_chunk_in_worker, files, chunksize=POOL_CHUNKSIZE)
+        finally:
+            # 소비자가 중간에 멈추면(취소) 아직 시작하지 않은 청킹 작업을 버린다
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _needs_rebuild(self) -> bool:
+        """저장소가 비어 있어 매니페스트를 신뢰할 수 없는지 확인한다."""
+        return self._store.count() == 0 or self._store.keyword_count() == 0
+
+    def _worker_count(self) -> int:
+        """설정된 청킹 워커 수를 반환한다 (0이면 CPU 코어 수)."""
+        configured = self._config.rag.index_workers
+        if configured > 0:
+            return configured
+        return os.cpu_count() or 1
+
+    def _previous_ids(self, file_path: Path) -> list[str]:
+        """파일의 기존 청크 ID (새 청크 저장 후 지울 대상).
 
-            # 파일만, 지원 확장자만
-            if item.is_file() and item.suffix in supported:
-                files.append(item)
+        매니페스트에 없으면(첫 인덱싱, 전체 재인덱싱, 매니페스트 이전 청크) 파일 기준으로 바로 지운다.
+        이 경우 기록된 것이 없으므로 저장이 실패해도 다음 실행에서 다시 처리된다.
+        """
+        previous = self._manifest.get(str(file_path))
+        if previous is None:
+            self._store.delete_by_file(str(file_path))
+            return []
+        return previous.chunk_ids
+
+    def _commit_file(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        content_hash: str,
+        previous_ids: list[str],
+        chunk_ids: list[str],
+    ) -> None:
+        """새 청크가 저장된 파일의 남은 이전 청크를 지우고 매니페스트에 기록한다."""
+        current = set(chunk_ids)
+        self._store.delete_by_ids([c for c in previous_ids if c not in current])
+        self._manifest.record(file_path, stat, content_hash, chunk_ids)
+
+    def _purge_file(self, file_path: str) -> None:
+        """삭제된 파일의 청크와 매니페스트 항목을 제거한다."""
+        entry = self._manifest.remove(file_path)
+        if entry is not None and entry.chunk_ids:
+            self._store.delete_by_ids(entry.chunk_ids)
+        elif entry is None:
+            self._store.delete_by_file(file_path)
+
+    def _collect_files(self, root: Path) -> list[Path]:
+        """인덱싱 대상 파일을 수집한다 (무시 디렉토리는 내려가기 전에 가지치기)."""
+        rag = self._config.rag
+        return walk_files(
+            root,
+            extensions=rag.supported_extensions,
+            ignored_dirs=rag.ignored_dirs,
+            use_gitignore=rag.respect_gitignore,
+            use_git=rag.use_git_ls_files,
+        )
 
-        return sorted(files)
+    def indexed_paths_under(self, root: Path) -> set[str]:
+        """root 하위에서 인덱싱된 파일 경로 목록 (디렉토리 삭제/이동 반영용)."""
+        return self._manifest.paths_under(root.resolve())
 
-    def _is_supported(self, file_path: Path) -> bool:
+    def is_supported(self, file_path: Path) -> bool:
         """파일이 인덱싱 대상인지 확인한다."""
         ignored = set(self._config.rag.ignored_dirs)
         if any(part in ignored for part in file_path.parts):
@@ -122,7 +441,18 @@ class CodebaseIndexer:
             f"인덱싱 완료 - "
             f"파일: {stats.indexed_files}/{stats.total_files}, "
             f"청크: {stats.total_chunks}, "
+            f"변경 없음: {stats.unchanged_files}, "
+            f"삭제: {stats.deleted_files}, "
+            f"스트리밍: {stats.streamed_files}, "
+            f"분할: {stats.split_chunks}, "
+            f"절단: {stats.truncated_chunks}, "
+            f"긴 라인 절단: {stats.truncated_lines}, "
             f"스킵: {stats.skipped_files}, "
+            f"{'취소됨, ' if stats.cancelled else ''}"
             f"에러: {len(stats.errors)}, "
+            f"워커: {stats.workers}, "
             f"소요: {stats.duration_seconds}s"
         )
+        if stats.stage_seconds:
+            stages = ", ".join(f"{k}={v}s" for k, v in stats.stage_seconds.items())
+            logger.info(f"단계별 소요 - {stages}")
@@ -0,0 +1,272 @@
+"""Task 2.6 - BM25 키워드 역색인.
+
+벡터 검색은 `_detect_overlap`, `MAX_GATE_HISTORY` 같은 정확한 식별자 질의에 약하다.
+이 모듈은 벡터 컬렉션과 같은 청크를 SQLite FTS5 역색인에 함께 저장하고
+BM25로 순위를 매긴다. 임베딩 모델을 전혀 사용하지 않아 밀리초 단위로 응답한다.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.logger import get_logger
+from src.shared.types import CodeChunk, SearchResult
+from src.layer2_rag.path_filter import relative_path
+
+logger = get_logger("keyword-index")
+
+# BM25 컬럼 가중치: 청크 이름(함수/클래스명)에 매칭되면 본문보다 크게 가산
+NAME_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+MIN_TERM_LENGTH = 2
+
+# 스키마 변경 시 증가. 불일치하면 색인을 다시 만든다 (인덱서가 전체 재인덱싱)
+SCHEMA_VERSION = 2
+
+_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|[0-9]+|[가-힣]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS docs (
+        rowid INTEGER PRIMARY KEY,
+        chunk_id TEXT NOT NULL UNIQUE,
+        file_path TEXT NOT NULL,
+        rel_path TEXT NOT NULL,
+        language TEXT NOT NULL,
+        content TEXT NOT NULL,
+        metadata TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS docs_file_path ON docs(file_path)",
+    "CREATE INDEX IF NOT EXISTS docs_rel_path ON docs(rel_path)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+        name_terms, terms, tokenize = "unicode61 tokenchars '_'"
+    )
+    """,
+)
+
+
+def tokenize_code(text: str) -> Iterator[str]:
+    """코드 텍스트를 검색어로 분해한다.
+
+    식별자 전체(`_detect_overlap`)와 구성 단어(`detect`, `overlap`)를 함께 내보내
+    정확한 식별자 질의와 단어 단위 질의를 모두 매칭한다. camelCase도 분해한다.
+    """
+    for match in _WORD_RE.finditer(text):
+        word = match.group()
+        lowered = word.lower()
+        if len(lowered.strip("_")) >= MIN_TERM_LENGTH:
+            yield lowered
+        parts = [
+            p.lower() for segment in word.split("_") for p in _CAMEL_RE.findall(segment)
+        ]
+        if len(parts) > 1:
+            yield from (p for p in parts if len(p) >= MIN_TERM_LENGTH)
+
+
+class KeywordIndex:
+    """SQLite FTS5 기반 BM25 역색인.
+
+    docs 테이블에 청크 원문/메타데이터를, docs_fts에 검색어를 같은 rowid로 저장한다.
+    쓰기마다 meta.generation을 증가시켜, 다른 프로세스의 검색 결과 캐시도
+    색인 변경을 감지할 수 있게 한다.
+    """
+
+    def __init__(self, config: VibeXConfig | None = None) -> None:
+        self._config = config or load_config()
+        self._path = self._config.paths.keyword_index_path
+        self._root = self._config.paths.project_root.resolve()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite 연결을 지연 초기화한다."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS docs_fts")
+                conn.execute("DROP TABLE IF EXISTS docs")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def upsert(self, chunks: Iterable[CodeChunk]) -> None:
+        """청크를 색인에 추가한다. 같은 chunk_id는 교체된다."""
+        unique = {chunk.chunk_id: chunk for chunk in chunks}.values()
+        rows = [
+            (
+                chunk.chunk_id,
+                chunk.file_path,
+                relative_path(chunk.file_path, self._root),
+                chunk.language,
+                chunk.content,
+                json.dumps(chunk.to_metadata(), ensure_ascii=False),
+                " ".join(tokenize_code(chunk.name)),
+                " ".join(tokenize_code(chunk.content)),
+            )
+            for chunk in unique
+        ]
+        if not rows:
+            return
+
+        with self._lock, self.conn:
+            self._delete_rows(
+                "SELECT rowid FROM docs WHERE chunk_id = ?", [(r[0],) for r in rows]
+            )
+            for *doc, name_terms, terms in rows:
+                cursor = self.conn.execute(
+                    "INSERT INTO docs "
+                    "(chunk_id, file_path, rel_path, language, content, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    doc,
+                )
+                self.conn.execute(
+                    "INSERT INTO docs_fts (rowid, name_terms, terms) VALUES (?, ?, ?)",
+                    (cursor.lastrowid, name_terms, terms),
+                )
+            self._bump_generation()
+
+    def delete_ids(self, chunk_ids: list[str]) -> None:
+        """청크 ID 목록을 색인에서 제거한다."""
+        if not chunk_ids:
+            return
+        with self._lock, self.conn:
+            self._delete_rows(
+                "SELECT rowid FROM docs WHERE chunk_id = ?", [(c,) for c in chunk_ids]
+            )
+            self._bump_generation()
+
+    def delete_file(self, file_path: str) -> None:
+        """파일의 모든 청크를 색인에서 제거한다."""
+        with self._lock, self.conn:
+            self._delete_rows("SELECT rowid FROM docs WHERE file_path = ?", [(file_path,)])
+            self._bump_generation()
+
+    def _delete_rows(self, select_sql: str, params: list[tuple]) -> None:
+        """조회된 rowid를 docs/docs_fts 양쪽에서 삭제한다. 호출자가 트랜잭션을 연다."""
+        rowids = [
+            (row[0],)
+            for p in params
+            for row in self.conn.execute(select_sql, p)
+        ]
+        if rowids:
+            self.conn.executemany("DELETE FROM docs_fts WHERE rowid = ?", rowids)
+            self.conn.executemany("DELETE FROM docs WHERE rowid = ?", rowids)
+
+    def generation(self) -> int:
+        """색인 변경 세대 번호. 쓰기가 일어날 때마다 증가한다."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'generation'"
+            ).fetchone()
+        return row[0] if row else 0
+
+    def _bump_generation(self) -> None:
+        """세대 번호를 증가시킨다. 호출자가 트랜잭션을 연다."""
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('generation', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+        )
+
+    def search(
+        self,
+        query: str,
+        top_k: int,
+        language: str | None = None,
+        path_prefix: str | None = None,
+        path_contains: str | None = None,
+    ) -> list[SearchResult]:
+        """BM25 점수 순으로 청크를 검색한다. 필터는 SQL 조건으로 함께 적용된다.
+
+        SearchResult.distance에는 BM25 점수를 0~2 범위로 정규화한 값을 넣는다
+        (최상위 결과가 0, 다른 결과는 최상위 대비 점수 비율만큼 멀어짐).
+
+        Args:
+            query: 검색어
+            top_k: 반환할 최대 결과 수
+            language: 언어 일치 필터
+            path_prefix: 프로젝트 루트 기준 상대 경로 접두사 (디렉토리 또는 파일)
+            path_contains: 파일 경로 부분 문자열 필터
+        """
+        terms = list(dict.fromkeys(tokenize_code(query)))
+        if not terms or top_k <= 0:
+            return []
+
+        conditions = ["docs_fts MATCH ?"]
+        params: list = [" OR ".join(f'"{term}"' for term in terms)]
+        if language:
+            conditions.append("d.language = ?")
+            params.append(language)
+        if path_prefix:
+            conditions.append("(d.rel_path = ? OR substr(d.rel_path, 1, ?) = ?)")
+            params.extend([path_prefix, len(path_prefix) + 1, f"{path_prefix}/"])
+        if path_contains:
+            conditions.append("instr(d.file_path, ?) > 0")
+            params.append(path_contains)
+        params.append(top_k)
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"""
+                SELECT d.chunk_id, d.file_path, d.content, d.metadata,
+                       bm25(docs_fts, {NAME_WEIGHT}, {BODY_WEIGHT}) AS score
+                FROM docs_fts JOIN docs d ON d.rowid = docs_fts.rowid
+                WHERE {" AND ".join(conditions)}
+                ORDER BY score
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+
+        if not rows:
+            return []
+
+        # FTS5 bm25()는 음수이며 작을수록 관련성이 높다
+        best = -rows[0][4] or 1.0
+        results: list[SearchResult] = []
+        for chunk_id, file_path, content, metadata_json, score in rows:
+            metadata = json.loads(metadata_json)
+            metadata["bm25"] = round(-score, 4)
+            results.append(
+                SearchResult(
+                    chunk_id=chunk_id,
+                    content=content,
+                    file_path=file_path,
+                    start_line=metadata.get("start_line", 0),
+                    end_line=metadata.get("end_line", 0),
+                    distance=2.0 * (1.0 - min(1.0, -score / best)),
+                    metadata=metadata,
+                )
+            )
+        return results
+
+    def count(self) -> int:
+        """색인된 청크 수를 반환한다."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def clear(self) -> None:
+        """색인을 비운다."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM docs_fts")
+            self.conn.execute("DELETE FROM docs")
+            self._bump_generation()
+
+    def close(self) -> None:
+        """SQLite 연결을 닫는다."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
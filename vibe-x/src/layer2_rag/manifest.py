@@ -0,0 +1,207 @@
+"""Task 2.3 - 증분 인덱싱용 파일 매니페스트.
+
+인덱싱된 파일의 크기/수정 시각/콘텐츠 해시/청크 ID를 디스크에 기록한다.
+재인덱싱 시 추가·변경·삭제된 파일만 골라내는 기준이 된다.
+대시보드, watch 데몬, CLI가 같은 매니페스트를 함께 쓰므로 SQLite에 파일 단위 행으로 저장하고,
+저장할 때는 이 프로세스가 바꾼 행만 반영한다 (다른 프로세스의 기록을 덮어쓰지 않는다).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.logger import get_logger
+
+logger = get_logger("manifest")
+
+# 스키마 변경 시 증가. 불일치하면 비운다 (인덱서가 전체 재인덱싱)
+MANIFEST_VERSION = 2
+HASH_READ_BLOCK_BYTES = 1024 * 1024
+
+
+@dataclass
+class ManifestEntry:
+    """매니페스트에 기록되는 파일 단위 인덱싱 상태."""
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    chunk_ids: list[str] = field(default_factory=list)
+
+    def to_row(self) -> tuple:
+        return (
+            self.path, self.size, self.mtime_ns, self.content_hash, json.dumps(self.chunk_ids)
+        )
+
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        content_hash TEXT NOT NULL,
+        chunk_ids TEXT NOT NULL
+    )
+"""
+
+
+def hash_file(file_path: Path) -> str:
+    """파일 내용의 SHA-256 해시를 계산한다."""
+    digest = hashlib.sha256()
+    with file_path.open("rb") as f:
+        for block in iter(lambda: f.read(HASH_READ_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """인덱싱된 파일 목록을 SQLite로 영속 관리한다.
+
+    판정 순서:
+    1. size + mtime 동일 → 변경 없음 (파일을 읽지 않음)
+    2. 해시 동일 → 변경 없음 (mtime만 갱신, 예: touch/checkout)
+    3. 그 외 → 변경됨
+
+    record/remove/clear는 메모리에만 반영되고 save() 때 한 트랜잭션으로 저장된다.
+    """
+
+    def __init__(self, config: VibeXConfig | None = None) -> None:
+        self._config = config or load_config()
+        self._path = self._config.paths.index_manifest_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._entries: dict[str, ManifestEntry] = {}
+        # 저장 대기 중인 변경: 경로 → 항목 (None이면 삭제)
+        self._pending: dict[str, ManifestEntry | None] = {}
+        self._cleared = False
+        self._load()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite 연결을 지연 초기화한다."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != MANIFEST_VERSION:
+                logger.info("매니페스트 버전 변경, 전체 재인덱싱")
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute(f"PRAGMA user_version = {MANIFEST_VERSION}")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, file_path: str) -> ManifestEntry | None:
+        """파일의 매니페스트 항목을 반환한다."""
+        return self._entries.get(file_path)
+
+    def is_unchanged(self, file_path: Path, stat: os.stat_result) -> bool:
+        """파일이 마지막 인덱싱 이후 변경되지 않았는지 확인한다."""
+        entry = self._entries.get(str(file_path))
+        if entry is None:
+            return False
+
+        if entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return True
+
+        if entry.size != stat.st_size:
+            return False
+
+        # 크기는 같고 mtime만 다름 → 해시로 최종 확인
+        if hash_file(file_path) != entry.content_hash:
+            return False
+
+        entry.mtime_ns = stat.st_mtime_ns
+        self._pending[entry.path] = entry
+        return True
+
+    def record(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        content_hash: str,
+        chunk_ids: list[str],
+    ) -> None:
+        """파일의 인덱싱 결과를 기록한다."""
+        key = str(file_path)
+        entry = ManifestEntry(
+            path=key,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            content_hash=content_hash,
+            chunk_ids=chunk_ids,
+        )
+        self._entries[key] = entry
+        self._pending[key] = entry
+
+    def remove(self, file_path: str) -> ManifestEntry | None:
+        """파일 항목을 제거하고 제거된 항목을 반환한다."""
+        entry = self._entries.pop(file_path, None)
+        if entry is not None:
+            self._pending[file_path] = None
+        return entry
+
+    def paths_under(self, root: Path) -> set[str]:
+        """root 하위에 기록된 파일 경로 목록을 반환한다."""
+        prefix = str(root).rstrip(os.sep) + os.sep
+        return {p for p in self._entries if p.startswith(prefix)}
+
+    def clear(self) -> None:
+        """모든 항목을 삭제한다 (전체 재인덱싱용)."""
+        self._entries.clear()
+        self._pending.clear()
+        self._cleared = True
+
+    def save(self) -> None:
+        """대기 중인 변경을 한 트랜잭션으로 저장하고 다른 프로세스의 기록을 다시 읽는다."""
+        if not self._pending and not self._cleared:
+            return
+
+        with self._lock, self.conn:
+            if self._cleared:
+                self.conn.execute("DELETE FROM files")
+            upserts = [e.to_row() for e in self._pending.values() if e is not None]
+            deletes = [(k,) for k, e in self._pending.items() if e is None]
+            self.conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", upserts)
+            self.conn.executemany("DELETE FROM files WHERE path = ?", deletes)
+        self._pending.clear()
+        self._cleared = False
+        self._load()
+
+    def close(self) -> None:
+        """SQLite 연결을 닫는다."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _load(self) -> None:
+        """저장된 매니페스트를 복원한다. 저장 대기 중인 변경은 유지한다."""
+        try:
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT path, size, mtime_ns, content_hash, chunk_ids FROM files"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"매니페스트 로드 실패, 전체 재인덱싱: {e}")
+            return
+
+        entries = {
+            path: ManifestEntry(path, size, mtime_ns, content_hash, json.loads(chunk_ids))
+            for path, size, mtime_ns, content_hash, chunk_ids in rows
+        }
+        for key, entry in self._pending.items():
+            if entry is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = entry
+        self._entries = entries
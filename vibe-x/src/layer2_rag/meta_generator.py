@@ -13,16 +13,21 @@ AI 코드 생성 시 "왜 이렇게 만들었는지"를 메타데이터로 기
 import ast
 import json
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.file_walker import walk_files
 from src.shared.logger import get_logger
+from src.shared.progress import ProgressCallback, ProgressTracker
 from src.shared.types import ChunkType, CodeChunk, IntentMeta
 
 logger = get_logger("meta-gen")
 
 MAX_DOCSTRING_LENGTH = 200
+META_SOURCE_EXTENSIONS = (".py", ".ts", ".tsx")
+META_IGNORED_DIRS = ("__pycache__", "node_modules", ".next", ".git", ".venv")
 
 
 class MetaGenerator:
@@ -93,23 +98,44 @@ class MetaGenerator:
             dependencies=analysis["dependencies"],
         )
 
-    def batch_analyze(self, directory: Path) -> list[Path]:
-        """디렉토리 내 모든 소스 파일에 대해 자동 분석 + 메타 생성."""
+    def batch_analyze(
+        self,
+        directory: Path,
+        progress: ProgressCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> list[Path]:
+        """디렉토리 내 모든 소스 파일에 대해 자동 분석 + 메타 생성.
+
+        progress가 있으면 파일마다 진행 상황을 보내고,
+        cancel이 설정되면 다음 파일 전에 멈춘다.
+        """
         generated: list[Path] = []
-        extensions = {".py", ".ts", ".tsx"}
-        ignored = {"__pycache__", "node_modules", ".next", ".git", ".venv"}
-
-        for item in sorted(directory.rglob("*")):
-            if any(part in ignored for part in item.parts):
-                continue
-            if item.is_file() and item.suffix in extensions:
-                result = self.analyze_and_generate(item)
-                if result:
-                    generated.append(result)
+        files = self._source_files(directory)
+        tracker = ProgressTracker(progress, total=len(files))
+        tracker.emit("collect")
+        for item in files:
+            if cancel is not None and cancel.is_set():
+                logger.info(f"batch analyze cancelled: {len(generated)} meta files")
+                tracker.emit("cancelled")
+                return generated
+            result = self.analyze_and_generate(item)
+            if result:
+                generated.append(result)
+            tracker.advance("meta", 1 if result else 0)
 
         logger.info(f"batch analyze complete: {len(generated)} meta files")
+        tracker.emit("done")
         return generated
 
+    def _source_files(self, directory: Path) -> list[Path]:
+        """메타 분석 대상 소스 파일 (무시 디렉토리는 가지치기, .gitignore 적용)."""
+        return walk_files(
+            directory,
+            extensions=META_SOURCE_EXTENSIONS,
+            ignored_dirs=META_IGNORED_DIRS,
+            use_gitignore=self._config.rag.respect_gitignore,
+        )
+
     def index_meta(self, meta: IntentMeta) -> list[CodeChunk]:
         """IntentMeta를 CodeChunk로 변환하여 Vector DB 인덱싱에 사용한다."""
         intent_text = self._meta_to_searchable_text(meta)
@@ -312,18 +338,11 @@ class MetaGenerator:
         """소스 파일 대비 메타 파일 커버리지 통계를 반환한다."""
         src_dir = self._config.paths.project_root / "vibe-x" / "src"
         dash_dir = self._config.paths.project_root / "vibe-x" / "dashboard" / "src"
-        extensions = {".py", ".ts", ".tsx"}
-        ignored = {"__pycache__", "node_modules", ".next", ".git", ".venv"}
 
         source_files: list[str] = []
         for search_dir in [src_dir, dash_dir]:
-            if not search_dir.exists():
-                continue
-            for item in sorted(search_dir.rglob("*")):
-                if any(part in ignored for part in item.parts):
-                    continue
-                if item.is_file() and item.suffix in extensions:
-                    source_files.append(str(item))
+            if search_dir.exists():
+                source_files.extend(str(p) for p in self._source_files(search_dir))
 
         metas = self.list_all()
         meta_files = {m.file_path for m in metas}
@@ -0,0 +1,33 @@
+"""Task 2.6 - 검색 경로 필터 유틸리티.
+
+청크의 파일 경로를 프로젝트 루트 기준 상대 경로로 바꾸고,
+디렉토리 접두사 목록(`src`, `src/layer2_rag`, `src/layer2_rag/chunker.py`)을 만든다.
+접두사 목록은 벡터 DB 메타데이터에 색인되어 파일 필터를 쿼리 단계에서 적용한다.
+"""
+
+from pathlib import Path, PurePosixPath
+
+
+def relative_path(file_path: str, root: Path) -> str:
+    """root(resolve된 경로) 기준 POSIX 상대 경로를 반환한다. root 밖이면 그대로."""
+    path = Path(file_path)
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def path_prefixes(rel_path: str) -> list[str]:
+    """상대 경로의 모든 디렉토리 접두사와 파일 경로 자신을 반환한다."""
+    parts = PurePosixPath(rel_path).parts
+    return ["/".join(parts[: i + 1]).replace("//", "/") for i in range(len(parts))]
+
+
+def normalize_filter(file_filter: str, root: Path) -> str:
+    """사용자 파일 필터를 접두사 비교용 형태로 정규화한다."""
+    value = file_filter.strip().replace("\\", "/")
+    if Path(value).is_absolute():
+        value = relative_path(value, root.resolve())
+    while value.startswith("./"):
+        value = value[2:]
+    return value.rstrip("/")
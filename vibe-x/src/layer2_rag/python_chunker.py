@@ -0,0 +1,131 @@
+"""Task 2.2 - Python AST 기반 청킹 전략.
+
+정규식 청킹은 컬럼 0의 def/class만 인식하여 메서드가 거대한 클래스 청크에 묻히고
+데코레이터와 모듈 레벨 코드가 유실된다. 이 모듈은 ast로 스코프를 따라가며
+함수/메서드마다 하나의 청크를 만들고 `Class.method` 형태의 한정 이름을 붙인다.
+"""
+
+import ast
+
+from src.shared.line_index import LineIndex
+from src.shared.types import CodeChunk, ChunkType
+
+DefNode = ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+
+
+class PythonAstChunker:
+    """ast 스코프 기반 Python 청커.
+
+    - 함수/메서드: 데코레이터 포함 1개 청크 (중첩 함수는 부모에 포함)
+    - 클래스: 메서드를 제외한 나머지(헤더, docstring, 클래스 속성)를 CLASS 청크로
+    - 모듈 레벨 코드(import, 상수 등): MODULE 청크로 보존
+    """
+
+    def __init__(self, max_lines: int) -> None:
+        self._max_lines = max(1, max_lines)
+
+    def chunk(self, file_path: str, index: LineIndex) -> list[CodeChunk] | None:
+        """Python 소스를 청킹한다.
+
+        Returns:
+            청크 목록. 구문 오류면 None, 함수/클래스가 없으면 빈 목록
+        """
+        try:
+            tree = ast.parse(index.content)
+        except (SyntaxError, ValueError):
+            return None
+
+        if not any(isinstance(node, DefNode) for node in tree.body):
+            return []
+
+        chunks: list[CodeChunk] = []
+        self._chunk_scope(
+            file_path, index, tree.body, 1, len(index), "", chunks
+        )
+        chunks.sort(key=lambda c: c.start_line)
+        return chunks
+
+    def _chunk_scope(
+        self,
+        file_path: str,
+        index: LineIndex,
+        body: list[ast.stmt],
+        scope_start: int,
+        scope_end: int,
+        prefix: str,
+        chunks: list[CodeChunk],
+    ) -> None:
+        """스코프(모듈/클래스 본문)의 정의와 그 사이 코드를 청크로 만든다."""
+        gap_type = ChunkType.CLASS if prefix else ChunkType.MODULE
+        gap_name = prefix.rstrip(".") if prefix else "<module>"
+        cursor = scope_start
+
+        for node in body:
+            if not isinstance(node, DefNode):
+                continue
+
+            start = self._node_start(node)
+            end = node.end_lineno or start
+            self._add_gap(file_path, index, cursor, start - 1, gap_type, gap_name, chunks)
+            cursor = end + 1
+
+            qualname = f"{prefix}{node.name}"
+            if isinstance(node, ast.ClassDef):
+                self._chunk_scope(
+                    file_path, index, node.body, start, end, f"{qualname}.", chunks
+                )
+            else:
+                chunks.append(
+                    CodeChunk(
+                        file_path=file_path,
+                        content=index.slice(start, end),
+                        start_line=start,
+                        end_line=end,
+                        chunk_type=ChunkType.FUNCTION,
+                        language="python",
+                        name=qualname,
+                    )
+                )
+
+        self._add_gap(file_path, index, cursor, scope_end, gap_type, gap_name, chunks)
+
+    def _add_gap(
+        self,
+        file_path: str,
+        index: LineIndex,
+        start: int,
+        end: int,
+        chunk_type: ChunkType,
+        name: str,
+        chunks: list[CodeChunk],
+    ) -> None:
+        """정의 사이의 코드를 max_lines 단위 청크로 추가한다. 빈 줄은 잘라낸다."""
+        lines = index.lines
+        while start <= end and not lines[start - 1].strip():
+            start += 1
+        while end >= start and not lines[end - 1].strip():
+            end -= 1
+
+        for piece_start in range(start, end + 1, self._max_lines):
+            piece_end = min(piece_start + self._max_lines - 1, end)
+            content = index.slice(piece_start, piece_end)
+            if not content.strip():
+                continue
+            chunks.append(
+                CodeChunk(
+                    file_path=file_path,
+                    content=content,
+                    start_line=piece_start,
+                    end_line=piece_end,
+                    chunk_type=chunk_type,
+                    language="python",
+                    name=name,
+                )
+            )
+
+    @staticmethod
+    def _node_start(node: DefNode) -> int:
+        """데코레이터를 포함한 정의 시작 라인."""
+        if node.decorator_list:
+            return min(d.lineno for d in node.decorator_list)
+        return node.lineno
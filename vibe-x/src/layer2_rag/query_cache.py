@@ -0,0 +1,96 @@
+"""Task 2.6 - 검색 쿼리 캐시.
+
+같은 질의를 반복할 때(온보딩 Q&A, MCP code_search 등) 임베딩 재계산과
+벡터 검색을 생략하기 위한 스레드 안전 LRU / TTL 캐시.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 질의 정규화: 앞뒤 공백 제거 + 연속 공백 축약."""
+    return " ".join(text.split())
+
+
+class LRUCache:
+    """최근 사용 순서 기반 고정 크기 캐시. max_size가 0이면 캐시하지 않는다."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max(0, max_size)
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값을 조회한다. 적중 시 최근 사용으로 갱신한다."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """값을 저장하고 크기를 넘으면 가장 오래된 항목을 버린다."""
+        if self._max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = self._wrap(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제한다 (적중 통계는 유지)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """적중/실패 횟수와 현재 크기를 반환한다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size": len(self._entries),
+            "max_size": self._max_size,
+        }
+
+    def _lookup(self, key: Hashable) -> Any:
+        return self._entries.get(key, _MISSING)
+
+    def _wrap(self, value: Any) -> Any:
+        return value
+
+
+class TTLCache(LRUCache):
+    """항목마다 만료 시각을 두는 LRU 캐시."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        super().__init__(max_size if ttl_seconds > 0 else 0)
+        self._ttl = ttl_seconds
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return _MISSING
+        return value
+
+    def _wrap(self, value: Any) -> Any:
+        return (time.monotonic() + self._ttl, value)
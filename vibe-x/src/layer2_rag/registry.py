@@ -0,0 +1,93 @@
+"""Task 2.6 - 프로세스 공용 VectorStore / CodeSearcher 레지스트리.
+
+대시보드와 MCP 서버는 요청마다 VectorStore를 만들면 ChromaDB 클라이언트 연결과
+임베딩 모델 로드를 반복하게 된다. 이 모듈은 프로젝트 설정별로 인스턴스를 하나씩
+지연 생성하여 공유하고, 서버 시작 시 미리 초기화(warm-up)할 수 있게 한다.
+"""
+
+import threading
+import time
+from collections.abc import Hashable
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.logger import get_logger
+from src.layer2_rag.searcher import CodeSearcher
+from src.layer2_rag.vector_db import VectorStore
+
+logger = get_logger("rag-registry")
+
+WARM_UP_QUERY = "warm up"
+
+_lock = threading.Lock()
+_stores: dict[Hashable, VectorStore] = {}
+_searchers: dict[Hashable, CodeSearcher] = {}
+
+
+def _key(config: VibeXConfig) -> Hashable:
+    """프로젝트 루트 + RAG 설정이 같으면 같은 인스턴스를 공유한다."""
+    return (config.paths.project_root.resolve(), config.rag)
+
+
+def get_store(config: VibeXConfig | None = None) -> VectorStore:
+    """설정에 해당하는 공용 VectorStore를 반환한다."""
+    config = config or load_config()
+    key = _key(config)
+    store = _stores.get(key)
+    if store is None:
+        with _lock:
+            store = _stores.get(key)
+            if store is None:
+                store = VectorStore(config)
+                _stores[key] = store
+    return store
+
+
+def get_searcher(config: VibeXConfig | None = None) -> CodeSearcher:
+    """설정에 해당하는 공용 CodeSearcher를 반환한다 (공용 VectorStore 사용)."""
+    config = config or load_config()
+    key = _key(config)
+    searcher = _searchers.get(key)
+    if searcher is None:
+        store = get_store(config)
+        with _lock:
+            searcher = _searchers.get(key)
+            if searcher is None:
+                searcher = CodeSearcher(config, store=store)
+                _searchers[key] = searcher
+    return searcher
+
+
+def warm_up(config: VibeXConfig | None = None) -> float:
+    """ChromaDB 연결, 키워드 색인, 임베딩 모델을 미리 로드한다.
+
+    Returns:
+        소요 시간(초). 실패해도 예외를 던지지 않는다 (첫 요청에서 다시 시도됨).
+    """
+    start = time.perf_counter()
+    store = get_store(config)
+    try:
+        store.collection
+        store.keywords.count()
+        # 모델 로드 + 첫 추론의 지연 초기화까지 끝내 둔다
+        store.embed_query(WARM_UP_QUERY)
+    except Exception as e:
+        logger.warning(f"RAG warm-up 실패: {e}")
+    elapsed = round(time.perf_counter() - start, 2)
+    logger.info(f"RAG warm-up 완료 ({elapsed}s)")
+    return elapsed
+
+
+def warm_up_in_background(config: VibeXConfig | None = None) -> threading.Thread:
+    """warm-up을 데몬 스레드에서 실행한다. 서버 기동을 막지 않는다."""
+    thread = threading.Thread(
+        target=warm_up, args=(config,), name="vibe-x-rag-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def clear_registry() -> None:
+    """등록된 인스턴스를 모두 버린다 (테스트/설정 변경용)."""
+    with _lock:
+        _stores.clear()
+        _searchers.clear()
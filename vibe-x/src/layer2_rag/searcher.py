@@ -1,18 +1,38 @@
 """Task 2.6 - RAG 검색 엔진.
 
 자연어 질의로 코드베이스에서 관련 코드를 찾는다.
-벡터 유사도 검색 + 메타데이터 필터링을 결합한다.
+벡터 유사도 검색 + BM25 키워드 검색을 Reciprocal Rank Fusion으로 결합한다.
+언어/경로 필터는 ChromaDB where 절과 SQL 조건으로 쿼리 단계에서 적용한다.
 """
 
-from pathlib import Path
+import re
+from collections.abc import Callable
+from dataclasses import replace
 
 from src.shared.config import VibeXConfig, load_config
 from src.shared.logger import get_logger
 from src.shared.types import SearchResult
+from src.layer2_rag.path_filter import normalize_filter, path_prefixes, relative_path
+from src.layer2_rag.query_cache import normalize_query
 from src.layer2_rag.vector_db import VectorStore
 
 logger = get_logger("searcher")
 
+SEARCH_MODES = ("hybrid", "vector", "keyword")
+
+# 융합 전 각 검색 경로에서 top_k의 몇 배까지 후보를 가져올지
+HYBRID_CANDIDATE_FACTOR = 3
+
+# 후처리 필터가 불가피할 때의 과다 조회 배수와 최대 반복 횟수
+OVERFETCH_FACTOR = 4
+MAX_OVERFETCH_ROUNDS = 3
+
+# `_detect_overlap`, `MAX_GATE_HISTORY`, `CodeSearcher.search` 같은 단일 식별자 질의
+IDENTIFIER_QUERY_RE = re.compile(
+    r"^(?:[A-Za-z_]\w*\.)+[A-Za-z_]\w*$"
+    r"|^(?:\w*_\w*|[a-z]+[A-Z]\w*|[A-Z][a-z]+[A-Z]\w*)$"
+)
+
 
 class CodeSearcher:
     """코드베이스 시맨틱 검색 엔진.
@@ -20,11 +40,14 @@ class CodeSearcher:
     사용 예:
         searcher = CodeSearcher()
         results = searcher.search("인증 미들웨어는 어디에 있나?")
+        results = searcher.search("_detect_overlap")   # 식별자 → 키워드 경로만 사용
     """
 
-    def __init__(self, config: VibeXConfig | None = None) -> None:
+    def __init__(
+        self, config: VibeXConfig | None = None, store: VectorStore | None = None
+    ) -> None:
         self._config = config or load_config()
-        self._store = VectorStore(self._config)
+        self._store = store or VectorStore(self._config)
 
     def search(
         self,
@@ -32,33 +55,144 @@ class CodeSearcher:
         top_k: int | None = None,
         file_filter: str | None = None,
         language_filter: str | None = None,
+        mode: str = "hybrid",
     ) -> list[SearchResult]:
-        """시맨틱 검색을 수행한다.
+        """하이브리드(벡터 + BM25) 검색을 수행한다.
+
+        단일 식별자 질의는 키워드 결과가 있으면 임베딩 없이 키워드 경로로만 응답한다.
+        결과는 색인 세대 번호를 포함한 키로 짧은 시간(result_cache_ttl_seconds) 캐시된다.
 
         Args:
-            query: 자연어 검색 질의
+            query: 자연어 검색 질의 또는 식별자
             top_k: 반환할 최대 결과 수
-            file_filter: 특정 파일 경로로 필터링 (부분 매칭)
+            file_filter: 파일/디렉토리 경로 필터 (접두사 우선, 없으면 부분 매칭)
             language_filter: 특정 언어로 필터링
+            mode: "hybrid" | "vector" | "keyword"
 
         Returns:
             관련성 순으로 정렬된 검색 결과
         """
-        results = self._store.search(query, top_k)
-
-        # 메타데이터 기반 필터링
-        if file_filter:
-            results = [
-                r for r in results if file_filter in r.file_path
-            ]
-        if language_filter:
-            results = [
-                r for r in results
-                if r.metadata.get("language") == language_filter
-            ]
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"지원하지 않는 검색 모드: {mode} (가능: {', '.join(SEARCH_MODES)})")
+
+        k = top_k or self._config.rag.search_top_k
+        weight = self._config.rag.hybrid_keyword_weight
+        if mode == "hybrid" and weight <= 0:
+            mode = "vector"
+        elif mode == "hybrid" and weight >= 1:
+            mode = "keyword"
+
+        # 같은 질의/필터/모드라도 색인이 바뀌면(세대 번호 증가) 캐시를 쓰지 않는다
+        cache_key = (
+            mode,
+            normalize_query(query),
+            k,
+            file_filter or "",
+            language_filter or "",
+            self._store.generation(),
+        )
+        cached = self._store.result_cache.get(cache_key)
+        if cached is not None:
+            return _copy_results(cached)
+
+        results = self._search_filtered(query, k, mode, file_filter, language_filter)
+        self._store.result_cache.put(cache_key, _copy_results(results))
+        return results
 
+    def _search_filtered(
+        self,
+        query: str,
+        k: int,
+        mode: str,
+        file_filter: str | None,
+        language_filter: str | None,
+    ) -> list[SearchResult]:
+        """파일/언어 필터를 적용하여 검색한다."""
+        if not file_filter:
+            return self._search_paths(query, k, mode, language_filter)
+
+        # 파일 필터는 색인된 경로 접두사로 쿼리 단계에서 적용하고,
+        # 해당 접두사가 없으면(부분 문자열 필터 등) 후처리 필터로 재시도한다
+        prefix = normalize_filter(file_filter, self._config.paths.project_root)
+        results = self._search_paths(query, k, mode, language_filter, path_prefix=prefix)
+        if not results:
+            results = self._search_paths(
+                query, k, mode, language_filter, path_contains=file_filter
+            )
         return results
 
+    def _search_paths(
+        self,
+        query: str,
+        k: int,
+        mode: str,
+        language: str | None,
+        path_prefix: str | None = None,
+        path_contains: str | None = None,
+    ) -> list[SearchResult]:
+        """검색 모드에 따라 벡터/키워드 경로를 실행하고 결과를 합친다."""
+        keyword_filters = {
+            "language": language,
+            "path_prefix": path_prefix,
+            "path_contains": path_contains,
+        }
+        if mode == "keyword":
+            return self._store.keyword_search(query, k, **keyword_filters)
+        if mode == "vector":
+            return self._vector_search(query, k, language, path_prefix, path_contains)
+
+        candidates = k * HYBRID_CANDIDATE_FACTOR
+        keyword_results = self._store.keyword_search(query, candidates, **keyword_filters)
+        if keyword_results and IDENTIFIER_QUERY_RE.match(query.strip()):
+            return keyword_results[:k]
+
+        vector_results = self._vector_search(
+            query, candidates, language, path_prefix, path_contains
+        )
+        return reciprocal_rank_fusion(
+            vector_results,
+            keyword_results,
+            self._config.rag.hybrid_keyword_weight,
+            self._config.rag.rrf_k,
+        )[:k]
+
+    def _vector_search(
+        self,
+        query: str,
+        k: int,
+        language: str | None,
+        path_prefix: str | None,
+        path_contains: str | None,
+    ) -> list[SearchResult]:
+        """벡터 검색. 필터는 가능한 한 ChromaDB where 절로 내려보낸다."""
+        pushdown = path_prefix if self._store.list_metadata else None
+        where = build_where(language, pushdown)
+        keep = self._post_filter(path_prefix if pushdown is None else None, path_contains)
+        if keep is None:
+            return self._store.search(query, k, where=where)
+
+        # where로 표현할 수 없는 경로 필터는 후처리 → 결과가 찰 때까지 과다 조회
+        total = self._store.count()
+        n = k * OVERFETCH_FACTOR
+        results: list[SearchResult] = []
+        for _ in range(MAX_OVERFETCH_ROUNDS):
+            results = [r for r in self._store.search(query, n, where=where) if keep(r)]
+            if len(results) >= k or n >= total:
+                break
+            n *= OVERFETCH_FACTOR
+        return results[:k]
+
+    def _post_filter(
+        self, path_prefix: str | None, path_contains: str | None
+    ) -> Callable[[SearchResult], bool] | None:
+        """검색 후 적용할 경로 조건. 후처리할 필터가 없으면 None."""
+        if path_contains:
+            return lambda r: path_contains in r.file_path
+        if path_prefix:
+            root = self._config.paths.project_root.resolve()
+            return lambda r: path_prefix in path_prefixes(relative_path(r.file_path, root))
+        return None
+
     def search_similar_code(self, code_snippet: str, top_k: int = 5) -> list[SearchResult]:
         """코드 스니펫과 유사한 코드를 찾는다.
 
@@ -96,3 +230,48 @@ class CodeSearcher:
             output_parts.append(f"{header}\n{preview}")
 
         return "\n\n---\n\n".join(output_parts)
+
+
+def _copy_results(results: list[SearchResult]) -> list[SearchResult]:
+    """캐시와 호출자가 같은 결과 객체(metadata)를 공유하지 않도록 복사한다."""
+    return [replace(r, metadata=dict(r.metadata)) for r in results]
+
+
+def build_where(language: str | None, path_prefix: str | None) -> dict | None:
+    """언어/경로 접두사 필터를 ChromaDB where 절로 변환한다."""
+    clauses: list[dict] = []
+    if language:
+        clauses.append({"language": language})
+    if path_prefix:
+        clauses.append({"path_prefixes": {"$contains": path_prefix}})
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+def reciprocal_rank_fusion(
+    vector_results: list[SearchResult],
+    keyword_results: list[SearchResult],
+    keyword_weight: float,
+    k: int,
+) -> list[SearchResult]:
+    """두 순위 목록을 가중 Reciprocal Rank Fusion으로 합친다.
+
+    score = (1 - w) / (k + 벡터 순위) + w / (k + 키워드 순위)
+    같은 청크가 양쪽에 있으면 벡터 결과(코사인 거리 보유)를 대표로 사용한다.
+    """
+    scores: dict[str, float] = {}
+    merged: dict[str, SearchResult] = {}
+
+    ranked = ((1.0 - keyword_weight, vector_results), (keyword_weight, keyword_results))
+    for weight, results in ranked:
+        for rank, result in enumerate(results, 1):
+            scores[result.chunk_id] = scores.get(result.chunk_id, 0.0) + weight / (k + rank)
+            merged.setdefault(result.chunk_id, result)
+
+    fused = sorted(merged.values(), key=lambda r: scores[r.chunk_id], reverse=True)
+    for result in fused:
+        result.metadata["rrf_score"] = round(scores[result.chunk_id], 6)
+    return fused
@@ -0,0 +1,156 @@
+"""Task 2.2 - 임베딩 모델 토큰 한도 기반 청크 크기 제한.
+
+라인 수 기준 청킹은 임베딩 모델의 최대 시퀀스 길이(all-MiniLM-L6-v2는 256 토큰)를
+넘는 청크를 만들 수 있고, 넘친 부분은 임베딩되지 않은 채 저장만 된다.
+이 모듈은 모델 토크나이저로 청크를 측정하여 초과분을 라인 단위로 분할한다.
+"""
+
+import math
+import re
+from dataclasses import dataclass, replace
+from typing import Any
+
+from src.shared.logger import get_logger
+from src.shared.types import CodeChunk
+
+logger = get_logger("token-budget")
+
+# [CLS], [SEP] 등 모델이 자동으로 붙이는 특수 토큰 몫
+SPECIAL_TOKENS = 2
+
+# 토크나이저가 없을 때의 근사: 단어 조각 최대 길이 (WordPiece 평균보다 보수적)
+APPROX_PIECE_CHARS = 6
+_APPROX_TOKEN_RE = re.compile(r"[^\W_]+|[^\w\s]|_")
+
+
+@dataclass
+class TokenFitStats:
+    """토큰 한도 적용 결과 통계."""
+    split_chunks: int = 0      # 여러 조각으로 분할된 원본 청크 수
+    truncated_chunks: int = 0  # 한 라인이 한도를 넘어 잘린 조각 수
+    truncated_lines: int = 0   # 스트리밍 청킹에서 최대 길이로 잘린 라인 수
+
+
+class TokenCounter:
+    """임베딩 모델 토크나이저 기반 토큰 카운터.
+
+    transformers 미설치 또는 모델 로드 실패 시 정규식 근사치를 사용한다.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        self._model_name = model_name
+        self._tokenizer: Any = None
+        self._loaded = False
+
+    @property
+    def tokenizer(self) -> Any:
+        """Hugging Face 토크나이저를 지연 로드한다. 실패 시 None."""
+        if not self._loaded:
+            self._loaded = True
+            try:
+                from transformers import AutoTokenizer
+            except ImportError:
+                logger.info("transformers 미설치 - 근사 토큰 카운트 사용")
+                return None
+            name = self._model_name
+            if "/" not in name:
+                name = f"sentence-transformers/{name}"
+            try:
+                self._tokenizer = AutoTokenizer.from_pretrained(name)
+            except Exception as e:
+                logger.warning(f"토크나이저 로드 실패 ({name}) - 근사 토큰 카운트 사용: {e}")
+        return self._tokenizer
+
+    def count(self, text: str) -> int:
+        """특수 토큰을 제외한 토큰 수를 반환한다."""
+        if self.tokenizer is not None:
+            return len(self.tokenizer.encode(text, add_special_tokens=False))
+        return sum(self._approx_tokens(m.group()) for m in _APPROX_TOKEN_RE.finditer(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """앞에서부터 max_tokens 토큰까지만 남긴다."""
+        if self.tokenizer is not None:
+            encoded = self.tokenizer(
+                text,
+                add_special_tokens=False,
+                truncation=True,
+                max_length=max_tokens,
+                return_offsets_mapping=True,
+            )
+            offsets = encoded["offset_mapping"]
+            return text[: offsets[-1][1]] if offsets else ""
+
+        used = 0
+        for match in _APPROX_TOKEN_RE.finditer(text):
+            used += self._approx_tokens(match.group())
+            if used > max_tokens:
+                return text[: match.start()]
+        return text
+
+    @staticmethod
+    def _approx_tokens(piece: str) -> int:
+        return max(1, math.ceil(len(piece) / APPROX_PIECE_CHARS))
+
+
+class TokenBudget:
+    """청크를 토큰 한도 안으로 맞추는 분할기.
+
+    - 한도 이하 청크: 그대로 유지
+    - 한도 초과 청크: 라인 단위로 분할, 조각 사이 overlap_lines 만큼 겹침
+    - 한 라인이 한도를 넘는 경우: 해당 라인을 한도까지 잘라내고 truncated로 집계
+    """
+
+    def __init__(self, counter: TokenCounter, max_tokens: int, overlap_lines: int) -> None:
+        self._counter = counter
+        self._budget = max(1, max_tokens - SPECIAL_TOKENS)
+        self._overlap = max(0, overlap_lines)
+
+    def fit(self, chunks: list[CodeChunk], stats: TokenFitStats) -> list[CodeChunk]:
+        """청크 목록에 토큰 한도를 적용한다."""
+        fitted: list[CodeChunk] = []
+        for chunk in chunks:
+            if self._counter.count(chunk.content) <= self._budget:
+                fitted.append(chunk)
+                continue
+            pieces = self._split(chunk, stats)
+            if len(pieces) > 1:
+                stats.split_chunks += 1
+            fitted.extend(pieces)
+        return fitted
+
+    def _split(self, chunk: CodeChunk, stats: TokenFitStats) -> list[CodeChunk]:
+        """라인별 토큰 수를 누적하여 한도 내 조각으로 나눈다."""
+        lines = chunk.content.split("\n")
+        # 개행도 토큰 경계로만 작용하므로 라인별 합이 전체 토큰 수에 근사한다
+        costs = [self._counter.count(line) for line in lines]
+        pieces: list[CodeChunk] = []
+
+        start = 0
+        while start < len(lines):
+            end = start
+            used = costs[start]
+            while end + 1 < len(lines) and used + costs[end + 1] <= self._budget:
+                end += 1
+                used += costs[end]
+
+            content = "\n".join(lines[start : end + 1])
+            if used > self._budget:
+                content = self._counter.truncate(content, self._budget)
+                stats.truncated_chunks += 1
+
+            if content.strip():
+                pieces.append(
+                    replace(
+                        chunk,
+                        content=content,
+                        start_line=chunk.start_line + start,
+                        end_line=chunk.start_line + end,
+                    )
+                )
+
+            if end + 1 >= len(lines):
+                break
+            # 겹침을 두되 반드시 앞으로 진행
+            start = max(start + 1, end + 1 - self._overlap)
+
+        return pieces
@@ -2,90 +2,262 @@
 
 ChromaDB를 사용한 벡터 저장소 관리.
 코드 청크의 저장, 검색, 삭제를 담당한다.
+임베딩은 sentence-transformers로 배치 계산하며, 미설치 시 ChromaDB 기본 임베딩을 사용한다.
+모든 쓰기는 BM25 키워드 색인(KeywordIndex)에도 함께 반영된다.
+질의 임베딩은 LRU 캐시, 검색 결과는 색인 세대 번호를 키에 포함한 TTL 캐시로 재사용한다.
 """
 
+import threading
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import Any
+
 import chromadb
+from chromadb.api.types import validate_metadata
 from chromadb.config import Settings
 
 from src.shared.config import VibeXConfig, load_config
 from src.shared.logger import get_logger
 from src.shared.types import CodeChunk, SearchResult
+from src.layer2_rag.keyword_index import KeywordIndex
+from src.layer2_rag.path_filter import path_prefixes, relative_path
+from src.layer2_rag.query_cache import LRUCache, TTLCache, normalize_query
 
 logger = get_logger("vector-db")
 
 
+def _supports_list_metadata() -> bool:
+    """설치된 ChromaDB가 리스트 메타데이터 값을 받는지 확인한다 (로컬 검증만 수행).
+
+    리스트 값을 받지 않는 버전에서는 path_prefixes를 저장하지 않고,
+    CodeSearcher가 경로 접두사 필터를 후처리로 적용한다.
+    """
+    try:
+        validate_metadata({"path_prefixes": ["src"]})
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+LIST_METADATA_SUPPORTED = _supports_list_metadata()
+
+
+def unique_chunks(chunks: list[CodeChunk]) -> list[CodeChunk]:
+    """같은 chunk_id는 마지막 청크만 남긴다. 중복이 있으면 경고한다 (청커 쪽 원인 추적용)."""
+    unique = list({chunk.chunk_id: chunk for chunk in chunks}.values())
+    dropped = len(chunks) - len(unique)
+    if dropped:
+        counts = Counter(chunk.chunk_id for chunk in chunks)
+        example = next(k for k, v in counts.items() if v > 1)
+        logger.warning(f"중복 chunk_id {dropped}개 제거 (예: {example})")
+    return unique
+
+
 class VectorStore:
     """ChromaDB 기반 벡터 저장소.
 
     코드 청크를 벡터화하여 저장하고 시맨틱 검색을 지원한다.
     PersistentClient를 사용하여 데이터가 디스크에 영속 저장된다.
+    지연 초기화는 잠금으로 보호되어 여러 스레드가 한 인스턴스를 공유할 수 있다
+    (공용 인스턴스는 registry.get_store 참고).
     """
 
     def __init__(self, config: VibeXConfig | None = None) -> None:
         self._config = config or load_config()
         self._client: chromadb.ClientAPI | None = None
         self._collection: chromadb.Collection | None = None
+        self._embedder: Any = None
+        self._embedder_loaded = False
+        self._init_lock = threading.RLock()
+        self._keywords: KeywordIndex | None = None
+        self._root = self._config.paths.project_root.resolve()
+        # False면 path_prefixes 없이 저장하고 경로 필터는 검색 후 적용한다
+        self.list_metadata = LIST_METADATA_SUPPORTED
+        rag = self._config.rag
+        self._query_embeddings = LRUCache(rag.query_embedding_cache_size)
+        # CodeSearcher가 (질의, 필터, 모드, 색인 세대) 키로 사용하는 결과 캐시
+        self.result_cache = TTLCache(rag.result_cache_size, rag.result_cache_ttl_seconds)
 
     @property
     def client(self) -> chromadb.ClientAPI:
         """ChromaDB 클라이언트를 지연 초기화한다."""
         if self._client is None:
-            db_path = str(self._config.paths.chroma_db_path)
-            self._config.paths.chroma_db_path.mkdir(parents=True, exist_ok=True)
-            self._client = chromadb.PersistentClient(path=db_path)
-            logger.info(f"ChromaDB 연결 완료: [bold]{db_path}[/bold]")
+            with self._init_lock:
+                if self._client is None:
+                    db_path = str(self._config.paths.chroma_db_path)
+                    self._config.paths.chroma_db_path.mkdir(parents=True, exist_ok=True)
+                    self._client = chromadb.PersistentClient(path=db_path)
+                    logger.info(f"ChromaDB 연결 완료: [bold]{db_path}[/bold]")
         return self._client
 
     @property
     def collection(self) -> chromadb.Collection:
         """컬렉션을 지연 초기화한다. 없으면 자동 생성."""
         if self._collection is None:
-            self._collection = self.client.get_or_create_collection(
-                name=self._config.rag.collection_name,
-                metadata={
-                    "description": "VIBE-X codebase knowledge base",
-                    "hnsw:space": "cosine",
-                },
-            )
-            count = self._collection.count()
-            logger.info(
-                f"컬렉션 '{self._config.rag.collection_name}' 로드 완료 "
-                f"(문서 {count}개)"
-            )
+            with self._init_lock:
+                if self._collection is None:
+                    collection = self.client.get_or_create_collection(
+                        name=self._config.rag.collection_name,
+                        metadata={
+                            "description": "VIBE-X codebase knowledge base",
+                            "hnsw:space": "cosine",
+                        },
+                    )
+                    logger.info(
+                        f"컬렉션 '{self._config.rag.collection_name}' 로드 완료 "
+                        f"(문서 {collection.count()}개)"
+                    )
+                    self._collection = collection
         return self._collection
 
+    @property
+    def keywords(self) -> KeywordIndex:
+        """벡터 컬렉션과 동기화되는 BM25 키워드 색인."""
+        if self._keywords is None:
+            with self._init_lock:
+                if self._keywords is None:
+                    self._keywords = KeywordIndex(self._config)
+        return self._keywords
+
+    @property
+    def embedder(self) -> Any:
+        """sentence-transformers 모델을 지연 로드한다. 미설치 시 None."""
+        if not self._embedder_loaded:
+            with self._init_lock:
+                if not self._embedder_loaded:
+                    self._embedder = self._load_embedder()
+                    self._embedder_loaded = True
+        return self._embedder
+
+    def _load_embedder(self) -> Any:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.info("sentence-transformers 미설치 - ChromaDB 기본 임베딩 사용")
+            return None
+        embedder = SentenceTransformer(self._config.rag.embedding_model)
+        logger.info(f"임베딩 모델 로드 완료: {self._config.rag.embedding_model}")
+        return embedder
+
+    def embed(self, texts: list[str]) -> list[list[float]] | None:
+        """텍스트 목록을 embedding_batch_size 단위로 임베딩한다.
+
+        Returns:
+            임베딩 목록. 임베딩 모델이 없으면 None (ChromaDB가 직접 임베딩)
+        """
+        if self.embedder is None or not texts:
+            return None
+
+        vectors = self.embedder.encode(
+            texts,
+            batch_size=self._config.rag.embedding_batch_size,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return [list(map(float, v)) for v in vectors]
+
+    def embed_query(self, query: str) -> list[float] | None:
+        """검색 질의를 임베딩한다. (모델, 정규화된 질의) 키로 LRU 캐시한다."""
+        if self.embedder is None:
+            return None
+
+        key = (self._config.rag.embedding_model, normalize_query(query))
+        cached = self._query_embeddings.get(key)
+        if cached is not None:
+            return cached
+
+        vectors = self.embed([key[1]])
+        if not vectors:
+            return None
+        self._query_embeddings.put(key, vectors[0])
+        return vectors[0]
+
+    def generation(self) -> int:
+        """색인 세대 번호. 어느 프로세스든 쓰기가 일어나면 증가한다."""
+        return self.keywords.generation()
+
+    def _invalidate_results(self) -> None:
+        """쓰기 후 이 프로세스의 결과 캐시를 비운다 (다른 프로세스는 세대 번호로 감지)."""
+        self.result_cache.clear()
+
     def add_chunks(self, chunks: list[CodeChunk]) -> int:
         """코드 청크 목록을 벡터 DB에 추가한다.
 
+        upsert_batch_size 단위로 나누어 임베딩 + upsert한다.
+
         Args:
             chunks: 저장할 코드 청크 목록
 
         Returns:
             실제 추가된 청크 수
         """
+        chunks = unique_chunks(chunks)
         if not chunks:
             return 0
 
-        ids = [chunk.chunk_id for chunk in chunks]
-        documents = [chunk.content for chunk in chunks]
-        metadatas = [chunk.to_metadata() for chunk in chunks]
-
-        # 기존 ID와 중복되면 upsert로 처리
-        self.collection.upsert(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas,
-        )
+        batch_size = self._upsert_batch_size()
+        for i in range(0, len(chunks), batch_size):
+            self._upsert_batch(chunks[i : i + batch_size])
 
         logger.info(f"청크 {len(chunks)}개 저장 완료")
         return len(chunks)
 
-    def search(self, query: str, top_k: int | None = None) -> list[SearchResult]:
+    def bulk_writer(self) -> "BulkWriter":
+        """여러 파일의 청크를 모아 큰 배치로 저장하는 버퍼를 반환한다."""
+        return BulkWriter(self, self._upsert_batch_size())
+
+    def _upsert_batch(self, chunks: list[CodeChunk]) -> None:
+        """단일 배치를 임베딩하여 upsert한다."""
+        # 같은 배치 안의 중복 ID는 ChromaDB가 거부하므로 마지막 청크만 유지
+        unique = unique_chunks(chunks)
+        ids = [chunk.chunk_id for chunk in unique]
+        documents = [chunk.content for chunk in unique]
+        metadatas = [self._metadata(chunk) for chunk in unique]
+        embeddings = self.embed(documents)
+
+        # 기존 ID와 중복되면 upsert로 처리
+        if embeddings is None:
+            self.collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        else:
+            self.collection.upsert(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=embeddings,
+            )
+        self.keywords.upsert(unique)
+        self._invalidate_results()
+
+    def _metadata(self, chunk: CodeChunk) -> dict:
+        """청크 메타데이터에 경로 접두사 목록(path_prefixes)을 더한다.
+
+        path_prefixes는 `{"path_prefixes": {"$contains": "src/layer2_rag"}}` 형태로
+        디렉토리/파일 필터를 쿼리 단계에서 적용하는 데 쓰인다.
+        리스트 메타데이터를 받지 않는 ChromaDB에서는 더하지 않는다.
+        """
+        metadata = chunk.to_metadata()
+        if self.list_metadata:
+            metadata["path_prefixes"] = path_prefixes(relative_path(chunk.file_path, self._root))
+        return metadata
+
+    def _upsert_batch_size(self) -> int:
+        """설정값과 ChromaDB 최대 배치 크기 중 작은 값을 반환한다."""
+        batch_size = self._config.rag.upsert_batch_size
+        try:
+            batch_size = min(batch_size, self.client.get_max_batch_size())
+        except AttributeError:
+            pass
+        return max(1, batch_size)
+
+    def search(
+        self, query: str, top_k: int | None = None, where: dict | None = None
+    ) -> list[SearchResult]:
         """자연어 쿼리로 시맨틱 검색을 수행한다.
 
         Args:
             query: 검색 질의 (자연어)
             top_k: 반환할 최대 결과 수
+            where: ChromaDB 메타데이터 필터 (쿼리 단계에서 적용)
 
         Returns:
             관련성 순으로 정렬된 검색 결과 목록
@@ -104,11 +276,18 @@ class VectorStore:
         # 결과 수가 전체 문서 수보다 클 수 없음
         k = min(k, count)
 
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=k,
-            include=["documents", "metadatas", "distances"],
-        )
+        # 저장 시와 같은 임베딩 경로를 사용해야 벡터 공간이 일치한다
+        query_embedding = self.embed_query(query)
+        query_args: dict[str, Any] = {
+            "n_results": k,
+            "include": ["documents", "metadatas", "distances"],
+        }
+        if where:
+            query_args["where"] = where
+        if query_embedding is None:
+            results = self.collection.query(query_texts=[query], **query_args)
+        else:
+            results = self.collection.query(query_embeddings=[query_embedding], **query_args)
 
         search_results: list[SearchResult] = []
         for i in range(len(results["ids"][0])):
@@ -128,17 +307,52 @@ class VectorStore:
         logger.info(f"검색 완료: '{query[:40]}...' → {len(search_results)}개 결과")
         return search_results
 
+    def keyword_search(
+        self, query: str, top_k: int | None = None, **filters: str | None
+    ) -> list[SearchResult]:
+        """BM25 키워드 검색을 수행한다. 임베딩 모델을 사용하지 않는다.
+
+        filters: language / path_prefix / path_contains (KeywordIndex.search 참고)
+        """
+        if not query.strip():
+            return []
+        return self.keywords.search(query, top_k or self._config.rag.search_top_k, **filters)
+
     def delete_by_file(self, file_path: str) -> None:
         """특정 파일의 모든 청크를 삭제한다 (증분 인덱싱용)."""
         self.collection.delete(where={"file_path": file_path})
+        self.keywords.delete_file(file_path)
+        self._invalidate_results()
         logger.info(f"삭제 완료: {file_path}")
 
+    def delete_by_ids(self, chunk_ids: list[str]) -> None:
+        """청크 ID 목록으로 삭제한다 (매니페스트 기반 증분 인덱싱용)."""
+        if not chunk_ids:
+            return
+        self.collection.delete(ids=chunk_ids)
+        self.keywords.delete_ids(chunk_ids)
+        self._invalidate_results()
+
+    def count(self) -> int:
+        """저장된 전체 청크 수를 반환한다."""
+        return self.collection.count()
+
+    def keyword_count(self) -> int:
+        """키워드 색인에 저장된 청크 수를 반환한다."""
+        return self.keywords.count()
+
     def get_stats(self) -> dict:
         """벡터 DB 통계를 반환한다."""
         count = self.collection.count()
         return {
             "collection_name": self._config.rag.collection_name,
             "total_chunks": count,
+            "keyword_chunks": self.keywords.count(),
+            "generation": self.generation(),
+            "cache": {
+                "query_embedding": self._query_embeddings.stats(),
+                "result": self.result_cache.stats(),
+            },
             "db_path": str(self._config.paths.chroma_db_path),
         }
 
@@ -146,4 +360,74 @@ class VectorStore:
         """컬렉션을 완전히 초기화한다. 주의: 모든 데이터가 삭제됨."""
         self.client.delete_collection(self._config.rag.collection_name)
         self._collection = None
+        self.keywords.clear()
+        self._invalidate_results()
         logger.warning("컬렉션 초기화 완료 - 모든 데이터 삭제됨")
+
+
+class BulkWriter:
+    """청크를 버퍼링했다가 고정 크기 배치로 upsert하는 쓰기 버퍼.
+
+    사용 예:
+        with store.bulk_writer() as writer:
+            for chunks in per_file_chunks:
+                writer.add(chunks, on_stored=lambda: manifest.record(...))
+
+    on_stored는 그때까지 추가된 청크가 모두 저장된 뒤에만 호출된다.
+    한 배치라도 저장이 실패하면 이후 콜백은 호출되지 않으므로
+    매니페스트 기록 같은 후속 처리를 저장 성공 뒤로 미룰 수 있다.
+    """
+
+    def __init__(self, store: VectorStore, batch_size: int) -> None:
+        self._store = store
+        self._batch_size = batch_size
+        self._buffer: list[CodeChunk] = []
+        self._added = 0
+        # (저장이 끝나야 하는 누적 청크 수, 콜백)
+        self._callbacks: deque[tuple[int, Callable[[], None]]] = deque()
+        self._failed = False
+        self.written = 0
+
+    def add(
+        self, chunks: list[CodeChunk], on_stored: Callable[[], None] | None = None
+    ) -> None:
+        """청크를 버퍼에 추가하고 배치가 차면 저장한다."""
+        self._buffer.extend(chunks)
+        self._added += len(chunks)
+        if on_stored is not None and not self._failed:
+            self._callbacks.append((self._added, on_stored))
+        while len(self._buffer) >= self._batch_size:
+            batch = self._buffer[: self._batch_size]
+            self._buffer = self._buffer[self._batch_size :]
+            self._write(batch)
+        self._notify()
+
+    def flush(self) -> None:
+        """남은 버퍼를 모두 저장한다."""
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._write(batch)
+        self._notify()
+
+    def _write(self, batch: list[CodeChunk]) -> None:
+        try:
+            self._store._upsert_batch(batch)
+        except Exception:
+            # 실패한 배치 뒤의 누적 수는 더 이상 저장 여부를 나타내지 않는다
+            self._failed = True
+            self._callbacks.clear()
+            raise
+        self.written += len(batch)
+
+    def _notify(self) -> None:
+        """저장이 끝난 청크까지의 콜백을 추가 순서대로 호출한다."""
+        while self._callbacks and self._callbacks[0][0] <= self.written:
+            self._callbacks.popleft()[1]()
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+        if self.written:
+            logger.info(f"청크 {self.written}개 일괄 저장 완료")
@@ -0,0 +1,227 @@
+"""Task 2.3 - 파일 변경 감시 데몬 (`vibe-x watch`).
+
+watchdog으로 프로젝트 파일 저장/삭제/이동을 감지하여 CodebaseIndexer.index_file로
+즉시 증분 인덱싱한다. 에디터의 연속 저장이나 포매터 재저장처럼 짧은 시간에 몰리는
+이벤트는 파일별로 모아(debounce) 마지막 저장 후 한 번만 처리한다.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.file_walker import is_path_ignored, walk_files
+from src.shared.logger import get_logger
+from src.layer2_rag.indexer import CodebaseIndexer
+
+logger = get_logger("watcher")
+
+# 대기 중인 변경이 없을 때 종료 요청을 확인하는 간격
+IDLE_POLL_SECONDS = 0.5
+
+
+class ChangeDebouncer:
+    """파일별 변경 이벤트를 모아 조용해진 파일만 내보낸다.
+
+    - 마지막 이벤트 후 quiet_seconds 동안 추가 이벤트가 없으면 처리 대상
+    - 이벤트가 계속 이어져도 첫 이벤트 후 max_delay_seconds가 지나면 처리 대상
+    """
+
+    def __init__(
+        self,
+        quiet_seconds: float,
+        max_delay_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._quiet = quiet_seconds
+        self._max_delay = max(max_delay_seconds, quiet_seconds)
+        self._clock = clock
+        self._pending: dict[str, tuple[float, float]] = {}  # path → (첫 이벤트, 마지막 이벤트)
+        self._cond = threading.Condition()
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, path: str) -> None:
+        """변경 이벤트를 기록한다. 이미 대기 중인 파일이면 합친다."""
+        now = self._clock()
+        with self._cond:
+            first, _ = self._pending.get(path, (now, now))
+            if path in self._pending:
+                self.coalesced += 1
+            self._pending[path] = (first, now)
+            self._cond.notify()
+
+    def pop_ready(self) -> list[str]:
+        """처리할 시점이 된 파일을 꺼낸다."""
+        now = self._clock()
+        with self._cond:
+            ready = [p for p, times in self._pending.items() if self._due(times) <= now]
+            for path in ready:
+                del self._pending[path]
+        return sorted(ready)
+
+    def wait(self, timeout: float) -> None:
+        """다음 처리 시점 또는 새 이벤트까지 최대 timeout초 대기한다."""
+        with self._cond:
+            if self._pending:
+                due = min(self._due(t) for t in self._pending.values())
+                timeout = min(timeout, max(0.0, due - self._clock()))
+            self._cond.wait(timeout)
+
+    def wake(self) -> None:
+        """대기 중인 스레드를 깨운다 (종료용)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _due(self, times: tuple[float, float]) -> float:
+        first, last = times
+        return min(last + self._quiet, first + self._max_delay)
+
+
+class _IndexEventHandler(FileSystemEventHandler):
+    """watchdog 이벤트를 인덱싱 대상 경로로 변환하여 debouncer에 넣는다."""
+
+    def __init__(self, watcher: "IndexWatcher") -> None:
+        self._watcher = watcher
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        if not event.is_directory:
+            self._watcher.notify(event.src_path)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        if not event.is_directory:
+            self._watcher.notify(event.src_path)
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        if event.is_directory:
+            self._watcher.notify_tree(event.src_path)
+        else:
+            self._watcher.notify(event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        if event.is_directory:
+            self._watcher.notify_tree(event.src_path)
+            self._watcher.notify_tree(event.dest_path)
+        else:
+            self._watcher.notify(event.src_path)
+            self._watcher.notify(event.dest_path)
+
+
+class IndexWatcher:
+    """프로젝트 디렉토리를 감시하며 변경 파일을 증분 인덱싱한다.
+
+    사용 예:
+        watcher = IndexWatcher(config)
+        watcher.run(Path("."))  # Ctrl+C로 종료
+    """
+
+    def __init__(
+        self,
+        config: VibeXConfig | None = None,
+        indexer: CodebaseIndexer | None = None,
+        debouncer: ChangeDebouncer | None = None,
+    ) -> None:
+        self._config = config or load_config()
+        self._indexer = indexer or CodebaseIndexer(self._config)
+        if debouncer is None:
+            debouncer = ChangeDebouncer(
+                self._config.rag.watch_debounce_seconds,
+                self._config.rag.watch_max_delay_seconds,
+            )
+        self._debouncer = debouncer
+        paths = self._config.paths
+        # VIBE-X 자신이 쓰는 파일은 감시에서 제외 (매니페스트 저장 → 재인덱싱 루프 방지,
+        # .state/의 대시보드 metrics.json 등은 수시로 다시 쓰인다)
+        self._state_prefixes = tuple(
+            str(p.resolve())
+            for p in (
+                paths.index_manifest_path,
+                paths.keyword_index_path,
+                paths.chroma_db_path,
+                paths.vibe_x_root / ".state",
+            )
+        )
+        self._root = self._config.paths.project_root.resolve()
+        self._stop = threading.Event()
+        self.indexed_files = 0
+        self.removed_files = 0
+
+    def notify(self, path: str) -> None:
+        """파일 변경을 알린다. 인덱싱 대상이 아니면 무시한다."""
+        file_path = Path(path).resolve()
+        if str(file_path).startswith(self._state_prefixes):
+            return
+        if not self._indexer.is_supported(file_path):
+            return
+        if self._config.rag.respect_gitignore and is_path_ignored(self._root, file_path):
+            return
+        self._debouncer.add(str(file_path))
+
+    def notify_tree(self, path: str) -> None:
+        """디렉토리 삭제/이동: 인덱싱돼 있던 파일과 현재 디스크의 파일을 모두 다시 확인한다."""
+        root = Path(path).resolve()
+        for indexed in self._indexer.indexed_paths_under(root):
+            self.notify(indexed)
+        if root.is_dir():
+            rag = self._config.rag
+            for item in walk_files(
+                root, rag.supported_extensions, rag.ignored_dirs, use_gitignore=False
+            ):
+                self.notify(str(item))
+
+    def process_pending(self) -> int:
+        """조용해진 파일을 인덱싱한다. 처리한 파일 수를 반환한다."""
+        ready = self._debouncer.pop_ready()
+        for path in ready:
+            file_path = Path(path)
+            try:
+                count = self._indexer.index_file(file_path)
+            except Exception as e:
+                logger.warning(f"재인덱싱 실패 - {path}: {e}")
+                continue
+            if file_path.exists():
+                self.indexed_files += 1
+                logger.info(f"재인덱싱: {path} ({count}개 청크)")
+            else:
+                self.removed_files += 1
+                logger.info(f"인덱스에서 제거: {path}")
+        return len(ready)
+
+    def run(self, root: Path, sync: bool = True) -> None:
+        """감시를 시작하고 stop()이 호출될 때까지 블로킹한다.
+
+        Args:
+            root: 감시할 디렉토리
+            sync: True면 감시 전에 증분 인덱싱으로 현재 상태를 맞춘다
+        """
+        root = root.resolve()
+        self._root = root
+        if sync:
+            self._indexer.index_project(root)
+
+        observer = Observer()
+        observer.schedule(_IndexEventHandler(self), str(root), recursive=True)
+        observer.start()
+        logger.info(f"파일 감시 시작: {root}")
+        try:
+            while not self._stop.is_set():
+                self._debouncer.wait(IDLE_POLL_SECONDS)
+                self.process_pending()
+        finally:
+            observer.stop()
+            observer.join()
+            logger.info(
+                f"파일 감시 종료 - 재인덱싱: {self.indexed_files}, "
+                f"제거: {self.removed_files}, 병합된 이벤트: {self._debouncer.coalesced}"
+            )
+
+    def stop(self) -> None:
+        """run() 루프를 종료한다."""
+        self._stop.set()
+        self._debouncer.wake()
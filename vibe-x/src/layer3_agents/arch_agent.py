@@ -7,6 +7,7 @@ import re
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.file_context import FileAnalysisContext
 from src.shared.logger import get_logger
 from src.shared.types import GateResult, GateStatus
 
@@ -32,18 +33,19 @@ class ArchitectureAgent:
     def __init__(self, config: VibeXConfig | None = None) -> None:
         self._config = config or load_config()
 
-    def run(self, file_path: Path) -> GateResult:
-        """Gate 5를 실행한다."""
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError as e:
+    def run(self, file_path: Path, context: FileAnalysisContext | None = None) -> GateResult:
+        """Gate 5를 실행한다. context를 주면 파일을 다시 읽지 않는다."""
+        context = context or FileAnalysisContext.from_path(file_path)
+        if context.read_error is not None:
             return GateResult(
                 gate_number=5,
                 gate_name="Architecture Agent",
                 status=GateStatus.SKIPPED,
-                message=f"파일 읽기 실패: {e}",
+                message=f"파일 읽기 실패: {context.read_error}",
             )
 
+        content = context.content
+
         issues: list[str] = []
 
         # 1. Layer 의존성 검사
@@ -0,0 +1,302 @@
+"""Task 3.2 - 테스트 커버리지 맵.
+
+테스트마다 실행한 소스 라인과 함수를 기록해 두고(.state/coverage-map.json),
+Gate 3이 변경 hunk와 겹치는 테스트만 골라 실행하게 한다.
+기록은 sys.settrace로 전체 스위트를 돌리므로 느리다. `python cli.py coverage-map`으로
+따로 실행하고, gate.coverage_selection을 켜면 Gate 3이 이 맵을 사용한다.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.file_context import FileAnalysisContext, FunctionSpan
+from src.shared.logger import get_logger
+
+logger = get_logger("coverage-map")
+
+MAP_VERSION = 1
+RECORDER_SCRIPT = Path(__file__).with_name("coverage_recorder.py")
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass
+class Hunk:
+    """git diff -U0의 hunk 하나 (count 0은 삭제 또는 순수 추가)."""
+
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+
+    def old_lines(self) -> range:
+        return range(self.old_start, self.old_start + max(self.old_count, 1))
+
+    def new_lines(self) -> range:
+        return range(self.new_start, self.new_start + max(self.new_count, 1))
+
+
+@dataclass
+class CoverageSelection:
+    """커버리지 맵 기반 테스트 선별 결과."""
+
+    # 테스트 파일 → 실행할 테스트 (nodeid의 파일 뒤 부분, 예: "TestA::test_b")
+    tests: dict[Path, list[str]] = field(default_factory=dict)
+    # 변경된 테스트 파일 (새 테스트가 있을 수 있으므로 전체 실행)
+    whole_files: list[Path] = field(default_factory=list)
+    # 맵으로 판단할 수 없는 변경 파일 (맵에 없음, git 사용 불가)
+    unresolved: list[Path] = field(default_factory=list)
+
+    @property
+    def test_count(self) -> int:
+        return sum(len(names) for names in self.tests.values())
+
+
+def changed_hunks(root: Path, file_path: Path, base: str = "HEAD") -> list[Hunk]:
+    """base 커밋과 작업 트리 사이의 변경 hunk. git을 쓸 수 없으면 RuntimeError."""
+    try:
+        result = subprocess.run(
+            ["git", "diff", "-U0", "--no-color", "--no-ext-diff", base, "--", str(file_path)],
+            cwd=str(root),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        raise RuntimeError(f"git diff 실행 실패: {e}") from e
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "git diff 실패")
+
+    hunks: list[Hunk] = []
+    for line in result.stdout.splitlines():
+        match = _HUNK_HEADER.match(line)
+        if match:
+            old_start, old_count, new_start, new_count = match.groups()
+            hunks.append(Hunk(
+                int(old_start),
+                1 if old_count is None else int(old_count),
+                int(new_start),
+                1 if new_count is None else int(new_count),
+            ))
+    return hunks
+
+
+def enclosing_function(spans: list[FunctionSpan], line: int) -> str | None:
+    """line을 포함하는 가장 안쪽 함수의 qualname. 모듈/클래스 본문이면 None."""
+    best: FunctionSpan | None = None
+    for span in spans:
+        if span.start <= line <= span.end and (best is None or span.start >= best.start):
+            best = span
+    return best.qualname if best else None
+
+
+def _is_test_file(path: Path) -> bool:
+    return path.name.startswith("test_") or path.name.endswith("_test.py")
+
+
+def _git_head(root: Path) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=str(root), capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+class CoverageMap:
+    """테스트 → 실행 라인/함수 맵. 변경 hunk로 실행할 테스트를 고른다.
+
+    사용 예:
+        coverage = CoverageMap(config)
+        coverage.record()                    # 전체 테스트를 추적 실행하여 맵 기록
+        selection = coverage.select(changed_files)
+    """
+
+    def __init__(self, config: VibeXConfig | None = None) -> None:
+        self._config = config or load_config()
+        self._root = self._config.paths.project_root.resolve()
+        self._path = self._config.paths.coverage_map_path
+        self._data: dict | None = None
+
+    @property
+    def available(self) -> bool:
+        """이 프로젝트 루트에서 기록된 맵이 있는지."""
+        return bool(self._load().get("tests"))
+
+    def record(
+        self, targets: list[str] | None = None, timeout: float | None = None
+    ) -> dict:
+        """테스트를 추적 실행하여 맵을 기록한다.
+
+        Args:
+            targets: pytest 대상 (기본: tests)
+            timeout: 전체 기록 제한 시간(초). None이면 제한 없음.
+
+        Returns:
+            {"tests": 기록한 테스트 수, "files": 파일 수, "returncode": pytest 종료 코드}
+        """
+        raw_path = self._path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.raw")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        cmd = [
+            sys.executable,
+            str(RECORDER_SCRIPT),
+            str(raw_path),
+            str(self._root),
+            json.dumps(list(self._config.rag.ignored_dirs)),
+            *(targets or ["tests"]),
+        ]
+        try:
+            result = subprocess.run(
+                cmd, cwd=str(self._root), capture_output=True, text=True,
+                encoding="utf-8", errors="replace", timeout=timeout,
+            )
+            if not raw_path.exists():
+                tail = (result.stderr or result.stdout).strip().splitlines()[-5:]
+                raise RuntimeError("커버리지 기록 실패: " + " / ".join(tail))
+            raw = json.loads(raw_path.read_text(encoding="utf-8"))
+        finally:
+            raw_path.unlink(missing_ok=True)
+
+        data = self._build(raw["tests"])
+        self._save(data)
+        logger.info(f"커버리지 맵 기록: 테스트 {len(data['tests'])}개, 파일 {len(data['files'])}개")
+        return {
+            "tests": len(data["tests"]),
+            "files": len(data["files"]),
+            "returncode": raw["returncode"],
+        }
+
+    def _build(self, raw_tests: dict[str, dict[str, list[int]]]) -> dict:
+        """테스트별 라인 기록을 파일별 역색인(라인/함수 → 테스트 번호)으로 바꾼다."""
+        tests = sorted(raw_tests)
+        files: dict[str, dict] = {}
+        spans: dict[str, list[FunctionSpan]] = {}
+        for index, test_id in enumerate(tests):
+            for rel, lines in raw_tests[test_id].items():
+                entry = files.setdefault(
+                    rel, {"module": set(), "lines": defaultdict(set), "functions": defaultdict(set)}
+                )
+                if rel not in spans:
+                    spans[rel] = FileAnalysisContext.from_path(self._root / rel).function_spans
+                entry["module"].add(index)
+                for line in lines:
+                    entry["lines"][line].add(index)
+                    name = enclosing_function(spans[rel], line)
+                    if name is not None:
+                        entry["functions"][name].add(index)
+
+        return {
+            "version": MAP_VERSION,
+            "root": str(self._root),
+            "commit": _git_head(self._root),
+            "recorded_at": datetime.now().isoformat(),
+            "tests": tests,
+            "files": {
+                rel: {
+                    "module": sorted(entry["module"]),
+                    "lines": {str(k): sorted(v) for k, v in entry["lines"].items()},
+                    "functions": {k: sorted(v) for k, v in entry["functions"].items()},
+                }
+                for rel, entry in files.items()
+            },
+        }
+
+    def select(self, changed_files: list[Path]) -> CoverageSelection:
+        """변경 hunk와 겹치는 테스트를 고른다.
+
+        삭제·수정된 라인(기록 시점 기준)을 실행한 테스트와, 변경 라인을 포함하는 함수를
+        실행한 테스트를 합친다. 모듈/클래스 본문이 바뀌면 그 파일을 실행한 모든 테스트를 고른다.
+        """
+        data = self._load()
+        base = data.get("commit") or "HEAD"
+        selection = CoverageSelection()
+        indices: set[int] = set()
+
+        for path in changed_files:
+            try:
+                rel = path.resolve().relative_to(self._root).as_posix()
+            except ValueError:
+                selection.unresolved.append(path)
+                continue
+            if _is_test_file(path):
+                selection.whole_files.append(path)
+                continue
+            entry = data.get("files", {}).get(rel)
+            if entry is None:
+                selection.unresolved.append(path)
+                continue
+            try:
+                hunks = changed_hunks(self._root, path, base)
+            except RuntimeError as e:
+                logger.debug(f"git diff 실패, 그래프 선별로 대체: {rel} ({e})")
+                selection.unresolved.append(path)
+                continue
+            indices |= self._tests_for_hunks(entry, hunks, path)
+
+        tests = data.get("tests", [])
+        grouped: dict[Path, list[str]] = defaultdict(list)
+        for index in sorted(indices):
+            file_part, _, name = tests[index].partition("::")
+            grouped[self._root / file_part].append(name)
+        selection.tests = dict(grouped)
+        return selection
+
+    def _tests_for_hunks(self, entry: dict, hunks: list[Hunk], path: Path) -> set[int]:
+        module_tests = set(entry["module"])
+        if not hunks:
+            # 기준 커밋과 같거나 추적되지 않는 파일: 파일을 실행한 테스트 전부
+            return module_tests
+        context = FileAnalysisContext.from_path(path)
+        if context.tree is None:
+            return module_tests
+        spans = context.function_spans
+
+        result: set[int] = set()
+        for hunk in hunks:
+            for line in hunk.old_lines():
+                result.update(entry["lines"].get(str(line), ()))
+            for line in hunk.new_lines():
+                name = enclosing_function(spans, line)
+                if name is None:
+                    return module_tests
+                result.update(entry["functions"].get(name, ()))
+        return result
+
+    def _load(self) -> dict:
+        """저장된 맵을 읽는다. 버전이나 루트가 다르면 빈 맵."""
+        if self._data is not None:
+            return self._data
+        self._data = {}
+        if not self._path.exists():
+            return self._data
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"커버리지 맵 로드 실패: {e}")
+            return self._data
+        if data.get("version") == MAP_VERSION and data.get("root") == str(self._root):
+            self._data = data
+        return self._data
+
+    def _save(self, data: dict) -> None:
+        tmp_path = self._path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self._path)
+        except OSError as e:
+            logger.warning(f"커버리지 맵 저장 실패: {e}")
+            return
+        self._data = data
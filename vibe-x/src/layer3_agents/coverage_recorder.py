@@ -0,0 +1,97 @@
+"""Task 3.2 - 테스트별 실행 라인 기록기 (pytest 플러그인).
+
+CoverageMap.record()가 별도 프로세스에서 이 파일을 스크립트로 실행한다.
+대상 프로젝트의 `src` 패키지와 섞이지 않도록 표준 라이브러리와 pytest만 사용한다.
+
+    python coverage_recorder.py <출력 JSON> <프로젝트 루트> <제외 디렉토리 JSON> [pytest 인자...]
+"""
+
+import json
+import os
+import sys
+import threading
+
+
+class LineRecorder:
+    """테스트 하나(setup~teardown)가 실행한 프로젝트 파일의 라인을 sys.settrace로 기록한다."""
+
+    def __init__(self, root: str, ignored_dirs: list[str]) -> None:
+        self._root = os.path.realpath(root)
+        self._prefix = os.path.join(self._root, "")
+        self._ignored = set(ignored_dirs) | {"site-packages"}
+        self._relatives: dict[str, str | None] = {}
+        self._ids: dict[str, str] = {}
+        self._current: dict[str, set[int]] | None = None
+        # 루트 기준 테스트 ID → {루트 기준 파일 경로: [라인]}
+        self.tests: dict[str, dict[str, list[int]]] = {}
+
+    def _relative(self, filename: str) -> str | None:
+        """프로젝트 파일이면 루트 기준 POSIX 경로, 아니면 None (코드 객체 파일명별 캐시)."""
+        try:
+            return self._relatives[filename]
+        except KeyError:
+            pass
+        rel = None
+        path = os.path.realpath(filename)
+        if path.endswith(".py") and path.startswith(self._prefix):
+            rel = path[len(self._prefix):].replace(os.sep, "/")
+            if any(part in self._ignored for part in rel.split("/")[:-1]):
+                rel = None
+        self._relatives[filename] = rel
+        return rel
+
+    def _trace(self, frame, event, arg):
+        current = self._current
+        if current is None:
+            return None
+        rel = self._relative(frame.f_code.co_filename)
+        if rel is None:
+            return None
+        lines = current.setdefault(rel, set())
+        lines.add(frame.f_lineno)
+
+        def local(frame, event, arg):
+            if event == "line":
+                lines.add(frame.f_lineno)
+            return local
+
+        return local
+
+    def pytest_collection_modifyitems(self, items) -> None:
+        """nodeid(rootdir 기준)를 프로젝트 루트 기준 ID로 바꿔 둔다."""
+        for item in items:
+            rel = self._relative(str(item.path))
+            if rel is None:
+                continue
+            _, _, name = item.nodeid.partition("::")
+            self._ids[item.nodeid] = f"{rel}::{name}" if name else rel
+
+    def pytest_runtest_logstart(self, nodeid, location) -> None:
+        self._current = {}
+        threading.settrace(self._trace)
+        sys.settrace(self._trace)
+
+    def pytest_runtest_logfinish(self, nodeid, location) -> None:
+        sys.settrace(None)
+        threading.settrace(None)
+        current, self._current = self._current, None
+        if current:
+            test_id = self._ids.get(nodeid, nodeid)
+            self.tests[test_id] = {rel: sorted(lines) for rel, lines in current.items()}
+
+
+def main(argv: list[str]) -> int:
+    output, root, ignored, *pytest_args = argv
+    # 스크립트 디렉토리 대신 `python -m pytest`처럼 작업 디렉토리를 import 경로에 둔다
+    sys.path[0] = os.getcwd()
+    import pytest
+
+    recorder = LineRecorder(root, json.loads(ignored))
+    code = pytest.main(["-q", "-p", "no:cacheprovider", *pytest_args], plugins=[recorder])
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"returncode": int(code), "tests": recorder.tests}, f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
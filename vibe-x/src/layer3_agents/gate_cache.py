@@ -0,0 +1,282 @@
+"""Task 3.6 - Gate 결과 캐시 (내용 주소 기반).
+
+VS Code 확장은 저장할 때마다 Gate를 다시 실행하지만, 내용이 그대로인 파일의
+Gate 1, 2, 4, 5 결과는 항상 같다. 이 모듈은 결과를 SQLite에 저장하고
+(파일 내용 해시, 경로, Gate 번호, Gate 설정/규칙 파일/Gate 코드 지문)으로 찾는다.
+설정, coding-rules.md, Gate 구현이 바뀌면 지문이 달라져 이전 결과는 자연히 쓰이지 않고
+LRU 제거로 정리된다. 적중/미스 횟수도 함께 저장하여 MetricsCollector에 노출한다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.file_context import FileAnalysisContext
+from src.shared.logger import get_logger
+from src.shared.types import GateResult, GateStatus
+
+logger = get_logger("gate-cache")
+
+# 캐시 가능한 Gate와 그 구현 모듈 (모듈 소스가 바뀌면 지문이 바뀐다)
+CACHEABLE_GATES: dict[int, tuple[str, ...]] = {
+    1: ("src/layer2_rag/gate_basic.py",),
+    2: ("src/layer2_rag/gate_basic.py", "src/shared/literal_matcher.py"),
+    4: ("src/layer3_agents/review_agent.py", "src/layer3_agents/review_rules.py"),
+    5: ("src/layer3_agents/arch_agent.py",),
+}
+
+# 모든 Gate 결과에 영향을 주는 공용 모듈 (파일 디코딩)
+SHARED_SOURCES = ("src/shared/file_context.py",)
+
+# 저장 형식 변경 시 증가
+CACHE_VERSION = 1
+
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        key TEXT PRIMARY KEY,
+        gate INTEGER NOT NULL,
+        result TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        last_used REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS results_last_used ON results(last_used)",
+    """
+    CREATE TABLE IF NOT EXISTS stats (
+        gate INTEGER PRIMARY KEY,
+        hits INTEGER NOT NULL DEFAULT 0,
+        misses INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+)
+
+
+def _stat_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+class GateResultCache:
+    """Gate 결과의 영속 캐시. 여러 스레드에서 함께 사용할 수 있다.
+
+    사용 예:
+        cache = GateResultCache(config)
+        result = cache.get_or_run(4, context, lambda: agent.run(path, context))
+    """
+
+    def __init__(self, config: VibeXConfig | None = None) -> None:
+        self._config = config or load_config()
+        self._path = self._config.paths.gate_cache_path
+        self._max_entries = self._config.gate.cache_max_entries
+        self._max_bytes = self._config.gate.cache_max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # 지문 입력 파일: 규칙 파일 + 공용 모듈 + Gate 구현 모듈
+        self._sources = [self._config.paths.coding_rules_path] + [
+            _SOURCE_ROOT / module
+            for module in dict.fromkeys(
+                (*SHARED_SOURCES, *(m for ms in CACHEABLE_GATES.values() for m in ms))
+            )
+        ]
+        self._stamp: tuple | None = None
+        self._fingerprints: dict[int, str] = {}
+
+    def _fingerprint(self, gate_number: int) -> str:
+        """Gate별 설정 지문: 캐시 버전 + Gate 설정 + 규칙 파일 + Gate 구현 소스.
+
+        대시보드처럼 오래 실행되는 프로세스에서도 규칙 파일 변경을 반영하도록
+        입력 파일의 mtime/크기가 바뀌면 다시 계산한다.
+        """
+        stamp = tuple(_stat_stamp(path) for path in self._sources)
+        if stamp != self._stamp:
+            digests = {path: _file_digest(path) for path in self._sources}
+            base = hashlib.sha256(f"{CACHE_VERSION}\0{self._config.gate!r}".encode())
+            for path in self._sources[: 1 + len(SHARED_SOURCES)]:
+                base.update(f"\0{digests[path]}".encode())
+            self._fingerprints = {
+                gate: hashlib.sha256(
+                    "\0".join(
+                        [base.hexdigest(), str(gate)]
+                        + [digests[_SOURCE_ROOT / module] for module in modules]
+                    ).encode()
+                ).hexdigest()
+                for gate, modules in CACHEABLE_GATES.items()
+            }
+            self._stamp = stamp
+        return self._fingerprints[gate_number]
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite 연결을 지연 초기화한다."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def key(self, gate_number: int, context: FileAnalysisContext) -> str | None:
+        """캐시 키. 캐시할 수 없으면 None (지원하지 않는 Gate, 읽기 실패)."""
+        if gate_number not in CACHEABLE_GATES or context.read_error is not None:
+            return None
+        fingerprint = self._fingerprint(gate_number)
+        digest = hashlib.sha256()
+        # Gate 5와 일부 메시지는 경로에 의존하므로 경로도 키에 포함한다
+        for part in (fingerprint, str(context.path), str(context.decode_error is not None)):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        digest.update(context.content.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, gate_number: int, context: FileAnalysisContext) -> GateResult | None:
+        """캐시된 결과를 반환한다. 없으면 None. 적중/미스가 통계에 기록된다."""
+        key = self.key(gate_number, context)
+        if key is None:
+            return None
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+                )
+            column = "hits" if row is not None else "misses"
+            self.conn.execute(
+                f"INSERT INTO stats (gate, {column}) VALUES (?, 1) "
+                f"ON CONFLICT(gate) DO UPDATE SET {column} = {column} + 1",
+                (gate_number,),
+            )
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        return GateResult(
+            gate_number=gate_number,
+            gate_name=data["gate_name"],
+            status=GateStatus(data["status"]),
+            message=data["message"],
+            details=data["details"],
+        )
+
+    def put(self, context: FileAnalysisContext, result: GateResult) -> None:
+        """결과를 저장하고 한도를 넘으면 오래 쓰이지 않은 항목부터 제거한다."""
+        key = self.key(result.gate_number, context)
+        if key is None:
+            return
+        payload = json.dumps(
+            {
+                "gate_name": result.gate_name,
+                "status": result.status.value,
+                "message": result.message,
+                "details": result.details,
+            },
+            ensure_ascii=False,
+        )
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (key, gate, result, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, result.gate_number, payload, len(payload.encode()), time.time()),
+            )
+            self._evict()
+
+    def get_or_run(
+        self,
+        gate_number: int,
+        context: FileAnalysisContext,
+        run: Callable[[], GateResult],
+    ) -> GateResult:
+        """캐시에 있으면 바로 반환하고, 없으면 실행 후 저장한다."""
+        try:
+            cached = self.get(gate_number, context)
+        except sqlite3.Error as e:
+            logger.warning(f"Gate 캐시 조회 실패: {e}")
+            return run()
+        if cached is not None:
+            return cached
+        result = run()
+        try:
+            self.put(context, result)
+        except sqlite3.Error as e:
+            logger.warning(f"Gate 캐시 저장 실패: {e}")
+        return result
+
+    def _evict(self) -> None:
+        """항목 수/전체 크기 한도를 넘으면 LRU 순으로 제거한다. 호출자가 트랜잭션을 연다."""
+        count, total = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if count <= self._max_entries and total <= self._max_bytes:
+            return
+        victims: list[tuple[str]] = []
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM results ORDER BY last_used"
+        ):
+            if count <= self._max_entries and total <= self._max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        self.conn.executemany("DELETE FROM results WHERE key = ?", victims)
+        logger.debug(f"Gate 캐시 {len(victims)}개 항목 제거")
+
+    def stats(self) -> dict:
+        """적중률과 저장 크기. Gate별 적중/미스도 함께 반환한다."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT gate, hits, misses FROM stats ORDER BY gate"
+            ).fetchall()
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        hits = sum(r[1] for r in rows)
+        misses = sum(r[2] for r in rows)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses) * 100, 1) if hits + misses else 0,
+            "entries": entries,
+            "bytes": size,
+            "per_gate": {
+                gate: {
+                    "hits": h,
+                    "misses": m,
+                    "hit_rate": round(h / (h + m) * 100, 1) if h + m else 0,
+                }
+                for gate, h, m in rows
+            },
+        }
+
+    def clear(self) -> None:
+        """저장된 결과와 통계를 모두 지운다."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM results")
+            self.conn.execute("DELETE FROM stats")
+
+    def close(self) -> None:
+        """SQLite 연결을 닫는다."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
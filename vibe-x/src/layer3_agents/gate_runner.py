@@ -1,16 +1,32 @@
 """Task 3.6 - 6-Gate Chain Orchestrator.
 
-Gate 1~6 을 순차 실행하는 파이프라인.
+Gate 1~6 을 실행하는 파이프라인.
 각 Gate 실패 시 중단/경고/바이패스 정책을 적용한다.
+
+STOP 정책 Gate는 결과가 나올 때까지 뒤 Gate의 시작을 막는 장벽이 되고,
+그 사이의 WARN/BYPASS Gate들은 서로 독립적인 읽기 전용 분석이므로 병렬로 실행한다.
+기본 정책에서는 Gate 1 → Gate 2 → (Gate 3, 4, 5, 6 동시 실행) 순서가 된다.
+결과는 항상 Gate 번호 순으로 기록된다.
+
+대상 파일은 실행마다 한 번만 읽어 FileAnalysisContext로 Gate 1, 2, 4, 5에 공유하고,
+내용이 바뀌지 않은 파일의 Gate 1, 2, 4, 5 결과는 GateResultCache에서 가져온다.
+
+배치 모드(run_batch)는 커밋 단위 변경 파일 묶음을 검증한다. 파일별 Gate(1, 2, 4, 5)는
+파일 간 병렬로 실행하고, 변경 세트 전체를 보는 Gate 3(테스트)과 6(충돌)은 한 번만 실행한다.
 """
 
+import functools
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.file_context import FileAnalysisContext
 from src.shared.logger import get_logger
 from src.shared.types import GateResult, GateStatus
 
@@ -31,6 +47,7 @@ class PipelineResult:
     total_time_seconds: float = 0.0
     stopped_at: int | None = None
     overall_status: GateStatus = GateStatus.PASSED
+    gate_timings: dict[int, float] = field(default_factory=dict)  # Gate별 실행 시간(초)
 
     @property
     def summary(self) -> str:
@@ -44,6 +61,38 @@ class PipelineResult:
         )
 
 
+@dataclass
+class BatchPipelineResult:
+    """배치 파이프라인 결과: 파일별 결과 + 변경 세트 Gate(3, 6) 결과."""
+    file_results: dict[str, PipelineResult] = field(default_factory=dict)
+    changeset_result: PipelineResult = field(default_factory=PipelineResult)
+    total_time_seconds: float = 0.0
+    overall_status: GateStatus = GateStatus.PASSED
+
+    @property
+    def stopped_files(self) -> list[str]:
+        """STOP 정책 Gate에서 중단된 파일 (Gate 3, 6 대상에서 제외됨)."""
+        return [f for f, r in self.file_results.items() if r.stopped_at is not None]
+
+    @property
+    def gate_results(self) -> list[GateResult]:
+        """파일별 + 변경 세트 Gate 결과 전체."""
+        results = [g for r in self.file_results.values() for g in r.gate_results]
+        return results + self.changeset_result.gate_results
+
+    @property
+    def summary(self) -> str:
+        counts = {status: 0 for status in GateStatus}
+        for g in self.gate_results:
+            counts[g.status] += 1
+        return (
+            f"파일:{len(self.file_results)} 중단:{len(self.stopped_files)} / "
+            f"통과:{counts[GateStatus.PASSED]} 실패:{counts[GateStatus.FAILED]} "
+            f"경고:{counts[GateStatus.WARNING]} 스킵:{counts[GateStatus.SKIPPED]} / "
+            f"소요:{self.total_time_seconds:.1f}s"
+        )
+
+
 class GateChainRunner:
     """6-Gate 체인 오케스트레이터.
 
@@ -51,6 +100,7 @@ class GateChainRunner:
     -> 4 (Review Agent) -> 5 (Architecture Agent) -> 6 (Collision Agent)
 
     각 Gate에 대해 실패 정책(중단/경고/바이패스)을 설정할 수 있다.
+    STOP이 아닌 연속 Gate들은 병렬 실행된다 (config.gate.parallel_gates).
     """
 
     # 기본 실패 정책
@@ -66,6 +116,8 @@ class GateChainRunner:
     def __init__(self, config: VibeXConfig | None = None) -> None:
         self._config = config or load_config()
         self._policies = dict(self.DEFAULT_POLICIES)
+        self._cache = None
+        self._cache_lock = threading.Lock()
 
     def set_policy(self, gate_number: int, policy: FailPolicy) -> None:
         """특정 Gate의 실패 정책을 변경한다."""
@@ -94,53 +146,160 @@ class GateChainRunner:
             changed_files = [file_path]
 
         logger.info(f"6-Gate 파이프라인 시작: {file_path}")
+        context = FileAnalysisContext.from_path(file_path)
+
+        gates = sorted(
+            self._file_gates(file_path, context) + [
+                (3, lambda: self._run_gate_3(changed_files)),
+                (6, lambda: self._run_gate_6(changed_files, author)),
+            ],
+            key=lambda gate: gate[0],
+        )
+        completed = self._schedule(gates, result)
 
-        # Gate 1-2: Basic Gate (Phase 2에서 구현)
-        gate12_results = self._run_gate_1_2(file_path)
-        for gr in gate12_results:
-            result.gate_results.append(gr)
-            if not self._should_continue(gr, result):
-                result.total_time_seconds = time.time() - start
-                return result
-
-        # Gate 3: Integration Agent
-        gate3_result = self._run_gate_3(changed_files)
-        result.gate_results.append(gate3_result)
-        if not self._should_continue(gate3_result, result):
-            result.total_time_seconds = time.time() - start
-            return result
-
-        # Gate 4: Review Agent
-        gate4_result = self._run_gate_4(file_path)
-        result.gate_results.append(gate4_result)
-        if not self._should_continue(gate4_result, result):
-            result.total_time_seconds = time.time() - start
-            return result
-
-        # Gate 5: Architecture Agent
-        gate5_result = self._run_gate_5(file_path)
-        result.gate_results.append(gate5_result)
-        if not self._should_continue(gate5_result, result):
-            result.total_time_seconds = time.time() - start
-            return result
-
-        # Gate 6: Collision Agent
-        gate6_result = self._run_gate_6(changed_files, author)
-        result.gate_results.append(gate6_result)
-
-        # 최종 상태 결정
-        self._finalize(result)
+        if completed:
+            self._finalize(result)
         result.total_time_seconds = time.time() - start
 
         logger.info(f"파이프라인 완료 [{result.overall_status.value}]: {result.summary}")
         return result
 
-    def _run_gate_1_2(self, file_path: Path) -> list[GateResult]:
-        """Gate 1-2: 기본 품질 검사."""
+    def run_batch(self, files: list[Path], author: str = "current") -> BatchPipelineResult:
+        """변경 파일 묶음에 대해 파이프라인을 실행한다.
+
+        파일별 Gate(1, 2, 4, 5)는 config.gate.max_parallel_files개 파일씩 동시에 실행한다.
+        Gate 3, 6은 중단되지 않은 파일 전체를 대상으로 한 번만 실행한다
+        (단일 파일 체인에서도 Gate 1, 2에서 중단되면 Gate 3, 6까지 가지 않는다).
+
+        Args:
+            files: 검증 대상 파일 목록
+            author: 작업자 식별자 (Gate 6용)
+        """
+        start = time.time()
+        batch = BatchPipelineResult()
+        files = list(dict.fromkeys(files))
+        logger.info(f"배치 파이프라인 시작: {len(files)}개 파일")
+
+        workers = max(1, min(self._config.gate.max_parallel_files, len(files) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gate-file") as pool:
+            futures = [(f, pool.submit(self._run_file, f)) for f in files]
+            for file_path, future in futures:
+                batch.file_results[str(file_path)] = future.result()
+
+        stopped = set(batch.stopped_files)
+        remaining = [f for f in files if str(f) not in stopped]
+        changeset = batch.changeset_result
+        if remaining:
+            gates: list[tuple[int, Callable[[], GateResult]]] = [
+                (3, lambda: self._run_gate_3(remaining)),
+                (6, lambda: self._run_gate_6(remaining, author)),
+            ]
+            if self._schedule(gates, changeset):
+                self._finalize(changeset)
+
+        statuses = [r.overall_status for r in batch.file_results.values()]
+        if changeset.gate_results:
+            statuses.append(changeset.overall_status)
+        if GateStatus.FAILED in statuses:
+            batch.overall_status = GateStatus.FAILED
+        elif GateStatus.WARNING in statuses:
+            batch.overall_status = GateStatus.WARNING
+        batch.total_time_seconds = time.time() - start
+
+        logger.info(f"배치 파이프라인 완료 [{batch.overall_status.value}]: {batch.summary}")
+        return batch
+
+    def _run_file(self, file_path: Path) -> PipelineResult:
+        """파일 하나에 대해 파일별 Gate(1, 2, 4, 5)를 실행한다."""
+        start = time.time()
+        result = PipelineResult()
+        context = FileAnalysisContext.from_path(file_path)
+        if self._schedule(self._file_gates(file_path, context), result):
+            self._finalize(result)
+        result.total_time_seconds = time.time() - start
+        return result
+
+    def _file_gates(
+        self, file_path: Path, context: FileAnalysisContext
+    ) -> list[tuple[int, Callable[[], GateResult]]]:
+        """파일별 Gate(1, 2, 4, 5) 실행 목록. 결과 캐시가 켜져 있으면 캐시를 거친다."""
+        gates: list[tuple[int, Callable[[], GateResult]]] = [
+            (1, lambda: self._run_gate_1(file_path, context)),
+            (2, lambda: self._run_gate_2(file_path, context)),
+            (4, lambda: self._run_gate_4(file_path, context)),
+            (5, lambda: self._run_gate_5(file_path, context)),
+        ]
+        if not self._config.gate.cache_results:
+            return gates
+        cache = self._result_cache()
+        return [
+            (number, functools.partial(cache.get_or_run, number, context, run))
+            for number, run in gates
+        ]
+
+    def _result_cache(self):
+        """Gate 결과 캐시를 한 번만 만든다 (run_batch의 작업 스레드가 동시에 호출한다)."""
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    from src.layer3_agents.gate_cache import GateResultCache
+
+                    self._cache = GateResultCache(self._config)
+        return self._cache
+
+    def _schedule(
+        self,
+        gates: list[tuple[int, Callable[[], GateResult]]],
+        result: PipelineResult,
+    ) -> bool:
+        """Gate를 의존 관계에 맞춰 실행한다. 중단(STOP)되면 False.
+
+        STOP 정책 Gate를 제출한 뒤에는 그때까지 제출된 Gate 결과를 순서대로 수거하여
+        중단 여부를 확인하고, 통과한 경우에만 다음 Gate를 제출한다.
+        """
+        gate_config = self._config.gate
+        workers = gate_config.max_parallel_gates if gate_config.parallel_gates else 1
+        pending: list[tuple[int, Future]] = []
+
+        def drain() -> bool:
+            while pending:
+                gate_number, future = pending.pop(0)
+                gate_result, seconds = future.result()
+                result.gate_results.append(gate_result)
+                result.gate_timings[gate_number] = round(seconds, 3)
+                if not self._should_continue(gate_result, result):
+                    return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="gate") as pool:
+            for gate_number, run in gates:
+                pending.append((gate_number, pool.submit(self._timed, gate_number, run)))
+                if self._policies.get(gate_number, FailPolicy.WARN) == FailPolicy.STOP:
+                    if not drain():
+                        return False
+            return drain()
+
+    def _timed(
+        self, gate_number: int, run: Callable[[], GateResult]
+    ) -> tuple[GateResult, float]:
+        """Gate를 실행하고 (결과, 소요 시간)을 반환한다."""
+        start = time.perf_counter()
+        gate_result = run()
+        seconds = time.perf_counter() - start
+        logger.debug(f"Gate {gate_number} 완료: {seconds:.2f}s")
+        return gate_result, seconds
+
+    def _run_gate_1(self, file_path: Path, context: FileAnalysisContext) -> GateResult:
+        """Gate 1: 구문/타입 검사."""
+        from src.layer2_rag.gate_basic import BasicGate
+
+        return BasicGate(self._config).run_gate1(file_path, context)
+
+    def _run_gate_2(self, file_path: Path, context: FileAnalysisContext) -> GateResult:
+        """Gate 2: 코딩 규칙 검사."""
         from src.layer2_rag.gate_basic import BasicGate
 
-        gate = BasicGate(self._config)
-        return gate.run_all(file_path)
+        return BasicGate(self._config).run_gate2(file_path, context)
 
     def _run_gate_3(self, changed_files: list[Path]) -> GateResult:
         """Gate 3: 통합 테스트."""
@@ -149,19 +308,19 @@ class GateChainRunner:
         agent = IntegrationAgent(self._config)
         return agent.run(changed_files)
 
-    def _run_gate_4(self, file_path: Path) -> GateResult:
+    def _run_gate_4(self, file_path: Path, context: FileAnalysisContext) -> GateResult:
         """Gate 4: 코드 리뷰."""
         from src.layer3_agents.review_agent import ReviewAgent
 
         agent = ReviewAgent(self._config)
-        return agent.run(file_path)
+        return agent.run(file_path, context)
 
-    def _run_gate_5(self, file_path: Path) -> GateResult:
+    def _run_gate_5(self, file_path: Path, context: FileAnalysisContext) -> GateResult:
         """Gate 5: 아키텍처 검증."""
         from src.layer3_agents.arch_agent import ArchitectureAgent
 
         agent = ArchitectureAgent(self._config)
-        return agent.run(file_path)
+        return agent.run(file_path, context)
 
     def _run_gate_6(self, changed_files: list[Path], author: str) -> GateResult:
         """Gate 6: 충돌 감지."""
@@ -0,0 +1,252 @@
+"""Task 3.2 - import 의존성 그래프.
+
+Gate 3의 영향 범위 분석은 변경 모듈마다 src/ 전체를 다시 읽고 정규식을 돌렸다.
+이 모듈은 파일별 import 목록을 AST로 한 번 추출해 디스크에 저장하고,
+크기/mtime이 바뀐 파일만 다시 파싱하여 정방향/역방향 그래프를 유지한다.
+영향 범위와 관련 테스트 탐색은 메모리 안의 그래프 순회가 된다.
+"""
+
+import ast
+import json
+import os
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.file_walker import walk_files
+from src.shared.logger import get_logger
+
+logger = get_logger("import-graph")
+
+GRAPH_VERSION = 1
+DEFAULT_SCAN_DIRS = ("src", "tests")
+
+
+def module_name(rel_path: str) -> str:
+    """프로젝트 루트 기준 경로를 모듈 이름으로 변환한다 (패키지는 __init__ 제외)."""
+    parts = rel_path[: -len(".py")].split("/")
+    if parts[-1] == "__init__" and len(parts) > 1:
+        parts.pop()
+    return ".".join(parts)
+
+
+def parse_imports(content: str, module: str, is_package: bool) -> list[str]:
+    """파일이 import하는 모듈 이름 후보를 추출한다 (함수 안의 지연 import 포함).
+
+    `from a.b import c`는 `a.b`와 `a.b.c`를 모두 내보낸다. c가 모듈인지는
+    그래프 연결 시 실제 파일 존재 여부로 판단한다.
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return []
+
+    package = module.split(".") if is_package else module.split(".")[:-1]
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if node.level - 1 > len(package):
+                    continue
+                base_parts = package[: len(package) - (node.level - 1)]
+                if node.module:
+                    base_parts = base_parts + node.module.split(".")
+                base = ".".join(base_parts)
+            else:
+                base = node.module or ""
+            if base:
+                names.add(base)
+            for alias in node.names:
+                if alias.name != "*":
+                    names.add(f"{base}.{alias.name}" if base else alias.name)
+    return sorted(names)
+
+
+class ImportGraph:
+    """프로젝트 Python 파일의 정방향/역방향 import 그래프.
+
+    노드는 프로젝트 루트 기준 POSIX 상대 경로다.
+
+    사용 예:
+        graph = ImportGraph(config)
+        graph.refresh()                      # 변경된 파일만 다시 파싱
+        graph.dependents({"src/shared/config.py"}, max_depth=3)
+    """
+
+    def __init__(
+        self,
+        config: VibeXConfig | None = None,
+        scan_dirs: Iterable[str] = DEFAULT_SCAN_DIRS,
+    ) -> None:
+        self._config = config or load_config()
+        self._root = self._config.paths.project_root.resolve()
+        self._path = self._config.paths.import_graph_path
+        self._scan_dirs = tuple(scan_dirs)
+        # 상대 경로 → {"stamp": [mtime_ns, size], "imports": [...]}
+        self._files: dict[str, dict] = {}
+        self._modules: dict[str, str] = {}
+        self._forward: dict[str, set[str]] = {}
+        self._reverse: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, rel: str) -> bool:
+        return rel in self._files
+
+    def relative(self, file_path: Path) -> str | None:
+        """파일 경로를 그래프 노드(루트 기준 상대 경로)로 변환한다. 루트 밖이면 None."""
+        try:
+            return file_path.resolve().relative_to(self._root).as_posix()
+        except ValueError:
+            return None
+
+    def refresh(self) -> int:
+        """디스크와 그래프를 맞춘다. 다시 파싱하거나 제거한 파일 수를 반환한다."""
+        rag = self._config.rag
+        current: dict[str, Path] = {}
+        for name in self._scan_dirs:
+            directory = self._root / name
+            if not directory.is_dir():
+                continue
+            for path in walk_files(
+                directory,
+                extensions=(".py",),
+                ignored_dirs=rag.ignored_dirs,
+                use_gitignore=rag.respect_gitignore,
+            ):
+                current[path.relative_to(self._root).as_posix()] = path
+
+        with self._lock:
+            changed = 0
+            for rel in [rel for rel in self._files if rel not in current]:
+                del self._files[rel]
+                changed += 1
+            for rel, path in current.items():
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                stamp = [stat.st_mtime_ns, stat.st_size]
+                entry = self._files.get(rel)
+                if entry is not None and entry["stamp"] == stamp:
+                    continue
+                self._files[rel] = {"stamp": stamp, "imports": self._parse(rel, path)}
+                changed += 1
+
+            if changed:
+                self._link()
+                self._save()
+        if changed:
+            logger.debug(f"import 그래프 갱신: {changed}개 파일")
+        return changed
+
+    def _parse(self, rel: str, path: Path) -> list[str]:
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return []
+        return parse_imports(content, module_name(rel), rel.endswith("/__init__.py"))
+
+    def _link(self) -> None:
+        """파일별 import 이름을 실제 파일 간 간선으로 연결한다."""
+        self._modules = {module_name(rel): rel for rel in self._files}
+        forward: dict[str, set[str]] = {}
+        reverse: dict[str, set[str]] = {rel: set() for rel in self._files}
+        for rel, entry in self._files.items():
+            targets = {
+                self._modules[name]
+                for name in entry["imports"]
+                if name in self._modules and self._modules[name] != rel
+            }
+            forward[rel] = targets
+            for target in targets:
+                reverse[target].add(rel)
+        self._forward = forward
+        self._reverse = reverse
+
+    def imports_of(self, rel: str) -> set[str]:
+        """rel이 직접 import하는 파일."""
+        return set(self._forward.get(rel, ()))
+
+    def importers_of(self, rel: str) -> set[str]:
+        """rel을 직접 import하는 파일."""
+        return set(self._reverse.get(rel, ()))
+
+    def importers_of_modules(self, modules: Iterable[str]) -> set[str]:
+        """모듈 이름 목록 중 하나라도 직접 import하는 파일."""
+        result: set[str] = set()
+        for name in modules:
+            rel = self._modules.get(name)
+            if rel is not None:
+                result |= self._reverse.get(rel, set())
+        return result
+
+    def dependents(
+        self,
+        start: Iterable[str],
+        max_depth: int,
+        exclude_prefix: str | None = None,
+    ) -> dict[str, int]:
+        """start를 직·간접적으로 import하는 파일과 거리(단계 수)를 반환한다.
+
+        Args:
+            start: 시작 노드 (거리 0으로 포함된다)
+            max_depth: 최대 역방향 단계 수
+            exclude_prefix: 이 접두사로 시작하는 노드는 건너뛴다 (예: "tests/")
+        """
+        depths = {rel: 0 for rel in start}
+        frontier = list(depths)
+        for depth in range(1, max_depth + 1):
+            next_frontier: list[str] = []
+            for rel in frontier:
+                for importer in self._reverse.get(rel, ()):
+                    if importer in depths:
+                        continue
+                    if exclude_prefix and importer.startswith(exclude_prefix):
+                        continue
+                    depths[importer] = depth
+                    next_frontier.append(importer)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return depths
+
+    def _save(self) -> None:
+        """그래프를 디스크에 기록한다. 호출자가 lock을 잡는다."""
+        data = {
+            "version": GRAPH_VERSION,
+            "root": str(self._root),
+            "files": self._files,
+            "saved_at": datetime.now().isoformat(),
+        }
+        # 동시에 실행되는 Gate 3끼리 임시 파일이 겹치지 않도록 pid/스레드별 이름 사용
+        tmp_path = self._path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self._path)
+        except OSError as e:
+            logger.warning(f"import 그래프 저장 실패: {e}")
+
+    def _load(self) -> None:
+        """저장된 그래프를 복원한다. 버전이나 루트가 다르면 비운 채로 시작한다."""
+        if not self._path.exists():
+            return
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"import 그래프 로드 실패, 재구성: {e}")
+            return
+        if data.get("version") != GRAPH_VERSION or data.get("root") != str(self._root):
+            return
+        for rel, entry in data.get("files", {}).items():
+            if isinstance(entry.get("stamp"), list) and isinstance(entry.get("imports"), list):
+                self._files[rel] = entry
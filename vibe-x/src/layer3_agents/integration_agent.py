@@ -2,21 +2,28 @@
 
 기존 테스트 스위트를 자동 실행하고 영향 범위를 분석한다.
 변경 파일의 import 의존성을 추적하여 관련 테스트만 선별 실행한다.
+의존성은 영속 ImportGraph(src/, tests/)에서 역방향으로 순회한다.
+gate.coverage_selection이 켜져 있고 커버리지 맵이 기록되어 있으면
+변경 hunk를 실행한 테스트만 골라 실행한다 (맵에 없는 파일은 그래프로 선별).
+선별된 테스트는 PytestRunner로 한 번(또는 샤드별로) 실행한다.
 """
 
-import ast
 import re
-import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
 from src.shared.logger import get_logger
 from src.shared.types import GateResult, GateStatus
+from src.layer3_agents.coverage_map import CoverageMap
+from src.layer3_agents.import_graph import ImportGraph, module_name
+from src.layer3_agents.pytest_runner import PytestOutcome, PytestRunner
 
 logger = get_logger("gate3")
 
 MAX_TEST_TIMEOUT_SECONDS = 120
 MAX_IMPACT_DEPTH = 3
+TESTS_PREFIX = "tests/"
 
 
 class IntegrationAgent:
@@ -26,14 +33,33 @@ class IntegrationAgent:
     관련 테스트만 선별 실행하여 통과 여부를 검증한다.
     """
 
-    def __init__(self, config: VibeXConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: VibeXConfig | None = None,
+        graph: ImportGraph | None = None,
+        on_test: Callable[[PytestOutcome], None] | None = None,
+    ) -> None:
         self._config = config or load_config()
         self._project_root = self._config.paths.project_root
+        self._graph = graph
+        self._on_test = on_test
+
+    @property
+    def graph(self) -> ImportGraph:
+        """import 그래프 (지연 로드)."""
+        if self._graph is None:
+            self._graph = ImportGraph(self._config)
+        return self._graph
 
     def run(self, changed_files: list[Path]) -> GateResult:
         """Gate 3을 실행한다."""
+        self.graph.refresh()
         impact = self._analyze_impact(changed_files)
-        test_files = self._find_related_tests(changed_files, impact)
+        selection: dict[Path, list[str]] | None = None
+        if self._config.gate.coverage_selection:
+            test_files, selection = self._select_by_coverage(changed_files, impact)
+        else:
+            test_files = self._find_related_tests(changed_files, impact)
 
         if not test_files:
             return GateResult(
@@ -48,8 +74,12 @@ class IntegrationAgent:
                 ],
             )
 
-        passed, failed, errors = self._run_tests(test_files)
+        passed, failed, errors = self._run_tests(test_files, selection)
         details = self._build_report(changed_files, impact, passed, failed, errors)
+        if selection is not None:
+            selected = sum(len(names) for names in selection.values())
+            whole = len(test_files) - len(selection)
+            details.insert(0, f"[선별] 커버리지 맵: 테스트 {selected}개, 전체 실행 파일 {whole}개")
 
         if failed:
             return GateResult(
@@ -69,15 +99,24 @@ class IntegrationAgent:
         )
 
     def _analyze_impact(self, changed_files: list[Path]) -> list[str]:
-        """변경 파일의 영향 범위를 import 의존성으로 분석한다."""
-        changed_modules = set()
+        """변경 파일의 영향 범위를 import 의존성으로 분석한다.
+
+        변경 파일과, 이를 MAX_IMPACT_DEPTH 단계 이내로 import하는 모듈(테스트 제외)을 반환한다.
+        """
+        graph = self.graph
+        affected: set[str] = set()
+        start: set[str] = set()
         for f in changed_files:
-            module = self._path_to_module(f)
-            if module:
-                changed_modules.add(module)
+            rel = graph.relative(f)
+            if rel is not None and rel in graph:
+                start.add(rel)
+            else:
+                module = self._path_to_module(f)
+                if module:
+                    affected.add(module)
 
-        affected: set[str] = set(changed_modules)
-        self._find_reverse_imports(changed_modules, affected, depth=0)
+        depths = graph.dependents(start, MAX_IMPACT_DEPTH, exclude_prefix=TESTS_PREFIX)
+        affected.update(module_name(rel) for rel in depths)
         return sorted(affected)
 
     def _path_to_module(self, file_path: Path) -> str | None:
@@ -91,46 +130,13 @@ class IntegrationAgent:
             pass
         return None
 
-    def _find_reverse_imports(
-        self, targets: set[str], affected: set[str], depth: int
-    ) -> None:
-        """targets를 import하는 파일들을 재귀적으로 탐색한다."""
-        if depth >= MAX_IMPACT_DEPTH:
-            return
-
-        src_dir = self._project_root / "src"
-        if not src_dir.exists():
-            return
-
-        new_targets: set[str] = set()
-        for py_file in src_dir.rglob("*.py"):
-            module = self._path_to_module(py_file)
-            if not module or module in affected:
-                continue
-
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
-                continue
-
-            for target in targets:
-                short = target.split(".")[-1]
-                if re.search(
-                    rf"(?:from\s+{re.escape(target)}|import\s+{re.escape(target)}"
-                    rf"|from\s+\S+\s+import\s+.*\b{re.escape(short)}\b)",
-                    content,
-                ):
-                    affected.add(module)
-                    new_targets.add(module)
-                    break
-
-        if new_targets:
-            self._find_reverse_imports(new_targets, affected, depth + 1)
-
     def _find_related_tests(
         self, changed_files: list[Path], impact_modules: list[str]
     ) -> list[Path]:
-        """변경 파일 + 영향 범위 기반으로 관련 테스트를 탐색한다."""
+        """변경 파일 + 영향 범위 기반으로 관련 테스트를 탐색한다.
+
+        이름 규칙 후보(test_<stem>.py)와, 영향 모듈을 직접 import하는 tests/ 파일을 합친다.
+        """
         test_files: set[Path] = set()
         tests_dir = self._project_root / "tests"
 
@@ -141,16 +147,33 @@ class IntegrationAgent:
                 if c.exists() and c not in test_files:
                     test_files.add(c)
 
-        if tests_dir.exists():
-            all_test_files = list(tests_dir.rglob("test_*.py"))
-            for tf in all_test_files:
-                if tf in test_files:
-                    continue
-                if self._test_imports_affected_module(tf, impact_modules):
-                    test_files.add(tf)
+        for rel in self.graph.importers_of_modules(impact_modules):
+            if rel.startswith(TESTS_PREFIX) and Path(rel).name.startswith("test_"):
+                test_files.add(self._project_root / rel)
 
         return sorted(test_files)
 
+    def _select_by_coverage(
+        self, changed_files: list[Path], impact: list[str]
+    ) -> tuple[list[Path], dict[Path, list[str]] | None]:
+        """커버리지 맵으로 테스트를 선별한다. 맵이 없으면 그래프 기반 선별과 같다.
+
+        Returns:
+            (실행할 테스트 파일, 파일 → 실행할 테스트 이름). 두 번째 값에 없는 파일은 전체 실행.
+        """
+        coverage = CoverageMap(self._config)
+        if not coverage.available:
+            logger.info("커버리지 맵 없음 - import 그래프로 테스트 선별")
+            return self._find_related_tests(changed_files, impact), None
+
+        result = coverage.select(changed_files)
+        whole = set(result.whole_files)
+        if result.unresolved:
+            unresolved_impact = self._analyze_impact(result.unresolved)
+            whole.update(self._find_related_tests(result.unresolved, unresolved_impact))
+        selection = {f: names for f, names in result.tests.items() if f not in whole}
+        return sorted(whole | set(selection)), selection
+
     def _generate_test_candidates(
         self, file_path: Path, stem: str, tests_dir: Path
     ) -> list[Path]:
@@ -163,63 +186,53 @@ class IntegrationAgent:
             tests_dir / f"test_{stem.replace('_', '')}.py",
         ]
 
-    def _test_imports_affected_module(
-        self, test_file: Path, impact_modules: list[str]
-    ) -> bool:
-        """테스트 파일이 영향받는 모듈을 import하는지 확인한다."""
-        try:
-            content = test_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            return False
-
-        for module in impact_modules:
-            parts = module.split(".")
-            short_name = parts[-1] if parts else module
-            if (
-                f"import {module}" in content
-                or f"from {module}" in content
-                or f"import {short_name}" in content
-                or f"from {'.'.join(parts[:-1])}" in content
-            ):
-                return True
-        return False
-
     def _run_tests(
-        self, test_files: list[Path]
+        self,
+        test_files: list[Path],
+        selection: dict[Path, list[str]] | None = None,
     ) -> tuple[list[str], list[str], list[str]]:
-        """테스트를 실행하고 결과를 분류한다."""
+        """테스트를 한 번의 pytest 실행(샤드별)으로 돌리고 파일 단위로 분류한다."""
         passed: list[str] = []
         failed: list[str] = []
         errors: list[str] = []
 
-        for test_file in test_files:
-            try:
-                result = subprocess.run(
-                    ["python", "-m", "pytest", str(test_file), "-v", "--tb=short"],
-                    capture_output=True,
-                    text=True,
-                    timeout=MAX_TEST_TIMEOUT_SECONDS,
-                    cwd=str(self._project_root),
-                )
-                if result.returncode == 0:
-                    count = self._extract_test_count(result.stdout)
-                    passed.append(f"{test_file.name} ({count})")
-                else:
-                    summary = self._extract_failure_summary(result.stdout)
+        runner = PytestRunner(
+            self._config, on_result=self._report_test, timeout=MAX_TEST_TIMEOUT_SECONDS
+        )
+        for shard in runner.run(test_files, selection):
+            if shard.missing_python:
+                passed.extend(f"{f.name} (pytest 미설치 - 파일 존재 확인)" for f in shard.files)
+                continue
+            if shard.error:
+                errors.extend(f"{f.name}: {shard.error}" for f in shard.files)
+                continue
+
+            for test_file, outcomes in shard.outcomes_by_file().items():
+                bad = [o for o in outcomes if not o.ok]
+                count = sum(1 for o in outcomes if o.outcome == "passed")
+                if bad:
+                    first = bad[0]
+                    # 수집 오류는 nodeid가 파일 경로뿐이므로 메시지를 보여준다
+                    summary = first.nodeid
+                    if "::" not in summary and first.message:
+                        summary = first.message
+                    failed.append(f"{test_file.name}: {summary[:120]}")
+                elif shard.timed_out:
+                    errors.append(f"{test_file.name}: 타임아웃 ({MAX_TEST_TIMEOUT_SECONDS}s)")
+                elif not outcomes and shard.returncode:
+                    summary = self._extract_failure_summary("\n".join(shard.output_tail))
                     failed.append(f"{test_file.name}: {summary}")
-            except FileNotFoundError:
-                passed.append(f"{test_file.name} (pytest 미설치 - 파일 존재 확인)")
-            except subprocess.TimeoutExpired:
-                errors.append(f"{test_file.name}: 타임아웃 ({MAX_TEST_TIMEOUT_SECONDS}s)")
-            except Exception as e:
-                errors.append(f"{test_file.name}: {e}")
+                else:
+                    label = f"{count} passed" if count else "passed"
+                    passed.append(f"{test_file.name} ({label})")
 
         return passed, failed, errors
 
-    def _extract_test_count(self, output: str) -> str:
-        """pytest 출력에서 통과 테스트 수를 추출한다."""
-        match = re.search(r"(\d+)\s+passed", output)
-        return f"{match.group(1)} passed" if match else "passed"
+    def _report_test(self, outcome: PytestOutcome) -> None:
+        """테스트 하나가 끝날 때마다 호출된다."""
+        logger.debug(f"{outcome.outcome.upper()} {outcome.nodeid}")
+        if self._on_test is not None:
+            self._on_test(outcome)
 
     def _extract_failure_summary(self, output: str) -> str:
         """pytest 출력에서 실패 요약을 추출한다."""
@@ -0,0 +1,388 @@
+"""Task 3.2 - Gate 3 pytest 실행기.
+
+선별된 테스트 파일마다 인터프리터를 새로 띄우지 않고 pytest 한 번으로 실행한다.
+gate.test_shards가 2 이상이면 파일을 크기 기준으로 나눠 샤드별로 동시에 실행한다.
+gate.warm_test_workers를 켜면 무거운 라이브러리를 미리 import한 forkserver에서
+샤드 프로세스를 fork하여 인터프리터 시작과 라이브러리 import 비용을 없앤다.
+프로젝트 모듈은 fork된 프로세스에서 새로 import하므로 변경 내용이 그대로 반영된다.
+테스트 결과는 하나 끝날 때마다 on_result 콜백으로 전달되고, 타임아웃은 샤드 단위다.
+"""
+
+import functools
+import multiprocessing
+import os
+import queue
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.shared.config import VibeXConfig, load_config
+from src.shared.logger import get_logger
+
+logger = get_logger("pytest-runner")
+
+DEFAULT_TIMEOUT_SECONDS = 120
+OUTPUT_TAIL_LINES = 20
+PYTEST_ARGS = ("-v", "--tb=short", "-rfE")
+# warm 워커에서 pytest.main 자체가 예외로 끝났을 때의 종료 코드
+WORKER_ERROR_CODE = -1
+
+# -v 출력의 테스트별 결과: "tests/test_a.py::test_x PASSED    [ 50%]"
+_RESULT_LINE = re.compile(
+    r"^(?P<nodeid>\S+?::.+?) (?P<word>PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\b"
+)
+# -rfE 요약: "FAILED tests/test_a.py::test_x - assert 1 == 2", "ERROR tests/test_b.py"
+_SUMMARY_LINE = re.compile(r"^(?P<word>FAILED|ERROR) (?P<nodeid>.+?)(?: - (?P<message>.*))?$")
+
+_OUTCOMES = {
+    "PASSED": "passed",
+    "XPASS": "passed",
+    "FAILED": "failed",
+    "ERROR": "error",
+    "SKIPPED": "skipped",
+    "XFAIL": "skipped",
+}
+
+
+@dataclass
+class PytestOutcome:
+    """테스트 하나의 결과. outcome: passed | failed | error | skipped."""
+
+    nodeid: str
+    outcome: str
+    message: str = ""
+
+    @property
+    def file(self) -> str:
+        """nodeid의 파일 부분 (수집 오류는 nodeid 전체가 파일이다)."""
+        return self.nodeid.split("::", 1)[0]
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome in ("passed", "skipped")
+
+
+@dataclass
+class ShardResult:
+    """샤드 하나(pytest 실행 한 번)의 결과."""
+
+    files: list[Path]
+    outcomes: list[PytestOutcome] = field(default_factory=list)
+    returncode: int | None = None
+    timed_out: bool = False
+    missing_python: bool = False
+    error: str | None = None
+    output_tail: list[str] = field(default_factory=list)
+
+    def outcomes_by_file(self) -> dict[Path, list[PytestOutcome]]:
+        """결과를 샤드의 테스트 파일별로 묶는다.
+
+        nodeid는 pytest rootdir 기준 경로이므로 파일 경로의 끝부분으로 맞춘다.
+        """
+        paths = {f: f.resolve().as_posix() for f in self.files}
+        grouped: dict[Path, list[PytestOutcome]] = {f: [] for f in self.files}
+        for outcome in self.outcomes:
+            part = outcome.file
+            for f, posix in paths.items():
+                if posix == part or posix.endswith("/" + part):
+                    grouped[f].append(outcome)
+                    break
+        return grouped
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class PytestRunner:
+    """선별된 테스트 파일을 pytest로 실행한다.
+
+    사용 예:
+        runner = PytestRunner(config, on_result=lambda o: print(o.nodeid, o.outcome))
+        shards = runner.run(test_files)
+
+    on_result는 샤드 스레드에서 호출되지만 호출 자체는 직렬화된다.
+    """
+
+    def __init__(
+        self,
+        config: VibeXConfig | None = None,
+        on_result: Callable[[PytestOutcome], None] | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        self._config = config or load_config()
+        self._cwd = self._config.paths.project_root
+        self._on_result = on_result
+        self._timeout = timeout
+        self._lock = threading.Lock()
+
+    def shard(self, test_files: list[Path]) -> list[list[Path]]:
+        """큰 파일부터 가장 가벼운 샤드에 배정하여 파일을 나눈다."""
+        count = max(1, min(self._config.gate.test_shards, len(test_files)))
+        shards: list[list[Path]] = [[] for _ in range(count)]
+        loads = [0] * count
+        for path in sorted(test_files, key=_file_size, reverse=True):
+            index = loads.index(min(loads))
+            shards[index].append(path)
+            loads[index] += _file_size(path) + 1
+        return [sorted(s) for s in shards if s]
+
+    def run(
+        self,
+        test_files: list[Path],
+        selection: dict[Path, list[str]] | None = None,
+    ) -> list[ShardResult]:
+        """테스트를 샤드별로 실행하고 샤드 결과 목록을 반환한다.
+
+        Args:
+            test_files: 실행할 테스트 파일
+            selection: 파일 → 실행할 테스트 이름 (nodeid의 파일 뒤 부분).
+                       없는 파일은 전체를 실행한다.
+        """
+        if not test_files:
+            return []
+        shards = self.shard(test_files)
+        run_shard = functools.partial(
+            self._run_warm if self._use_warm() else self._run_subprocess,
+            selection=selection or {},
+        )
+        if len(shards) == 1:
+            return [run_shard(shards[0])]
+        with ThreadPoolExecutor(
+            max_workers=len(shards), thread_name_prefix="pytest-shard"
+        ) as pool:
+            return list(pool.map(run_shard, shards))
+
+    @staticmethod
+    def _targets(files: list[Path], selection: dict[Path, list[str]]) -> list[str]:
+        """pytest 인자: 선별된 파일은 nodeid, 나머지는 파일 경로."""
+        targets: list[str] = []
+        for f in files:
+            names = selection.get(f)
+            if names:
+                targets.extend(f"{f}::{name}" for name in names)
+            else:
+                targets.append(str(f))
+        return targets
+
+    def _use_warm(self) -> bool:
+        return (
+            self._config.gate.warm_test_workers
+            and "forkserver" in multiprocessing.get_all_start_methods()
+        )
+
+    def _record(self, result: ShardResult, outcome: PytestOutcome) -> None:
+        result.outcomes.append(outcome)
+        if self._on_result is not None:
+            with self._lock:
+                try:
+                    self._on_result(outcome)
+                except Exception as e:
+                    logger.warning(f"테스트 결과 콜백 오류: {e}")
+
+    def _handle_line(self, result: ShardResult, line: str) -> None:
+        """pytest 출력 한 줄에서 테스트 결과나 실패 메시지를 추출한다."""
+        match = _RESULT_LINE.match(line)
+        if match:
+            self._record(result, PytestOutcome(match["nodeid"], _OUTCOMES[match["word"]]))
+            return
+        match = _SUMMARY_LINE.match(line)
+        if not match:
+            return
+        nodeid, message = match["nodeid"], (match["message"] or "").strip()
+        for outcome in result.outcomes:
+            if outcome.nodeid == nodeid and not outcome.ok:
+                outcome.message = outcome.message or message
+                return
+        # -v 결과 라인이 없는 실패 (수집 오류)
+        outcome = "error" if match["word"] == "ERROR" else "failed"
+        self._record(result, PytestOutcome(nodeid, outcome, message))
+
+    def _run_subprocess(
+        self, files: list[Path], selection: dict[Path, list[str]]
+    ) -> ShardResult:
+        """새 인터프리터에서 pytest를 실행하고 출력을 줄 단위로 읽는다."""
+        result = ShardResult(files=files)
+        targets = self._targets(files, selection)
+        cmd = [sys.executable or "python", "-m", "pytest", *targets, *PYTEST_ARGS]
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                cwd=str(self._cwd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except FileNotFoundError:
+            result.missing_python = True
+            return result
+        except OSError as e:
+            result.error = str(e)
+            return result
+
+        timer = threading.Timer(self._timeout, self._expire, (proc, result))
+        timer.daemon = True
+        timer.start()
+        tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                tail.append(line)
+                self._handle_line(result, line)
+            result.returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        result.output_tail = list(tail)
+        return result
+
+    @staticmethod
+    def _expire(proc: subprocess.Popen, result: ShardResult) -> None:
+        result.timed_out = True
+        proc.kill()
+
+    def _run_warm(self, files: list[Path], selection: dict[Path, list[str]]) -> ShardResult:
+        """미리 import된 forkserver에서 fork한 프로세스로 pytest를 실행한다."""
+        result = ShardResult(files=files)
+        ctx = _forkserver_context(self._config.gate.test_worker_preload)
+        messages = ctx.Queue()
+        proc = ctx.Process(
+            target=_warm_shard,
+            args=(self._targets(files, selection), str(self._cwd), messages),
+            name="pytest-warm-shard",
+        )
+        try:
+            proc.start()
+        except OSError as e:
+            result.error = str(e)
+            return result
+
+        deadline = time.monotonic() + self._timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    result.timed_out = True
+                    proc.kill()
+                    break
+                try:
+                    message = messages.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    if proc.is_alive() or not messages.empty():
+                        continue
+                    result.error = f"테스트 워커 비정상 종료 (exit {proc.exitcode})"
+                    break
+                if message[0] == "result":
+                    self._record(result, PytestOutcome(*message[1:]))
+                else:
+                    _, result.returncode, result.output_tail = message
+                    if result.returncode == WORKER_ERROR_CODE:
+                        result.error = result.output_tail[-1]
+                    break
+        finally:
+            proc.join(timeout=5)
+            messages.close()
+        return result
+
+
+_warm_lock = threading.Lock()
+_warm_context = None
+
+
+def _forkserver_context(preload: tuple):
+    """preload 모듈을 미리 import하는 forkserver 컨텍스트 (프로세스당 하나)."""
+    global _warm_context
+    with _warm_lock:
+        if _warm_context is None:
+            ctx = multiprocessing.get_context("forkserver")
+            ctx.set_forkserver_preload(list(preload))
+            _warm_context = ctx
+        return _warm_context
+
+
+def warm_up(config: VibeXConfig | None = None) -> None:
+    """forkserver를 미리 띄워 첫 Gate 3 실행도 import 비용 없이 시작하게 한다."""
+    config = config or load_config()
+    if not config.gate.warm_test_workers:
+        return
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return
+    proc = _forkserver_context(config.gate.test_worker_preload).Process(target=_noop)
+    proc.start()
+    proc.join()
+    logger.info("pytest 워커 forkserver 준비 완료")
+
+
+def warm_up_in_background(config: VibeXConfig | None = None) -> threading.Thread:
+    """warm_up을 데몬 스레드에서 실행한다. 서버 기동을 막지 않는다."""
+    thread = threading.Thread(
+        target=warm_up, args=(config,), name="vibe-x-pytest-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _noop() -> None:
+    pass
+
+
+class _QueueReporter:
+    """pytest 플러그인: 테스트 결과를 부모 프로세스로 하나씩 보낸다."""
+
+    def __init__(self, messages) -> None:
+        self._messages = messages
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when != "call" and report.passed:
+            return
+        if report.when != "call" and report.failed:
+            outcome = "error"
+        else:
+            outcome = report.outcome
+        self._messages.put(("result", report.nodeid, outcome, _last_line(report)))
+
+    def pytest_collectreport(self, report) -> None:
+        if report.failed:
+            self._messages.put(("result", report.nodeid, "error", _last_line(report)))
+
+
+def _last_line(report) -> str:
+    if not report.failed:
+        return ""
+    lines = report.longreprtext.strip().splitlines()
+    return lines[-1][:200] if lines else ""
+
+
+def _warm_shard(targets: list[str], cwd: str, messages) -> None:
+    """fork된 워커에서 pytest를 같은 프로세스 안에서 실행한다."""
+    import pytest
+
+    os.chdir(cwd)
+    sys.path.insert(0, cwd)
+    log = tempfile.TemporaryFile()
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+    try:
+        code = int(pytest.main([*targets, *PYTEST_ARGS], plugins=[_QueueReporter(messages)]))
+    except Exception as e:
+        # stdout은 임시 파일로 돌려져 있으므로 오류는 메시지로 부모에게 보낸다
+        messages.put(("done", WORKER_ERROR_CODE, [f"pytest 실행 오류: {e}"]))
+        return
+    sys.stdout.flush()
+    sys.stderr.flush()
+    log.seek(0)
+    tail = log.read().decode("utf-8", "replace").splitlines()[-OUTPUT_TAIL_LINES:]
+    messages.put(("done", code, tail))
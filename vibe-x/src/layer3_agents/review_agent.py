@@ -1,18 +1,23 @@
 """Task 3.2 - Gate 4: Review Agent.
 
 AI 교차 코드 리뷰 - 보안 취약점, 성능 안티패턴을 자동 탐지한다.
+Python 파일은 AST 규칙 엔진(review_rules)으로 한 번 순회하여 검사하고,
+아래 정규식 규칙은 Python이 아닌 파일과 구문 오류로 파싱할 수 없는 파일에만 쓴다.
 """
 
 import re
 from pathlib import Path
 
 from src.shared.config import VibeXConfig, load_config
+from src.shared.file_context import FileAnalysisContext
+from src.shared.line_index import LineIndex
 from src.shared.logger import get_logger
 from src.shared.types import GateResult, GateStatus
+from src.layer3_agents.review_rules import MAX_NESTING_DEPTH, RuleEngine
 
 logger = get_logger("gate4")
 
-# 보안 취약점 패턴 (OWASP 기반)
+# 보안 취약점 패턴 (OWASP 기반, Python이 아닌 파일용)
 SECURITY_PATTERNS: list[tuple[str, str, re.Pattern]] = [
     ("SEC-001", "하드코딩된 시크릿 의심",
      re.compile(r"""(?:password|secret|api_key|token)\s*=\s*["'][^"']{8,}["']""", re.I)),
@@ -28,7 +33,7 @@ SECURITY_PATTERNS: list[tuple[str, str, re.Pattern]] = [
      re.compile(r"^\s*assert\s+(?=.*\b(?:request|input|user)\b)", re.MULTILINE)),
 ]
 
-# 성능 안티패턴
+# 성능 안티패턴 (Python이 아닌 파일용)
 PERFORMANCE_PATTERNS: list[tuple[str, str, re.Pattern]] = [
     ("PERF-001", "루프 내 DB/API 호출 의심 (N+1 문제)",
      re.compile(r"for\s+\w+\s+in\s+.*:\s*\n\s+.*(?:query|fetch|request|get)\(")),
@@ -44,7 +49,6 @@ PERFORMANCE_PATTERNS: list[tuple[str, str, re.Pattern]] = [
 
 
 MAX_FILE_LINES = 500
-MAX_NESTING_DEPTH = 5
 MAX_IMPORT_COUNT = 20
 
 
@@ -57,32 +61,37 @@ class ReviewAgent:
     def __init__(self, config: VibeXConfig | None = None) -> None:
         self._config = config or load_config()
 
-    def run(self, file_path: Path) -> GateResult:
-        """Gate 4를 실행한다."""
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-        except OSError as e:
+    def run(self, file_path: Path, context: FileAnalysisContext | None = None) -> GateResult:
+        """Gate 4를 실행한다. context를 주면 파일을 다시 읽지 않는다."""
+        context = context or FileAnalysisContext.from_path(file_path)
+        if context.read_error is not None:
             return GateResult(
                 gate_number=4,
                 gate_name="Review Agent",
                 status=GateStatus.SKIPPED,
-                message=f"파일 읽기 실패: {e}",
+                message=f"파일 읽기 실패: {context.read_error}",
             )
 
-        lines = content.split("\n")
-        issues: list[str] = []
-
-        # 보안 검사
-        sec_issues = self._check_security(content, lines)
-        issues.extend(sec_issues)
-
-        # 성능 검사
-        perf_issues = self._check_performance(content, lines)
-        issues.extend(perf_issues)
+        content = context.content
+        lines = context.lines
+        tree = context.tree
+
+        if tree is not None:
+            report = RuleEngine().run(tree)
+            sec_issues = report.issues("security")
+            perf_issues = report.issues("performance")
+            complexity_issues = (
+                self._check_file_size(lines)
+                + report.issues("complexity")
+                + self._check_import_count(report.import_count)
+            )
+        else:
+            index = context.line_index
+            sec_issues = self._check_security(content, index)
+            perf_issues = self._check_performance(content, index)
+            complexity_issues = self._check_complexity(content, lines)
 
-        # 코드 복잡도 검사
-        complexity_issues = self._check_complexity(content, lines)
-        issues.extend(complexity_issues)
+        issues = sec_issues + perf_issues + complexity_issues
 
         if not issues:
             return GateResult(
@@ -105,46 +114,48 @@ class ReviewAgent:
             details=issues,
         )
 
-    def _check_security(self, content: str, lines: list[str]) -> list[str]:
+    def _check_security(self, content: str, index: LineIndex) -> list[str]:
         """보안 취약점을 검사한다."""
         issues: list[str] = []
         for code, desc, pattern in SECURITY_PATTERNS:
             for match in pattern.finditer(content):
-                line_num = content[:match.start()].count("\n") + 1
+                line_num = index.line_of(match.start())
                 issues.append(f"[{code}] L{line_num}: {desc}")
         return issues
 
-    def _check_performance(self, content: str, lines: list[str]) -> list[str]:
+    def _check_performance(self, content: str, index: LineIndex) -> list[str]:
         """성능 안티패턴을 검사한다."""
         issues: list[str] = []
         for code, desc, pattern in PERFORMANCE_PATTERNS:
             for match in pattern.finditer(content):
-                line_num = content[:match.start()].count("\n") + 1
+                line_num = index.line_of(match.start())
                 issues.append(f"[{code}] L{line_num}: {desc}")
         return issues
 
     def _check_complexity(self, content: str, lines: list[str]) -> list[str]:
-        """코드 복잡도를 검사한다."""
-        issues: list[str] = []
-
-        if len(lines) > MAX_FILE_LINES:
-            issues.append(f"[CMPLX-001] 파일 {len(lines)}줄 - {MAX_FILE_LINES}줄 이하 권장, 모듈 분리 고려")
+        """코드 복잡도를 검사한다 (들여쓰기 기반, Python이 아닌 파일용)."""
+        issues = self._check_file_size(lines)
 
         # 중첩 깊이 검사
-        max_indent = 0
         for i, line in enumerate(lines, 1):
             if line.strip():
                 indent = len(line) - len(line.lstrip())
                 spaces = indent // 4 if "    " in line[:indent] else indent // 2
-                if spaces > max_indent:
-                    max_indent = spaces
                 if spaces >= MAX_NESTING_DEPTH:
                     issues.append(f"[CMPLX-002] L{i}: 중첩 깊이 {spaces} - 리팩토링 권장")
                     break  # 첫 번째만 보고
 
         # import 수 검사
         import_count = sum(1 for line in lines if line.strip().startswith(("import ", "from ")))
-        if import_count > MAX_IMPORT_COUNT:
-            issues.append(f"[CMPLX-003] import {import_count}개 - 의존성 과다, 모듈 분리 고려")
-
+        issues.extend(self._check_import_count(import_count))
         return issues
+
+    def _check_file_size(self, lines: list[str]) -> list[str]:
+        if len(lines) > MAX_FILE_LINES:
+            return [f"[CMPLX-001] 파일 {len(lines)}줄 - {MAX_FILE_LINES}줄 이하 권장, 모듈 분리 고려"]
+        return []
+
+    def _check_import_count(self, import_count: int) -> list[str]:
+        if import_count > MAX_IMPORT_COUNT:
+            return [f"[CMPLX-003] import {import_count}개 - 의존성 과다, 모듈 분리 고려"]
+        return []
@@ -0,0 +1,451 @@
+"""Task 3.2 - Gate 4 AST 규칙 엔진.
+
+Python 파일의 AST를 한 번 순회하면서 노드 타입별로 등록된 규칙을 호출한다.
+순회 중 import 별칭, 루프 본문 여부, 블록 중첩 깊이, 상위 노드 스택을 유지하므로
+정규식으로는 어려운 판단(루프 본문 안의 호출, `model.eval()`과 `eval()` 구분,
+`import pickle as pk` 추적, 연속 라인이 아닌 실제 중첩 깊이)을 규칙이 바로 쓸 수 있다.
+
+규칙 추가:
+    @rule("SEC-007", "설명", "security", ast.Call)
+    def _my_rule(node: ast.Call, state: RuleState) -> bool | str | None:
+        ...  # True면 기본 설명, 문자열이면 그 문자열로 보고
+"""
+
+import ast
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+MAX_NESTING_DEPTH = 5
+
+_SECRET_NAME = re.compile(r"(?:password|secret|api_key|token)$", re.I)
+_SQL_KEYWORD = re.compile(r"\b(?:SELECT|INSERT|UPDATE|DELETE)\b", re.I)
+
+# 루프 본문에서 반복 호출하면 N+1이 되는 I/O 메서드와 모듈
+_IO_METHODS = frozenset({
+    "execute", "executemany", "query", "fetch", "fetchone", "fetchall", "fetchmany",
+    "request", "urlopen",
+})
+_IO_MODULES = ("requests.", "httpx.", "aiohttp.", "urllib.request.")
+
+_PICKLE_LOADS = frozenset(
+    f"{module}.{func}" for module in ("pickle", "cPickle", "_pickle") for func in ("load", "loads")
+)
+
+_LOOPS = (ast.For, ast.AsyncFor, ast.While)
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+_COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)
+# 들여쓰기 블록 필드 (except 절은 try와 같은 깊이, 그 body가 한 단계 깊다)
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "cases")
+
+
+@dataclass
+class RuleState:
+    """순회 중 규칙이 참조하는 문맥."""
+
+    aliases: dict[str, str] = field(default_factory=dict)
+    parents: list[ast.AST] = field(default_factory=list)
+    depth: int = 0  # 블록 중첩 깊이 (들여쓰기 단계)
+    loop_depth: int = 0  # 둘러싼 for/while 수 (함수 경계에서 초기화)
+    in_loop_body: bool = False  # 루프/컴프리헨션 본문 안 (반복 표현식은 제외)
+    import_count: int = 0
+
+    @property
+    def parent(self) -> ast.AST | None:
+        return self.parents[-1] if self.parents else None
+
+    @property
+    def statement(self) -> ast.stmt | None:
+        """노드를 포함하는 가장 가까운 문장."""
+        for node in reversed(self.parents):
+            if isinstance(node, ast.stmt):
+                return node
+        return None
+
+    def qualified_name(self, node: ast.AST) -> str | None:
+        """Name/Attribute 체인을 import 별칭을 풀어 점 이름으로 만든다 (`pk.loads` → `pickle.loads`)."""
+        parts: list[str] = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(self.aliases.get(node.id, node.id))
+        return ".".join(reversed(parts))
+
+
+RuleCheck = Callable[[ast.AST, RuleState], "bool | str | None"]
+
+
+@dataclass(frozen=True)
+class AstRule:
+    """노드 타입별로 호출되는 검사 규칙. once면 파일당 첫 위반만 보고한다."""
+
+    code: str
+    desc: str
+    category: str
+    node_types: tuple[type, ...]
+    check: RuleCheck
+    once: bool = False
+
+
+@dataclass(frozen=True)
+class Finding:
+    code: str
+    line: int
+    desc: str
+    category: str
+
+    def __str__(self) -> str:
+        return f"[{self.code}] L{self.line}: {self.desc}"
+
+
+RULES: list[AstRule] = []
+
+
+def rule(code: str, desc: str, category: str, *node_types: type, once: bool = False):
+    """규칙 함수를 RULES에 등록하는 데코레이터."""
+    def register(check: RuleCheck) -> RuleCheck:
+        RULES.append(AstRule(code, desc, category, node_types, check, once))
+        return check
+    return register
+
+
+@dataclass
+class ReviewReport:
+    """AST 검사 결과."""
+
+    findings: list[Finding]
+    import_count: int
+
+    def issues(self, category: str) -> list[str]:
+        return [str(f) for f in self.findings if f.category == category]
+
+
+class RuleEngine:
+    """AST를 한 번 순회하며 등록된 규칙을 노드 타입별로 실행한다.
+
+    사용 예:
+        report = RuleEngine().run(context.tree)
+        report.issues("security")
+    """
+
+    def __init__(self, rules: list[AstRule] | None = None) -> None:
+        self._rules = RULES if rules is None else rules
+        self._order = {r.code: i for i, r in enumerate(self._rules)}
+        self._by_type: dict[type, list[AstRule]] = {}
+        for r in self._rules:
+            for node_type in r.node_types:
+                self._by_type.setdefault(node_type, []).append(r)
+        self._dispatch_cache: dict[type, list[AstRule]] = {}
+
+    def run(self, tree: ast.Module) -> ReviewReport:
+        self._state = RuleState()
+        self._findings: list[Finding] = []
+        self._reported: set[str] = set()
+        self._visit(tree)
+        # 규칙 등록 순서 → 라인 순 (정규식 검사와 같은 보고 순서)
+        findings = sorted(
+            set(self._findings), key=lambda f: (self._order[f.code], f.line, f.desc)
+        )
+        return ReviewReport(findings, self._state.import_count)
+
+    def _rules_for(self, node_type: type) -> list[AstRule]:
+        """노드 타입과 그 상위 클래스(ast.stmt 등)에 등록된 규칙."""
+        rules = self._dispatch_cache.get(node_type)
+        if rules is None:
+            rules = [r for cls in node_type.__mro__ for r in self._by_type.get(cls, ())]
+            self._dispatch_cache[node_type] = rules
+        return rules
+
+    def _visit(self, node: ast.AST) -> None:
+        state = self._state
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            self._register_import(node)
+
+        for r in self._rules_for(type(node)):
+            if r.once and r.code in self._reported:
+                continue
+            verdict = r.check(node, state)
+            if verdict:
+                desc = verdict if isinstance(verdict, str) else r.desc
+                self._findings.append(Finding(r.code, getattr(node, "lineno", 0), desc, r.category))
+                self._reported.add(r.code)
+
+        state.parents.append(node)
+        try:
+            if isinstance(node, _LOOPS):
+                self._visit_loop(node)
+            elif isinstance(node, _SCOPES):
+                self._visit_scope(node)
+            elif isinstance(node, _COMPREHENSIONS):
+                self._visit_comprehension(node)
+            else:
+                self._visit_fields(node)
+        finally:
+            state.parents.pop()
+
+    def _visit_fields(self, node: ast.AST, skip: tuple[str, ...] = ()) -> None:
+        for name, value in ast.iter_fields(node):
+            if name in skip:
+                continue
+            if name in _BLOCK_FIELDS and isinstance(value, list):
+                self._visit_block(node, name, value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        self._visit(item)
+            elif isinstance(value, ast.AST):
+                self._visit(value)
+
+    def _visit_block(self, owner: ast.AST, name: str, body: list) -> None:
+        """들여쓰기 블록은 한 단계 깊게 방문한다 (모듈 본문과 `elif`는 같은 깊이)."""
+        if isinstance(owner, ast.Module):
+            for item in body:
+                self._visit(item)
+            return
+        if (
+            isinstance(owner, ast.If)
+            and name == "orelse"
+            and len(body) == 1
+            and isinstance(body[0], ast.If)
+            and body[0].col_offset == owner.col_offset
+        ):
+            self._visit(body[0])
+            return
+        self._state.depth += 1
+        try:
+            for item in body:
+                self._visit(item)
+        finally:
+            self._state.depth -= 1
+
+    def _visit_loop(self, node: ast.For | ast.AsyncFor | ast.While) -> None:
+        """반복 대상/조건은 루프 밖, 본문은 루프 안으로 방문한다."""
+        state = self._state
+        for name in ("target", "iter", "test"):
+            value = getattr(node, name, None)
+            if value is not None:
+                self._visit(value)
+        saved = state.loop_depth, state.in_loop_body
+        state.loop_depth += 1
+        state.in_loop_body = True
+        try:
+            self._visit_block(node, "body", node.body)
+        finally:
+            state.loop_depth, state.in_loop_body = saved
+        self._visit_block(node, "orelse", node.orelse)
+
+    def _visit_scope(self, node: ast.AST) -> None:
+        """함수/클래스 본문은 정의 시점이 아니라 호출 시 실행되므로 루프 문맥을 끊는다."""
+        state = self._state
+        for decorator in getattr(node, "decorator_list", ()):
+            self._visit(decorator)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            self._visit(node.args)
+        saved = state.loop_depth, state.in_loop_body
+        state.loop_depth, state.in_loop_body = 0, False
+        try:
+            if isinstance(node, ast.Lambda):
+                self._visit(node.body)
+            else:
+                self._visit_fields(node, skip=("decorator_list", "args"))
+        finally:
+            state.loop_depth, state.in_loop_body = saved
+
+    def _visit_comprehension(self, node: ast.AST) -> None:
+        """첫 반복 대상만 루프 밖, 나머지(요소, 조건, 안쪽 반복)는 루프 본문이다."""
+        state = self._state
+        generators = node.generators
+        self._visit(generators[0].iter)
+        saved = state.in_loop_body
+        state.in_loop_body = True
+        try:
+            for i, generator in enumerate(generators):
+                self._visit(generator.target)
+                if i:
+                    self._visit(generator.iter)
+                for condition in generator.ifs:
+                    self._visit(condition)
+            for name in ("elt", "key", "value"):
+                value = getattr(node, name, None)
+                if value is not None:
+                    self._visit(value)
+        finally:
+            state.in_loop_body = saved
+
+    def _register_import(self, node: ast.Import | ast.ImportFrom) -> None:
+        state = self._state
+        state.import_count += 1
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    state.aliases[alias.asname] = alias.name
+                else:
+                    head = alias.name.split(".")[0]
+                    state.aliases[head] = head
+        elif node.module and not node.level:
+            for alias in node.names:
+                if alias.name != "*":
+                    state.aliases[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+
+
+# ── 보안 규칙 ──
+
+def _target_names(targets: list[ast.AST]) -> list[str]:
+    names: list[str] = []
+    for target in targets:
+        if isinstance(target, ast.Name):
+            names.append(target.id)
+        elif isinstance(target, ast.Attribute):
+            names.append(target.attr)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            names.extend(_target_names(target.elts))
+    return names
+
+
+def _is_long_str(node: ast.AST | None) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, str) and len(node.value) >= 8
+
+
+@rule("SEC-001", "하드코딩된 시크릿 의심", "security", ast.Assign, ast.AnnAssign, ast.keyword)
+def _hardcoded_secret(node: ast.AST, state: RuleState) -> bool:
+    if isinstance(node, ast.keyword):
+        names = [node.arg] if node.arg else []
+    elif isinstance(node, ast.Assign):
+        names = _target_names(node.targets)
+    else:
+        names = _target_names([node.target])
+    return _is_long_str(node.value) and any(_SECRET_NAME.search(n) for n in names)
+
+
+@rule("SEC-002", "eval/exec 사용 (코드 인젝션 위험)", "security", ast.Call)
+def _eval_exec(node: ast.Call, state: RuleState) -> bool:
+    return state.qualified_name(node.func) in ("eval", "exec", "builtins.eval", "builtins.exec")
+
+
+def _string_parts(node: ast.AST) -> list[str] | None:
+    """동적으로 조립한 문자열의 상수 부분. 동적 조립이 아니면 None."""
+    if isinstance(node, ast.JoinedStr):
+        return [v.value for v in node.values if isinstance(v, ast.Constant)]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Mod, ast.Add)):
+        return [
+            n.value for n in ast.walk(node)
+            if isinstance(n, ast.Constant) and isinstance(n.value, str)
+        ]
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "format"
+        and isinstance(node.func.value, ast.Constant)
+        and isinstance(node.func.value.value, str)
+    ):
+        return [node.func.value.value]
+    return None
+
+
+@rule("SEC-003", "SQL 인젝션 위험 (문자열 포맷 SQL)", "security", ast.Call)
+def _formatted_sql(node: ast.Call, state: RuleState) -> bool:
+    func = node.func
+    if not isinstance(func, ast.Attribute) or not node.args:
+        return False
+    if not (func.attr.startswith("execute") or state.qualified_name(func.value) == "cursor"):
+        return False
+    parts = _string_parts(node.args[0])
+    return parts is not None and any(_SQL_KEYWORD.search(p) for p in parts)
+
+
+@rule("SEC-004", "subprocess shell=True (명령 인젝션)", "security", ast.Call)
+def _shell_true(node: ast.Call, state: RuleState) -> bool:
+    name = state.qualified_name(node.func) or ""
+    return name.startswith("subprocess.") and any(
+        kw.arg == "shell" and isinstance(kw.value, ast.Constant) and kw.value.value is True
+        for kw in node.keywords
+    )
+
+
+@rule("SEC-005", "pickle 역직렬화 (원격 코드 실행)", "security", ast.Call)
+def _pickle_load(node: ast.Call, state: RuleState) -> bool:
+    return state.qualified_name(node.func) in _PICKLE_LOADS
+
+
+@rule("SEC-006", "assert 프로덕션 사용 (최적화 시 제거됨)", "security", ast.Assert)
+def _assert_on_input(node: ast.Assert, state: RuleState) -> bool:
+    for child in ast.walk(node.test):
+        name = child.id if isinstance(child, ast.Name) else getattr(child, "attr", None)
+        if name in ("request", "input", "user"):
+            return True
+    return False
+
+
+# ── 성능 규칙 ──
+
+@rule("PERF-001", "루프 내 DB/API 호출 의심 (N+1 문제)", "performance", ast.Call)
+def _io_in_loop(node: ast.Call, state: RuleState) -> bool:
+    if not state.in_loop_body:
+        return False
+    name = state.qualified_name(node.func) or ""
+    if name.startswith(_IO_MODULES):
+        return True
+    return isinstance(node.func, ast.Attribute) and node.func.attr in _IO_METHODS
+
+
+@rule("PERF-002", "불필요한 전체 데이터 로드", "performance", ast.Call)
+def _unbounded_load(node: ast.Call, state: RuleState) -> bool:
+    if node.args or node.keywords or not isinstance(node.func, ast.Attribute):
+        return False
+    if node.func.attr not in ("find", "select", "query"):
+        return False
+    parent = state.parent
+    return not (isinstance(parent, ast.Attribute) and parent.attr == "limit")
+
+
+@rule("PERF-003", "동기 sleep 사용", "performance", ast.Call)
+def _long_sleep(node: ast.Call, state: RuleState) -> bool:
+    if state.qualified_name(node.func) != "time.sleep" or not node.args:
+        return False
+    arg = node.args[0]
+    return (
+        isinstance(arg, ast.Constant)
+        and isinstance(arg.value, (int, float))
+        and not isinstance(arg.value, bool)
+        and arg.value >= 10
+    )
+
+
+@rule("PERF-004", "중첩 루프 3단계+ (O(n^3) 이상)", "performance", *_LOOPS)
+def _triple_loop(node: ast.AST, state: RuleState) -> bool:
+    return state.loop_depth == 2
+
+
+@rule("PERF-005", "거대 리스트 복사", "performance", ast.Compare)
+def _large_list_copy(node: ast.Compare, state: RuleState) -> bool:
+    left = node.left
+    if not (
+        isinstance(left, ast.Call)
+        and isinstance(left.func, ast.Name)
+        and left.func.id == "len"
+        and isinstance(node.ops[0], (ast.Gt, ast.GtE))
+        and isinstance(node.comparators[0], ast.Constant)
+        and isinstance(node.comparators[0].value, int)
+        and node.comparators[0].value >= 1000
+    ):
+        return False
+    statement = state.statement
+    return statement is not None and any(
+        isinstance(n, ast.Call)
+        and isinstance(n.func, ast.Name)
+        and n.func.id == "list"
+        and len(n.args) == 1
+        and isinstance(n.args[0], ast.Name)
+        for n in ast.walk(statement)
+    )
+
+
+# ── 복잡도 규칙 ──
+
+@rule("CMPLX-002", "중첩 깊이 초과", "complexity", ast.stmt, once=True)
+def _deep_nesting(node: ast.stmt, state: RuleState) -> str | None:
+    if state.depth >= MAX_NESTING_DEPTH:
+        return f"중첩 깊이 {state.depth} - 리팩토링 권장"
+    return None
@@ -4,7 +4,10 @@
 REST API + WebSocket 실시간 데이터 제공.
 """
 
+import os
 import sys
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # 프로젝트 루트 설정
@@ -33,8 +36,27 @@ from src.layer5_dashboard.project_registry import (
     ProjectRole,
 )
 from src.layer5_dashboard.project_context import ProjectContextManager
+from src.layer5_dashboard.executors import BackgroundTask, BackgroundTasks, WorkExecutor
 
-app = FastAPI(title="VIBE-X Dashboard", version="2.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 RAG 엔진(ChromaDB + 임베딩 모델)을 백그라운드에서 미리 로드한다.
+
+    VIBE_X_SKIP_WARMUP=1이면 건너뛴다.
+    """
+    if not os.environ.get("VIBE_X_SKIP_WARMUP"):
+        from src.layer2_rag.registry import warm_up_in_background
+
+        warm_up_in_background(_config)
+        if _config.gate.warm_test_workers:
+            from src.layer3_agents.pytest_runner import warm_up_in_background as warm_pytest
+
+            warm_pytest(_config)
+    yield
+    _executor.shutdown()
+
+
+app = FastAPI(title="VIBE-X Dashboard", version="2.0.0", lifespan=lifespan)
 
 # CORS 허용 (IDE Extension에서 접근)
 app.add_middleware(
@@ -68,6 +90,62 @@ _project_ctx = ProjectContextManager()
 _ws_clients: list[WebSocket] = []
 
 
+async def _broadcast(message: dict) -> None:
+    """연결된 모든 WebSocket 클라이언트에 메시지를 보낸다."""
+    for ws in list(_ws_clients):
+        try:
+            await ws.send_json(message)
+        except Exception:
+            pass
+
+
+async def _broadcast_task(task: BackgroundTask) -> None:
+    """백그라운드 작업 상태 변경을 알린다."""
+    await _broadcast({"type": "task_update", "data": task.to_dict()})
+
+
+# 블로킹 작업 실행기: 인덱싱/게이트/검색을 이벤트 루프 밖 스레드 풀에서 실행
+_executor = WorkExecutor(_config.dashboard)
+_tasks = BackgroundTasks(_config.dashboard.max_finished_tasks, listener=_broadcast_task)
+
+
+def _submit_task(kind: str, fn, key: str | None = None, on_done=None) -> dict:
+    """fn(task)을 kind 실행기에서 백그라운드로 실행하고 task_id를 반환한다.
+
+    같은 key의 작업이 진행 중이면 새로 실행하지 않고 그 작업에 병합한다.
+    on_done이 있으면 결과를 이벤트 루프에서 후처리한다 (메트릭 기록, 브로드캐스트).
+    """
+    async def job(task: BackgroundTask):
+        result = await _executor.run(kind, fn, task)
+        return await on_done(result) if on_done else result
+
+    task = _tasks.submit(kind, job, key=key)
+    return {
+        "success": True,
+        "task_id": task.task_id,
+        "status": task.status,
+        "merged": task.merged > 0,
+    }
+
+
+def _progress_reporter(task: BackgroundTask | None):
+    """IndexProgress를 작업 진행 상황(/ws task_update)으로 전달하는 콜백."""
+    if task is None:
+        return None
+    return lambda progress: _tasks.report(task, progress.to_dict())
+
+
+def _test_progress_reporter(task: BackgroundTask):
+    """Gate 3 테스트 결과를 하나씩 작업 진행 상황으로 전달하는 콜백."""
+    counts = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+
+    def report(outcome) -> None:
+        counts[outcome.outcome] = counts.get(outcome.outcome, 0) + 1
+        _tasks.report(task, {**counts, "last": outcome.nodeid, "last_outcome": outcome.outcome})
+
+    return report
+
+
 # --- 인증 API ---
 
 @app.post("/api/auth/login")
@@ -224,19 +302,28 @@ async def dashboard_page():
 # --- RAG Search API ---
 
 @app.get("/api/rag/search")
-async def rag_search(q: str = "", top_k: int = 10, lang: str = ""):
+async def rag_search(
+    q: str = "", top_k: int = 10, lang: str = "", path: str = "", mode: str = "hybrid"
+):
     """자연어 코드 검색. Layer 2 RAG Engine을 사용한다."""
     if not q.strip():
         return {"results": [], "query": q, "error": "empty query"}
 
-    from src.layer2_rag.searcher import CodeSearcher
+    from src.layer2_rag.registry import get_searcher
 
-    searcher = CodeSearcher(_config)
-    results = searcher.search(
-        query=q,
-        top_k=top_k,
-        language_filter=lang if lang else None,
-    )
+    searcher = get_searcher(_config)
+    try:
+        results = await _executor.run(
+            "search",
+            searcher.search,
+            query=q,
+            top_k=top_k,
+            file_filter=path if path else None,
+            language_filter=lang if lang else None,
+            mode=mode,
+        )
+    except ValueError as e:
+        return {"results": [], "query": q, "error": str(e)}
 
     return {
         "query": q,
@@ -260,33 +347,62 @@ async def rag_search(q: str = "", top_k: int = 10, lang: str = ""):
 @app.get("/api/rag/stats")
 async def rag_stats():
     """벡터 DB 상태 및 통계."""
-    from src.layer2_rag.vector_db import VectorStore
+    from src.layer2_rag.registry import get_store
 
-    store = VectorStore(_config)
-    stats = store.get_stats()
-    return stats
+    return await _executor.run("search", get_store(_config).get_stats)
 
 
 @app.post("/api/rag/index")
 async def rag_index(data: dict):
-    """수동 인덱싱 트리거. path 미지정 시 프로젝트 루트를 인덱싱한다."""
-    from src.layer2_rag.indexer import CodebaseIndexer
+    """수동 인덱싱 트리거. path 미지정 시 프로젝트 루트를 인덱싱한다.
 
-    indexer = CodebaseIndexer(_config)
+    기본은 변경 파일만 처리하며, full=true면 전체 재인덱싱한다.
+    background=true면 task_id를 즉시 반환하고 /api/tasks/{task_id}로 결과를 조회한다.
+    """
     target = Path(data.get("path", str(PROJECT_ROOT.parent)))
-
     if not target.exists():
         return {"success": False, "error": f"Path not found: {target}"}
 
-    stats = indexer.index_project(target)
+    full = bool(data.get("full", False))
+    if data.get("background"):
+        mode = "full" if full else "incremental"
+        return _submit_task(
+            "index",
+            lambda task: _index_project(target, full, task),
+            key=f"index:{target.resolve()}:{mode}",
+        )
+    return await _executor.run("index", _index_project, target, full)
+
+
+def _index_project(target: Path, full: bool, task: BackgroundTask | None = None) -> dict:
+    """프로젝트를 인덱싱하고 통계를 dict로 반환한다 (실행기 스레드에서 호출)."""
+    from src.layer2_rag.indexer import CodebaseIndexer
+    from src.layer2_rag.registry import get_store
+
+    indexer = CodebaseIndexer(_config, store=get_store(_config))
+    stats = indexer.index_project(
+        target,
+        full=full,
+        progress=_progress_reporter(task),
+        cancel=task.cancel_event if task else None,
+    )
     return {
         "success": True,
+        "cancelled": stats.cancelled,
         "total_files": stats.total_files,
         "indexed_files": stats.indexed_files,
         "total_chunks": stats.total_chunks,
         "skipped_files": stats.skipped_files,
+        "unchanged_files": stats.unchanged_files,
+        "deleted_files": stats.deleted_files,
+        "streamed_files": stats.streamed_files,
+        "split_chunks": stats.split_chunks,
+        "truncated_chunks": stats.truncated_chunks,
+        "truncated_lines": stats.truncated_lines,
         "errors": stats.errors[:10],
         "duration_seconds": stats.duration_seconds,
+        "workers": stats.workers,
+        "stage_seconds": stats.stage_seconds,
     }
 
 
@@ -370,35 +486,60 @@ async def analyze_and_generate_meta(data: dict):
 
 @app.post("/api/meta/batch-analyze")
 async def batch_analyze_meta(data: dict):
-    """디렉토리 전체 자동 분석 + 메타 생성."""
-    from src.layer2_rag.meta_generator import MetaGenerator
+    """디렉토리 전체 자동 분석 + 메타 생성.
 
+    background=true면 task_id를 즉시 반환하고 진행 상황을 /ws로 보낸다.
+    """
     directory = data.get("directory", "")
     dir_path = Path(directory) if directory else _config.paths.project_root / "src"
     if not dir_path.exists():
         return {"error": "존재하는 디렉토리가 필요합니다."}
 
+    if data.get("background"):
+        return _submit_task(
+            "meta",
+            lambda task: _batch_analyze(dir_path, task),
+            key=f"meta-batch:{dir_path.resolve()}",
+        )
+    return await _executor.run("meta", _batch_analyze, dir_path)
+
+
+def _batch_analyze(dir_path: Path, task: BackgroundTask | None = None) -> dict:
+    """디렉토리 일괄 메타 분석 (실행기 스레드에서 호출)."""
+    from src.layer2_rag.meta_generator import MetaGenerator
+
     gen = MetaGenerator(_config)
-    generated = gen.batch_analyze(dir_path)
+    generated = gen.batch_analyze(
+        dir_path,
+        progress=_progress_reporter(task),
+        cancel=task.cancel_event if task else None,
+    )
     return {"count": len(generated), "files": [str(p) for p in generated]}
 
 
 @app.post("/api/meta/index")
 async def index_metas():
     """모든 .meta.json을 Vector DB에 인덱싱."""
+    count = await _executor.run("meta", _index_metas)
+    if count is None:
+        return {"indexed": 0, "message": "인덱싱할 메타 파일 없음"}
+    return {"indexed": count, "message": f"{count}개 메타 청크 인덱싱 완료"}
+
+
+def _index_metas() -> int | None:
+    """메타 청크를 교체 인덱싱한다. 메타 파일이 없으면 None."""
     from src.layer2_rag.meta_generator import MetaGenerator
-    from src.layer2_rag.vector_db import VectorStore
+    from src.layer2_rag.registry import get_store
 
     gen = MetaGenerator(_config)
     chunks = gen.index_all_metas()
     if not chunks:
-        return {"indexed": 0, "message": "인덱싱할 메타 파일 없음"}
+        return None
 
-    store = VectorStore(_config)
+    store = get_store(_config)
     for chunk in chunks:
         store.delete_by_file(chunk.file_path)
-    count = store.add_chunks(chunks)
-    return {"indexed": count, "message": f"{count}개 메타 청크 인덱싱 완료"}
+    return store.add_chunks(chunks)
 
 
 @app.get("/api/meta/coverage")
@@ -407,7 +548,7 @@ async def meta_coverage():
     from src.layer2_rag.meta_generator import MetaGenerator
 
     gen = MetaGenerator(_config)
-    return gen.get_coverage()
+    return await _executor.run("meta", gen.get_coverage)
 
 
 @app.get("/api/meta/dependency-graph")
@@ -416,7 +557,7 @@ async def meta_dependency_graph():
     from src.layer2_rag.meta_generator import MetaGenerator
 
     gen = MetaGenerator(_config)
-    return gen.get_dependency_graph()
+    return await _executor.run("meta", gen.get_dependency_graph)
 
 
 @app.put("/api/meta/update")
@@ -459,46 +600,55 @@ async def delete_meta(data: dict):
 @app.post("/api/gate-check")
 async def gate_check(data: dict):
     """IDE Extension에서 호출 - 특정 파일에 대해 Gate를 실행한다."""
-    from src.layer2_rag.gate_basic import BasicGate
-    from src.layer3_agents.review_agent import ReviewAgent
-    from src.layer3_agents.arch_agent import ArchitectureAgent
-
     file_path = Path(data.get("file_path", ""))
     if not file_path.exists():
         return {"results": [], "error": "File not found"}
 
-    results = []
-    gate = BasicGate(_config)
-    for r in gate.run_all(file_path):
-        results.append({
-            "gate_number": r.gate_number,
-            "gate_name": r.gate_name,
-            "status": r.status.value,
-            "message": r.message,
-            "details": r.details,
-        })
+    results = await _executor.run("gate", _run_gate_check, file_path)
+    return {"results": results}
 
-    review = ReviewAgent(_config)
-    r = review.run(file_path)
-    results.append({
-        "gate_number": r.gate_number,
-        "gate_name": r.gate_name,
-        "status": r.status.value,
-        "message": r.message,
-        "details": r.details,
-    })
 
+def _run_gate_check(file_path: Path) -> list[dict]:
+    """Gate 1/2/4/5를 실행한다 (실행기 스레드에서 호출)."""
+    from src.layer2_rag.gate_basic import BasicGate
+    from src.layer3_agents.review_agent import ReviewAgent
+    from src.layer3_agents.arch_agent import ArchitectureAgent
+    from src.shared.file_context import FileAnalysisContext
+
+    context = FileAnalysisContext.from_path(file_path)
+    gate = BasicGate(_config)
+    review = ReviewAgent(_config)
     arch = ArchitectureAgent(_config)
-    r = arch.run(file_path)
-    results.append({
-        "gate_number": r.gate_number,
-        "gate_name": r.gate_name,
-        "status": r.status.value,
-        "message": r.message,
-        "details": r.details,
-    })
+    gates = [
+        (1, lambda: gate.run_gate1(file_path, context)),
+        (2, lambda: gate.run_gate2(file_path, context)),
+        (4, lambda: review.run(file_path, context)),
+        (5, lambda: arch.run(file_path, context)),
+    ]
+
+    # 저장할 때마다 호출되므로 내용이 그대로인 파일은 캐시된 결과를 반환한다
+    cache = _result_cache() if _config.gate.cache_results else None
+    results = []
+    for number, run in gates:
+        r = cache.get_or_run(number, context, run) if cache else run()
+        results.append(_gate_result_to_dict(r))
+    return results
+
+
+_gate_cache = None
+_gate_cache_lock = threading.Lock()
 
-    return {"results": results}
+
+def _result_cache():
+    """Gate 결과 캐시를 지연 생성한다 (Gate 검사는 executor 스레드에서 동시에 실행된다)."""
+    global _gate_cache
+    if _gate_cache is None:
+        with _gate_cache_lock:
+            if _gate_cache is None:
+                from src.layer3_agents.gate_cache import GateResultCache
+
+                _gate_cache = GateResultCache(_config)
+    return _gate_cache
 
 
 @app.post("/api/integration-test")
@@ -514,15 +664,15 @@ async def run_integration_test(data: dict):
     if not changed:
         return {"error": "존재하는 파일이 없습니다."}
 
+    if data.get("background"):
+        def job(task: BackgroundTask) -> dict:
+            agent = IntegrationAgent(_config, on_test=_test_progress_reporter(task))
+            return _gate_result_to_dict(agent.run(changed))
+
+        return _submit_task("pipeline", job)
     agent = IntegrationAgent(_config)
-    result = agent.run(changed)
-    return {
-        "gate_number": result.gate_number,
-        "gate_name": result.gate_name,
-        "status": result.status.value,
-        "message": result.message,
-        "details": result.details,
-    }
+    result = await _executor.run("pipeline", agent.run, changed)
+    return _gate_result_to_dict(result)
 
 
 def _resolve_file_path(file_path_str: str) -> Path | None:
@@ -563,28 +713,104 @@ async def run_pipeline(data: dict):
         for g in range(1, 7):
             runner.set_policy(g, FailPolicy.BYPASS)
 
-    result = runner.run_all(file_path, author=author)
+    if data.get("background"):
+        return _submit_task(
+            "pipeline",
+            lambda task: runner.run_all(file_path, author=author),
+            on_done=_record_pipeline,
+        )
+    result = await _executor.run("pipeline", runner.run_all, file_path, author=author)
+    return await _record_pipeline(result)
 
-    gate_results = []
-    for gr in result.gate_results:
-        gate_results.append(_gate_result_to_dict(gr))
-        _metrics.record_gate_result(gr)
 
-    response_data = {
-        "success": True,
+def _pipeline_to_dict(result) -> dict:
+    """PipelineResult를 직렬화 가능한 dict로 변환한다."""
+    return {
         "overall_status": result.overall_status.value,
         "summary": result.summary,
         "total_time": round(result.total_time_seconds, 2),
         "stopped_at": result.stopped_at,
-        "gates": gate_results,
+        "gates": [_gate_result_to_dict(gr) for gr in result.gate_results],
+        "gate_timings": result.gate_timings,
     }
 
-    for ws in _ws_clients:
+
+async def _record_pipeline(result) -> dict:
+    """파이프라인 결과를 메트릭에 기록하고 WebSocket으로 알린다."""
+    for gr in result.gate_results:
+        _metrics.record_gate_result(gr)
+
+    response_data = {"success": True, **_pipeline_to_dict(result)}
+
+    await _broadcast({"type": "pipeline_result", "data": response_data})
+    return response_data
+
+
+@app.post("/api/pipeline/batch")
+async def run_pipeline_batch(data: dict):
+    """변경 파일 묶음에 대해 배치 파이프라인을 실행한다.
+
+    files 목록 또는 staged=true(git 스테이징 파일)를 받는다.
+    Gate 1, 2, 4, 5는 파일별로, Gate 3, 6은 변경 세트 전체에 한 번만 실행된다.
+    """
+    from src.layer3_agents.gate_runner import GateChainRunner, FailPolicy
+
+    author = data.get("author", "dashboard")
+    files: list[Path] = []
+    missing: list[str] = []
+    for file_path_str in data.get("files", []):
+        file_path = _resolve_file_path(file_path_str)
+        if file_path:
+            files.append(file_path)
+        else:
+            missing.append(file_path_str)
+
+    if data.get("staged"):
+        from src.shared.file_walker import staged_files
+
         try:
-            await ws.send_json({"type": "pipeline_result", "data": response_data})
-        except Exception:
-            pass
+            files += staged_files(PROJECT_ROOT, _config.rag.supported_extensions)
+        except RuntimeError as e:
+            return {"success": False, "error": str(e)}
+
+    if not files:
+        return {"success": False, "error": "No files to check", "missing": missing}
+
+    runner = GateChainRunner(_config)
+    if data.get("bypass", False):
+        for g in range(1, 7):
+            runner.set_policy(g, FailPolicy.BYPASS)
+
+    if data.get("background"):
+        return _submit_task(
+            "pipeline",
+            lambda task: runner.run_batch(files, author=author),
+            on_done=lambda batch: _record_pipeline_batch(batch, missing),
+        )
+    batch = await _executor.run("pipeline", runner.run_batch, files, author=author)
+    return await _record_pipeline_batch(batch, missing)
+
+
+async def _record_pipeline_batch(batch, missing: list[str]) -> dict:
+    """배치 파이프라인 결과를 메트릭에 기록하고 WebSocket으로 알린다."""
+    for gr in batch.gate_results:
+        _metrics.record_gate_result(gr)
 
+    response_data = {
+        "success": True,
+        "overall_status": batch.overall_status.value,
+        "summary": batch.summary,
+        "total_time": round(batch.total_time_seconds, 2),
+        "stopped_files": batch.stopped_files,
+        "files": {
+            file_path: _pipeline_to_dict(result)
+            for file_path, result in batch.file_results.items()
+        },
+        "changeset": _pipeline_to_dict(batch.changeset_result),
+        "missing": missing,
+    }
+
+    await _broadcast({"type": "pipeline_batch_result", "data": response_data})
     return response_data
 
 
@@ -720,7 +946,7 @@ async def onboarding_qa(data: dict):
     question = data.get("question", "")
     if not question.strip():
         return {"error": "empty question"}
-    return _onboarding.answer_question(question)
+    return await _executor.run("search", _onboarding.answer_question, question)
 
 
 # --- Health Breakdown API ---
@@ -990,6 +1216,35 @@ async def get_project_zones(project_id: str):
     }
 
 
+# --- Background Task API ---
+
+@app.get("/api/tasks")
+async def list_tasks():
+    """백그라운드 작업 목록과 실행기 상태."""
+    return {
+        "tasks": [t.to_dict() for t in _tasks.list()],
+        "executors": _executor.stats(),
+    }
+
+
+@app.get("/api/tasks/{task_id}")
+async def get_task(task_id: str):
+    """백그라운드 작업 상태/결과 조회."""
+    task = _tasks.get(task_id)
+    if not task:
+        return {"error": f"Task not found: {task_id}"}
+    return task.to_dict()
+
+
+@app.post("/api/tasks/{task_id}/cancel")
+async def cancel_task(task_id: str):
+    """백그라운드 작업 취소 요청. 인덱싱/일괄 분석은 파일 경계에서 멈춘다."""
+    task = _tasks.cancel(task_id)
+    if not task:
+        return {"success": False, "error": f"Task not found: {task_id}"}
+    return {"success": True, "task": task.to_dict()}
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """실시간 데이터 스트리밍 WebSocket."""
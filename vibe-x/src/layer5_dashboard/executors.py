@@ -0,0 +1,250 @@
+"""Task 4.1 - 대시보드 블로킹 작업 실행기.
+
+FastAPI 핸들러는 async def지만 인덱싱, 게이트 실행(pytest 서브프로세스),
+ChromaDB 질의는 모두 동기 코드다. 이벤트 루프에서 직접 호출하면 재인덱싱 한 번에
+다른 모든 요청과 WebSocket ping이 멈춘다. 이 모듈은 작업 종류별 스레드 풀로
+동시 실행 수를 제한하고, 긴 작업은 백그라운드 작업으로 돌려 폴링/스트리밍하게 한다.
+
+백그라운드 작업은 진행 상황 보고, 협조적 취소(threading.Event),
+같은 키의 중복 요청 병합을 지원한다.
+"""
+
+import asyncio
+import functools
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from src.shared.config import DashboardConfig
+from src.shared.logger import get_logger
+
+logger = get_logger("executors")
+
+
+class WorkExecutor:
+    """작업 종류별 고정 크기 스레드 풀.
+
+    인덱서는 내부적으로 프로세스 풀을, 게이트는 pytest 서브프로세스를 쓰므로
+    대시보드 쪽은 이벤트 루프를 비우는 스레드 풀이면 충분하다.
+
+    사용 예:
+        results = await executor.run("search", searcher.search, query)
+    """
+
+    def __init__(self, config: DashboardConfig | None = None) -> None:
+        config = config or DashboardConfig()
+        self._limits = dict(config.executor_limits)
+        self._default_limit = config.default_executor_limit
+        self._pools: dict[str, ThreadPoolExecutor] = {}
+        self._running: dict[str, int] = {}
+        self._waiting: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def limit(self, kind: str) -> int:
+        """작업 종류의 동시 실행 한도."""
+        return max(1, self._limits.get(kind, self._default_limit))
+
+    def _pool(self, kind: str) -> ThreadPoolExecutor:
+        with self._lock:
+            pool = self._pools.get(kind)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self.limit(kind), thread_name_prefix=f"vibe-x-{kind}"
+                )
+                self._pools[kind] = pool
+            return pool
+
+    async def run(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """동기 함수를 kind 풀에서 실행하고 결과를 기다린다."""
+        self._count(self._waiting, kind, 1)
+        future = self._pool(kind).submit(functools.partial(self._track, kind, fn, *args, **kwargs))
+        # 시작 전에 취소되면(요청 취소, shutdown) _track이 돌지 않으므로 여기서 대기 수를 되돌린다
+        future.add_done_callback(
+            lambda f: self._count(self._waiting, kind, -1) if f.cancelled() else None
+        )
+        return await asyncio.wrap_future(future)
+
+    def _track(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._count(self._waiting, kind, -1)
+        self._count(self._running, kind, 1)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._count(self._running, kind, -1)
+
+    def _count(self, counter: dict[str, int], kind: str, delta: int) -> None:
+        with self._lock:
+            counter[kind] = counter.get(kind, 0) + delta
+
+    def stats(self) -> dict:
+        """종류별 한도/실행 중/대기 중 작업 수."""
+        kinds = sorted(set(self._limits) | set(self._pools))
+        with self._lock:
+            return {
+                kind: {
+                    "limit": self.limit(kind),
+                    "running": self._running.get(kind, 0),
+                    "waiting": self._waiting.get(kind, 0),
+                }
+                for kind in kinds
+            }
+
+    def shutdown(self) -> None:
+        """모든 풀을 종료한다. 실행 중인 작업은 끝까지 수행된다."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass
+class BackgroundTask:
+    """백그라운드 작업 상태."""
+    task_id: str
+    kind: str
+    key: str | None = None  # 중복 병합 키 (같은 키의 진행 중 작업이 있으면 재사용)
+    status: str = "pending"  # pending | running | done | failed | cancelled
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: Any = None
+    error: str | None = None
+    progress: dict | None = None
+    merged: int = 0  # 병합된 중복 요청 수
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+
+    def to_dict(self) -> dict:
+        return {
+            "task_id": self.task_id,
+            "kind": self.kind,
+            "key": self.key,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+            "merged": self.merged,
+            "cancel_requested": self.cancel_event.is_set(),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+TaskListener = Callable[[BackgroundTask], Awaitable[None]]
+TaskJob = Callable[[BackgroundTask], Awaitable[Any]]
+
+
+class BackgroundTasks:
+    """긴 작업을 asyncio 태스크로 실행하고 상태를 보관한다.
+
+    클라이언트는 task_id로 폴링하거나, 상태 변경을 /ws로 받는다(listener).
+    """
+
+    def __init__(
+        self, max_finished: int = 100, listener: TaskListener | None = None
+    ) -> None:
+        self._tasks: OrderedDict[str, BackgroundTask] = OrderedDict()
+        self._handles: dict[str, asyncio.Task] = {}
+        self._max_finished = max_finished
+        self._listener = listener
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def submit(self, kind: str, job: TaskJob, key: str | None = None) -> BackgroundTask:
+        """작업을 백그라운드에서 실행한다. 이벤트 루프 안에서 호출해야 한다.
+
+        Args:
+            kind: 작업 종류
+            job: 작업 자신을 받아 실행하는 코루틴 팩토리
+                (task.cancel_event 확인, report()로 진행 보고)
+            key: 중복 병합 키. 같은 키의 작업이 아직 끝나지 않았으면
+                새로 실행하지 않고 그 작업을 반환한다.
+        """
+        if key is not None:
+            active = self.find_active(key)
+            if active is not None:
+                active.merged += 1
+                logger.info(f"중복 작업 병합: {key} → {active.task_id}")
+                return active
+
+        self._loop = asyncio.get_running_loop()
+        task = BackgroundTask(task_id=uuid.uuid4().hex[:12], kind=kind, key=key)
+        self._tasks[task.task_id] = task
+        self._handles[task.task_id] = self._loop.create_task(self._execute(task, job))
+        self._evict_finished()
+        return task
+
+    def get(self, task_id: str) -> BackgroundTask | None:
+        return self._tasks.get(task_id)
+
+    def list(self) -> list[BackgroundTask]:
+        return list(self._tasks.values())
+
+    def find_active(self, key: str) -> BackgroundTask | None:
+        """키가 같은, 아직 끝나지 않은 작업을 찾는다."""
+        for task in self._tasks.values():
+            if task.key == key and not task.finished:
+                return task
+        return None
+
+    def cancel(self, task_id: str) -> BackgroundTask | None:
+        """작업에 취소를 요청한다.
+
+        취소는 협조적이다: 작업이 cancel_event를 확인하는 지점(파일 경계 등)에서 멈추며,
+        확인하지 않는 작업은 끝까지 실행된 뒤 cancelled로 표시된다.
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task.finished:
+            return task
+        task.cancel_event.set()
+        return task
+
+    def report(self, task: BackgroundTask, progress: dict) -> None:
+        """진행 상황을 갱신하고 listener에 알린다. 워커 스레드에서 호출해도 안전하다."""
+        task.progress = progress
+        loop = self._loop
+        if loop is None or self._listener is None:
+            return
+        try:
+            loop.call_soon_threadsafe(lambda: loop.create_task(self._notify(task)))
+        except RuntimeError:
+            pass  # 서버 종료로 루프가 닫힘
+
+    async def _execute(self, task: BackgroundTask, job: TaskJob) -> None:
+        task.status = "running"
+        task.started_at = datetime.now().isoformat()
+        await self._notify(task)
+        try:
+            task.result = await job(task)
+            task.status = "cancelled" if task.cancel_event.is_set() else "done"
+        except Exception as e:
+            task.error = str(e)
+            task.status = "failed"
+            logger.warning(f"백그라운드 작업 실패 ({task.kind} {task.task_id}): {e}")
+        finally:
+            task.finished_at = datetime.now().isoformat()
+            self._handles.pop(task.task_id, None)
+        await self._notify(task)
+
+    async def _notify(self, task: BackgroundTask) -> None:
+        if self._listener is None:
+            return
+        try:
+            await self._listener(task)
+        except Exception as e:
+            logger.warning(f"작업 상태 알림 실패: {e}")
+
+    def _evict_finished(self) -> None:
+        """완료된 작업이 max_finished를 넘으면 오래된 것부터 버린다."""
+        finished = [t.task_id for t in self._tasks.values() if t.finished]
+        for task_id in finished[: max(0, len(finished) - self._max_finished)]:
+            del self._tasks[task_id]
@@ -4,6 +4,7 @@ Gate 결과, 비용, 활동 로그 등 프로젝트 지표를 수집하고 저
 """
 
 import json
+import sqlite3
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -60,6 +61,7 @@ class MetricsCollector:
         self._daily_metrics: dict[str, DailyMetric] = {}
         self._team_activity: dict[str, TeamMemberActivity] = {}
         self._state_path = self._config.paths.vibe_x_root / ".state" / "metrics.json"
+        self._gate_cache = None
 
         self._load_state()
 
@@ -168,8 +170,21 @@ class MetricsCollector:
                 for m in self._team_activity.values()
             ],
             "health_score": self._calculate_health_score(),
+            "gate_cache": self.get_gate_cache_stats(),
         }
 
+    def get_gate_cache_stats(self) -> dict:
+        """Gate 결과 캐시 적중률 (CLI, 대시보드, MCP 실행 누적)."""
+        if self._gate_cache is None:
+            from src.layer3_agents.gate_cache import GateResultCache
+
+            self._gate_cache = GateResultCache(self._config)
+        try:
+            return self._gate_cache.stats()
+        except sqlite3.Error as e:
+            logger.warning(f"Gate 캐시 통계 조회 실패: {e}")
+            return {"hits": 0, "misses": 0, "hit_rate": 0, "entries": 0, "bytes": 0, "per_gate": {}}
+
     def _get_per_gate_pass_rates(self) -> list[float]:
         """Gate 1~6 각각의 통과율(%)을 계산한다.
 
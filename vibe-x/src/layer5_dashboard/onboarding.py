@@ -122,9 +122,9 @@ class OnboardingBriefing:
         벡터 DB에서 관련 코드/문서를 검색하고,
         ADR + 코딩 규칙 + 아키텍처 문서를 함께 참고한다.
         """
-        from src.layer2_rag.searcher import CodeSearcher
+        from src.layer2_rag.registry import get_searcher
 
-        searcher = CodeSearcher(self._config)
+        searcher = get_searcher(self._config)
         results = searcher.search(question, top_k=MAX_QA_RESULTS)
 
         code_context = []
@@ -22,6 +22,26 @@ class PathConfig:
     def chroma_db_path(self) -> Path:
         return self.vibe_x_root / ".chromadb"
 
+    @property
+    def index_manifest_path(self) -> Path:
+        return self.vibe_x_root / ".index-manifest.db"
+
+    @property
+    def keyword_index_path(self) -> Path:
+        return self.vibe_x_root / ".keyword-index.db"
+
+    @property
+    def gate_cache_path(self) -> Path:
+        return self.vibe_x_root / ".state" / "gate-cache.db"
+
+    @property
+    def import_graph_path(self) -> Path:
+        return self.vibe_x_root / ".state" / "import-graph.json"
+
+    @property
+    def coverage_map_path(self) -> Path:
+        return self.vibe_x_root / ".state" / "coverage-map.json"
+
     @property
     def memory_path(self) -> Path:
         return self.vibe_x_root / "memory.md"
@@ -46,8 +66,22 @@ class RagConfig:
     collection_name: str = "vibe_x_codebase"
     chunk_max_lines: int = 50
     chunk_overlap_lines: int = 5
+    chunk_max_tokens: int = 256  # 임베딩 모델 최대 시퀀스 길이, 0이면 토큰 제한 없음
     search_top_k: int = 10
+    hybrid_keyword_weight: float = 0.5  # RRF 융합 시 BM25 비중 (0이면 벡터만, 1이면 키워드만)
+    rrf_k: int = 60  # Reciprocal Rank Fusion 상수
+    query_embedding_cache_size: int = 1024  # 질의 임베딩 LRU 캐시 크기 (0이면 비활성)
+    result_cache_size: int = 256
+    result_cache_ttl_seconds: float = 30.0  # 검색 결과 캐시 유효 시간 (0이면 비활성)
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_batch_size: int = 64
+    upsert_batch_size: int = 1024
+    index_workers: int = 0  # 0이면 CPU 코어 수만큼 청킹 프로세스 사용
+    stream_threshold_bytes: int = 4 * 1024 * 1024  # 이보다 큰 파일은 스트리밍 청킹, 0이면 비활성
+    watch_debounce_seconds: float = 1.0  # watch 데몬: 마지막 저장 후 이 시간 동안 조용하면 재인덱싱
+    watch_max_delay_seconds: float = 10.0  # watch 데몬: 저장이 계속돼도 이 시간 안에는 재인덱싱
+    respect_gitignore: bool = True  # 파일 수집 시 .gitignore 패턴 적용
+    use_git_ls_files: bool = False  # True면 `git ls-files`로 파일 목록 수집 (git 저장소가 아니면 무시)
     supported_extensions: tuple = (
         ".py", ".ts", ".tsx", ".js", ".jsx",
         ".md", ".json", ".yaml", ".yml",
@@ -64,6 +98,16 @@ class GateConfig:
     """품질 게이트 설정."""
 
     max_function_lines: int = 50
+    parallel_gates: bool = True  # STOP 정책이 아닌 연속 Gate를 병렬 실행
+    max_parallel_gates: int = 4
+    max_parallel_files: int = 4  # 배치 파이프라인에서 파일별 Gate(1, 2, 4, 5)를 동시 실행할 파일 수
+    cache_results: bool = True  # Gate 1, 2, 4, 5 결과를 파일 내용 해시로 캐시
+    cache_max_entries: int = 5000
+    cache_max_bytes: int = 16 * 1024 * 1024
+    test_shards: int = 1  # Gate 3 테스트를 나눠 동시에 실행할 pytest 프로세스 수
+    warm_test_workers: bool = False  # 라이브러리를 미리 import한 forkserver에서 pytest 실행
+    test_worker_preload: tuple = ("pytest", "fastapi", "pydantic", "chromadb")
+    coverage_selection: bool = False  # Gate 3이 커버리지 맵으로 변경 hunk에 닿는 테스트만 실행
     required_type_hints: bool = True
     forbidden_patterns: tuple = (
         "console.log",
@@ -73,6 +117,22 @@ class GateConfig:
     )
 
 
+@dataclass(frozen=True)
+class DashboardConfig:
+    """대시보드 서버 설정."""
+
+    # 작업 종류별 동시 실행 한도. 초과 요청은 해당 풀의 대기열에서 기다린다.
+    executor_limits: tuple = (
+        ("search", 8),
+        ("meta", 2),
+        ("gate", 2),
+        ("pipeline", 2),
+        ("index", 1),
+    )
+    default_executor_limit: int = 2
+    max_finished_tasks: int = 100  # 폴링용으로 보관하는 완료된 백그라운드 작업 수
+
+
 @dataclass(frozen=True)
 class VibeXConfig:
     """VIBE-X 통합 설정."""
@@ -80,6 +140,7 @@ class VibeXConfig:
     paths: PathConfig = field(default_factory=PathConfig)
     rag: RagConfig = field(default_factory=RagConfig)
     gate: GateConfig = field(default_factory=GateConfig)
+    dashboard: DashboardConfig = field(default_factory=DashboardConfig)
     version: str = "0.5.0"
 
 
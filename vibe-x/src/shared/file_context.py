@@ -0,0 +1,114 @@
+"""VIBE-X 파일 분석 컨텍스트.
+
+Gate 1, 2, 4, 5가 같은 파일을 각자 read_text → split → 정규식 순으로 다시 처리하던 것을
+파일당 한 번의 읽기로 합친다. 파이프라인 실행마다 하나를 만들어 모든 Gate에 전달한다.
+라인 오프셋 테이블, AST, 함수 범위는 처음 요청될 때 한 번만 만든다.
+"""
+
+import ast
+from functools import cached_property
+from pathlib import Path
+from typing import NamedTuple
+
+from src.shared.line_index import LineIndex
+
+
+def _decode(raw: bytes, errors: str) -> str:
+    """`Path.read_text`와 같은 결과가 되도록 디코딩 후 개행을 \\n으로 통일한다."""
+    text = raw.decode("utf-8", errors=errors)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class FunctionSpan(NamedTuple):
+    """함수(메서드, async 포함) 하나의 라인 범위."""
+
+    start: int  # 데코레이터를 포함한 시작 라인
+    end: int
+    qualname: str  # 예: "A.f", "A.f.<locals>.g"
+    lineno: int  # def 라인
+
+
+def function_spans(tree: ast.Module) -> list[FunctionSpan]:
+    """AST 한 번 순회로 모든 함수의 범위를 소스 순서대로 수집한다."""
+    spans: list[FunctionSpan] = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = f"{prefix}{child.name}"
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                spans.append(
+                    FunctionSpan(start, child.end_lineno or child.lineno, name, child.lineno)
+                )
+                visit(child, f"{name}.<locals>.")
+            elif isinstance(child, ast.ClassDef):
+                visit(child, f"{prefix}{child.name}.")
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+    return spans
+
+
+class FileAnalysisContext:
+    """한 파일의 내용, 라인, 라인 오프셋, AST를 공유하는 분석 컨텍스트.
+
+    사용 예:
+        context = FileAnalysisContext.from_path(file_path)
+        gate.run_gate1(file_path, context)
+        ReviewAgent(config).run(file_path, context)
+
+    - read_error: 파일을 읽지 못했으면 OSError (이때 content는 빈 문자열)
+    - decode_error: UTF-8이 아니면 UnicodeDecodeError
+      (content는 잘못된 바이트를 U+FFFD로 치환한 내용)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        raw: bytes = b"",
+        read_error: OSError | None = None,
+    ) -> None:
+        self.path = path
+        self.suffix = path.suffix
+        self.read_error = read_error
+        self.decode_error: UnicodeDecodeError | None = None
+        try:
+            self.content = _decode(raw, "strict")
+        except UnicodeDecodeError as e:
+            self.decode_error = e
+            self.content = _decode(raw, "replace")
+
+    @classmethod
+    def from_path(cls, path: Path) -> "FileAnalysisContext":
+        """파일을 한 번 읽어 컨텍스트를 만든다. 읽기 실패도 컨텍스트에 기록한다."""
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            return cls(path, read_error=e)
+        return cls(path, raw)
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.content.split("\n")
+
+    @cached_property
+    def line_index(self) -> LineIndex:
+        """문자열 오프셋 → 라인 번호 변환 테이블."""
+        return LineIndex(self.content, self.lines)
+
+    @cached_property
+    def tree(self) -> ast.Module | None:
+        """Python 파일의 AST. Python 파일이 아니거나 구문 오류면 None."""
+        if self.suffix != ".py" or self.read_error is not None:
+            return None
+        try:
+            return ast.parse(self.content, filename=str(self.path))
+        except (SyntaxError, ValueError):
+            return None
+
+    @cached_property
+    def function_spans(self) -> list[FunctionSpan]:
+        """Python 함수 범위 목록. AST가 없으면 빈 목록."""
+        tree = self.tree
+        return function_spans(tree) if tree is not None else []
@@ -0,0 +1,288 @@
+"""VIBE-X 프로젝트 파일 탐색기.
+
+`root.rglob("*")` 후 `item.parts`로 무시 디렉토리를 거르는 방식은 node_modules,
+.git 같은 디렉토리 안까지 모두 내려가 stat을 호출한다. 이 모듈은 os.scandir로
+디렉토리를 내려가기 전에 가지치기하고, .gitignore 패턴을 적용한다.
+선택적으로 `git ls-files` 결과를 파일 목록으로 사용할 수 있다.
+`staged_files`는 커밋 단위 검증을 위해 스테이징된 파일 목록을 반환한다.
+"""
+
+import os
+import re
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from src.shared.logger import get_logger
+
+logger = get_logger("file-walker")
+
+GITIGNORE_FILE = ".gitignore"
+GIT_LS_FILES_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """.gitignore 한 줄을 정규식으로 변환한 규칙."""
+    base: str          # .gitignore가 있는 디렉토리 (root 기준 POSIX 상대 경로, 루트는 "")
+    regex: re.Pattern
+    negated: bool
+    dir_only: bool
+    root_prefix: str = ""  # 상위 디렉토리의 .gitignore: 그 디렉토리에서 root까지의 경로
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.root_prefix:
+            rel_path = f"{self.root_prefix}/{rel_path}"
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        return self.regex.match(rel_path) is not None
+
+
+def _translate(pattern: str) -> str:
+    """gitignore glob을 정규식으로 변환한다 (`**`, `*`, `?`, `[...]` 지원)."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            body = pattern[i + 1:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def parse_gitignore(text: str, base: str = "") -> list[IgnoreRule]:
+    """.gitignore 내용을 규칙 목록으로 변환한다."""
+    rules: list[IgnoreRule] = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        if line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # 중간/앞에 "/"가 있으면 .gitignore 위치 기준, 없으면 어느 깊이든 이름 매칭
+        anchored = "/" in line
+        body = _translate(line.lstrip("/"))
+        regex = re.compile(f"{body}$" if anchored else f"(?:.*/)?{body}$")
+        rules.append(IgnoreRule(base=base, regex=regex, negated=negated, dir_only=dir_only))
+    return rules
+
+
+def _load_rules(directory: Path, base: str) -> list[IgnoreRule]:
+    try:
+        text = (directory / GITIGNORE_FILE).read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return []
+    return parse_gitignore(text, base)
+
+
+def _is_ignored(rules: list[IgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    """마지막으로 매칭된 규칙이 결과를 결정한다 (`!`로 다시 포함 가능)."""
+    ignored = False
+    for rule in rules:
+        if rule.negated == ignored and rule.matches(rel_path, is_dir):
+            ignored = not rule.negated
+    return ignored
+
+
+def _ancestor_rules(root: Path) -> list[IgnoreRule]:
+    """root가 git 저장소 하위 디렉토리면 상위 .gitignore 규칙을 root 기준으로 가져온다."""
+    chain: list[Path] = []
+    current = root
+    while True:
+        if (current / ".git").exists():
+            break
+        if current.parent == current:
+            return []
+        current = current.parent
+        chain.append(current)
+
+    rules: list[IgnoreRule] = []
+    for ancestor in reversed(chain):
+        prefix = root.relative_to(ancestor).as_posix()
+        rules.extend(
+            replace(rule, root_prefix=prefix) for rule in _load_rules(ancestor, "")
+        )
+    return rules
+
+
+def is_path_ignored(root: Path, path: Path) -> bool:
+    """root 기준으로 path가 .gitignore에 의해 제외되는지 확인한다 (단일 파일 이벤트용)."""
+    root = root.resolve()
+    try:
+        parts = path.resolve().relative_to(root).parts
+    except ValueError:
+        return False
+    rules = _ancestor_rules(root) + _load_rules(root, "")
+    for depth in range(1, len(parts)):
+        rel_dir = "/".join(parts[:depth])
+        if _is_ignored(rules, rel_dir, True):
+            return True
+        rules = rules + _load_rules(root / rel_dir, rel_dir)
+    return bool(parts) and _is_ignored(rules, "/".join(parts), False)
+
+
+def walk_files(
+    root: Path,
+    extensions: Iterable[str] | None = None,
+    ignored_dirs: Iterable[str] = (),
+    use_gitignore: bool = True,
+    use_git: bool = False,
+) -> list[Path]:
+    """root 하위 파일을 정렬된 목록으로 반환한다. 경로는 root를 그대로 접두사로 쓴다.
+
+    Args:
+        root: 탐색 시작 디렉토리
+        extensions: 포함할 확장자 (None이면 전체)
+        ignored_dirs: 이름이 일치하면 내려가지 않는 디렉토리
+        use_gitignore: .gitignore 패턴 적용 여부 (중첩 .gitignore 포함)
+        use_git: True면 `git ls-files`로 목록을 얻는다 (git 저장소가 아니면 scandir로 대체)
+    """
+    suffixes = frozenset(extensions) if extensions is not None else None
+    ignored = frozenset(ignored_dirs)
+
+    if use_git:
+        files = _git_ls_files(root, suffixes, ignored)
+        if files is not None:
+            return files
+
+    return sorted(_scan(root, suffixes, ignored, use_gitignore))
+
+
+def _scan(
+    root: Path,
+    suffixes: frozenset[str] | None,
+    ignored: frozenset[str],
+    use_gitignore: bool,
+) -> list[Path]:
+    files: list[Path] = []
+    base_rules = _ancestor_rules(root.resolve()) if use_gitignore else []
+    # (디렉토리 경로, root 기준 상대 경로, 적용할 규칙)
+    stack: list[tuple[str, str, list[IgnoreRule]]] = [(str(root), "", base_rules)]
+    while stack:
+        dir_path, rel_dir, rules = stack.pop()
+        if use_gitignore and os.path.isfile(os.path.join(dir_path, GITIGNORE_FILE)):
+            rules = rules + _load_rules(Path(dir_path), rel_dir)
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError as e:
+            logger.debug(f"디렉토리 읽기 실패 - {dir_path}: {e}")
+            continue
+
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name in ignored or (rules and _is_ignored(rules, rel, True)):
+                    continue
+                stack.append((entry.path, rel, rules))
+            elif is_file:
+                if suffixes is not None and os.path.splitext(entry.name)[1] not in suffixes:
+                    continue
+                if rules and _is_ignored(rules, rel, False):
+                    continue
+                files.append(Path(entry.path))
+    return files
+
+
+def _git_ls_files(
+    root: Path, suffixes: frozenset[str] | None, ignored: frozenset[str]
+) -> list[Path] | None:
+    """git이 추적 중이거나 무시되지 않은 새 파일 목록. 실패하면 None."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            timeout=GIT_LS_FILES_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"git ls-files 실행 실패, scandir 사용: {e}")
+        return None
+    if result.returncode != 0:
+        logger.debug("git 저장소가 아님, scandir 사용")
+        return None
+
+    files: set[Path] = set()
+    for raw in result.stdout.split(b"\0"):
+        if not raw:
+            continue
+        rel = raw.decode("utf-8", errors="surrogateescape")
+        parts = rel.split("/")
+        if any(part in ignored for part in parts[:-1]):
+            continue
+        if suffixes is not None and os.path.splitext(parts[-1])[1] not in suffixes:
+            continue
+        path = root / rel
+        # 삭제됐지만 아직 커밋되지 않은 파일은 인덱스에 남아 있음
+        if path.is_file():
+            files.add(path)
+    return sorted(files)
+
+
+def staged_files(root: Path, extensions: Iterable[str] | None = None) -> list[Path]:
+    """git 인덱스에 스테이징된(추가/수정/이름 변경) 파일 목록. 삭제된 파일은 제외한다.
+
+    Raises:
+        RuntimeError: git 실행 실패 또는 git 저장소가 아닌 경우
+    """
+    suffixes = frozenset(extensions) if extensions is not None else None
+    try:
+        top = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=root, capture_output=True, text=True, timeout=GIT_LS_FILES_TIMEOUT_SECONDS,
+        )
+        diff = subprocess.run(
+            ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR"],
+            cwd=root, capture_output=True, timeout=GIT_LS_FILES_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"git 실행 실패: {e}") from e
+    if top.returncode != 0 or diff.returncode != 0:
+        raise RuntimeError(f"git 저장소가 아님: {root}")
+
+    # git diff 경로는 저장소 최상위 기준
+    repo_root = Path(top.stdout.strip())
+    files: list[Path] = []
+    for raw in diff.stdout.split(b"\0"):
+        if not raw:
+            continue
+        path = repo_root / raw.decode("utf-8", errors="surrogateescape")
+        if suffixes is not None and path.suffix not in suffixes:
+            continue
+        if path.is_file():
+            files.append(path)
+    return sorted(files)
@@ -0,0 +1,46 @@
+"""VIBE-X 라인 오프셋 인덱스.
+
+문자열 오프셋 → 라인 번호 변환을 O(log n)으로 처리한다.
+`content[:pos].count("\\n")` 처럼 매치마다 앞부분을 다시 세는 O(n^2) 패턴을 대체한다.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LineIndex:
+    """파일 내용의 라인 시작 오프셋 테이블.
+
+    사용 예:
+        index = LineIndex(content)
+        line_num = index.line_of(match.start())   # 1부터 시작
+        body = index.slice(10, 20)                 # 10~20번 라인 (포함)
+    """
+
+    def __init__(self, content: str, lines: list[str] | None = None) -> None:
+        self.content = content
+        self.lines = lines if lines is not None else content.split("\n")
+        # offsets[i] = (i+1)번째 라인의 시작 위치
+        self.offsets: list[int] = list(
+            accumulate(
+                (len(line) for line in self.lines[:-1]),
+                lambda total, length: total + length + 1,
+                initial=0,
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def line_of(self, pos: int) -> int:
+        """문자열 오프셋이 속한 라인 번호(1부터)를 반환한다."""
+        return bisect_right(self.offsets, pos)
+
+    def slice(self, start_line: int, end_line: int) -> str:
+        """start_line~end_line(포함) 구간의 원문을 반환한다."""
+        if start_line > end_line:
+            return ""
+        begin = self.offsets[start_line - 1]
+        if end_line >= len(self.offsets):
+            return self.content[begin:]
+        return self.content[begin : self.offsets[end_line] - 1]
@@ -0,0 +1,75 @@
+"""VIBE-X 다중 리터럴 매처.
+
+여러 금지 패턴을 패턴마다 라인 전체를 다시 훑는 대신(패턴 수 × 라인 수),
+패턴 집합을 트라이 모양의 결합 정규식 하나로 컴파일해 파일을 한 번만 스캔한다.
+공통 접두사를 공유하므로 정규식 엔진이 위치마다 패턴을 하나씩 대조하지 않는다.
+매치 위치 다음 글자부터 다시 찾으므로 겹치는 패턴이나 다른 패턴의 접두사인 패턴도 빠지지 않는다.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+
+def trie_regex(literals: Iterable[str]) -> str:
+    """리터럴 집합을 공통 접두사를 묶은 정규식 문자열로 만든다.
+
+    예: ("noqa", "no-console", "console.log") → "(?:console\\.log|no(?:\\-console|qa))"
+    """
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        terminal = "" in node
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if terminal else "")
+
+    return build(trie)
+
+
+class LiteralMatcher:
+    """리터럴 문자열 집합을 한 번에 찾는 매처.
+
+    사용 예:
+        matcher = LiteralMatcher.compile(("console.log", "noqa"))
+        for pos, index in matcher.finditer(content):
+            ...  # index: patterns 안의 위치
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = tuple(patterns)
+        # 매치 위치에서 같은 첫 글자로 시작하는 패턴만 대조한다
+        self._by_first: dict[str, list[tuple[int, str]]] = {}
+        for index, pattern in enumerate(self.patterns):
+            # 빈 패턴과 여러 줄 패턴은 라인 단위 검사에서 의미가 없다
+            if pattern and "\n" not in pattern:
+                self._by_first.setdefault(pattern[0], []).append((index, pattern))
+
+        literals = {p for group in self._by_first.values() for _, p in group}
+        self._regex = re.compile(trie_regex(literals)) if literals else None
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def compile(cls, patterns: tuple[str, ...]) -> "LiteralMatcher":
+        """패턴 튜플별로 한 번만 만든 매처를 반환한다."""
+        return cls(patterns)
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int]]:
+        """(시작 위치, 패턴 인덱스)를 위치 순으로 반환한다."""
+        if self._regex is None:
+            return
+        match = self._regex.search(text)
+        while match:
+            pos = match.start()
+            for index, pattern in self._by_first[text[pos]]:
+                if text.startswith(pattern, pos):
+                    yield pos, index
+            match = self._regex.search(text, pos + 1)
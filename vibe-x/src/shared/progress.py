@@ -0,0 +1,55 @@
+"""VIBE-X 진행 상황 보고.
+
+인덱싱, 메타 일괄 분석처럼 파일 단위로 오래 걸리는 작업이 IndexProgress 이벤트를
+콜백으로 보낸다. 파일 단위 이벤트는 간격을 두어 보내고, 단계 전환 이벤트는 항상 보낸다.
+"""
+
+import time
+from collections.abc import Callable
+
+from src.shared.logger import get_logger
+from src.shared.types import IndexProgress
+
+logger = get_logger("progress")
+
+# 파일 단위 진행 이벤트 최소 간격 (단계 전환 이벤트는 항상 보냄)
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+ProgressCallback = Callable[[IndexProgress], None]
+
+
+class ProgressTracker:
+    """진행 콜백 호출을 관리한다. 파일 단위 이벤트는 간격을 두어 보낸다."""
+
+    def __init__(self, callback: ProgressCallback | None, total: int = 0) -> None:
+        self._callback = callback
+        self._start = time.perf_counter()
+        self._last_emit = 0.0
+        self.total = total
+        self.done = 0
+        self.chunks = 0
+
+    def advance(self, stage: str, chunks: int = 0) -> None:
+        """파일 하나를 처리했음을 기록한다."""
+        self.done += 1
+        self.chunks += chunks
+        self.emit(stage, force=self.done >= self.total)
+
+    def emit(self, stage: str, force: bool = True) -> None:
+        """현재 진행 상황을 콜백으로 보낸다."""
+        if self._callback is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_emit < PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_emit = now
+        try:
+            self._callback(IndexProgress(
+                stage=stage,
+                files_done=self.done,
+                files_total=self.total,
+                chunks_written=self.chunks,
+                elapsed_seconds=now - self._start,
+            ))
+        except Exception as e:
+            logger.warning(f"진행 콜백 실패: {e}")
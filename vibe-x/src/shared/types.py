@@ -113,5 +113,42 @@ class IndexStats:
     total_chunks: int = 0
     indexed_files: int = 0
     skipped_files: int = 0
+    unchanged_files: int = 0
+    deleted_files: int = 0
+    streamed_files: int = 0    # 스트리밍 모드로 청킹한 대용량 파일 수
+    split_chunks: int = 0      # 토큰 한도 초과로 분할된 청크 수
+    truncated_chunks: int = 0  # 토큰 한도 초과로 잘린 청크 수
+    truncated_lines: int = 0   # 스트리밍 청킹에서 최대 길이로 잘린 라인 수
     errors: list[str] = field(default_factory=list)
     duration_seconds: float = 0.0
+    workers: int = 1
+    stage_seconds: dict[str, float] = field(default_factory=dict)  # 단계별 소요 시간
+    cancelled: bool = False    # 취소 요청으로 중간에 멈춘 경우
+
+
+@dataclass
+class IndexProgress:
+    """인덱싱/일괄 분석 진행 상황 (진행 콜백에 전달)."""
+    stage: str
+    files_done: int = 0
+    files_total: int = 0
+    chunks_written: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """남은 예상 시간. 처리한 파일이 없으면 None."""
+        if not self.files_done or self.files_total <= self.files_done:
+            return None if not self.files_done else 0.0
+        rate = self.elapsed_seconds / self.files_done
+        return round(rate * (self.files_total - self.files_done), 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "stage": self.stage,
+            "files_done": self.files_done,
+            "files_total": self.files_total,
+            "chunks_written": self.chunks_written,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "eta_seconds": self.eta_seconds,
+        }
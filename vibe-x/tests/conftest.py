@@ -14,6 +14,8 @@ import pytest
 
 # pytest capture 충돌 방지: logger.py의 stdout 래핑을 비활성화
 os.environ["VIBE_X_NO_WRAP_STDOUT"] = "1"
+# 대시보드 기동 시 RAG warm-up(모델 로드) 생략
+os.environ["VIBE_X_SKIP_WARMUP"] = "1"
 
 # 프로젝트 루트를 sys.path에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -1,8 +1,13 @@
 """코드 청킹 모듈 테스트."""
 
 from pathlib import Path
-from src.shared.types import ChunkType
+
+import pytest
+
+from src.shared.types import ChunkType, CodeChunk
+from src.shared.line_index import LineIndex
 from src.layer2_rag.chunker import CodeChunker, EXTENSION_TO_LANGUAGE
+from src.layer2_rag.token_budget import TokenBudget, TokenCounter, TokenFitStats
 
 
 class TestCodeChunker:
@@ -90,3 +95,286 @@ class TestCodeChunker:
         assert len(chunks) == 1
         assert chunks[0].chunk_type == ChunkType.DOCUMENT
         assert chunks[0].language == "json"
+
+
+class TestLineIndex:
+    """LineIndex 오프셋 → 라인 변환 테스트."""
+
+    def test_line_of_matches_naive_count(self):
+        content = "a\nbb\n\nccc\ndddd\n"
+        index = LineIndex(content)
+        for pos in range(len(content)):
+            assert index.line_of(pos) == content[:pos].count("\n") + 1
+
+    def test_slice_matches_join(self):
+        lines = [f"line {i}" for i in range(20)]
+        content = "\n".join(lines)
+        index = LineIndex(content)
+        for start in range(1, 21):
+            for end in range(start, 21):
+                assert index.slice(start, end) == "\n".join(lines[start - 1 : end])
+
+    def test_slice_empty_range(self):
+        assert LineIndex("a\nb").slice(2, 1) == ""
+
+    def test_structural_line_numbers_on_large_file(self, config, tmp_project):
+        body = "\n".join(
+            f"def func_{i}():\n    return {i}\n" for i in range(500)
+        )
+        file_path = tmp_project / "generated.py"
+        file_path.write_text(body, encoding="utf-8")
+
+        chunks = CodeChunker(config).chunk_file(file_path)
+        lines = body.split("\n")
+        assert len(chunks) == 500
+        for chunk in chunks:
+            assert lines[chunk.start_line - 1].startswith(f"def {chunk.name}(")
+
+
+class TestPythonAstChunking:
+    """AST 기반 Python 청킹 테스트."""
+
+    def test_methods_get_qualified_names(self, config, sample_python_file):
+        chunks = CodeChunker(config).chunk_file(sample_python_file)
+        names = {c.name for c in chunks}
+        assert {"Calculator.add", "Calculator.subtract", "Calculator.multiply"} <= names
+        assert {"helper_function", "another_function"} <= names
+
+    def test_module_level_code_preserved(self, config, sample_python_file):
+        chunks = CodeChunker(config).chunk_file(sample_python_file)
+        module_chunks = [c for c in chunks if c.chunk_type == ChunkType.MODULE]
+        assert module_chunks
+        assert "import os" in module_chunks[0].content
+
+    def test_class_header_chunk(self, config, sample_python_file):
+        chunks = CodeChunker(config).chunk_file(sample_python_file)
+        class_chunks = [c for c in chunks if c.chunk_type == ChunkType.CLASS]
+        assert len(class_chunks) == 1
+        assert class_chunks[0].name == "Calculator"
+        assert "def add" not in class_chunks[0].content
+
+    def test_decorators_included(self, config, tmp_project):
+        code = (
+            "import functools\n\n\n"
+            "class Service:\n"
+            "    @property\n"
+            "    def name(self) -> str:\n"
+            "        return 'svc'\n\n"
+            "    @staticmethod\n"
+            "    @functools.cache\n"
+            "    async def load() -> int:\n"
+            "        return 1\n"
+        )
+        f = tmp_project / "decorated.py"
+        f.write_text(code, encoding="utf-8")
+
+        chunks = {c.name: c for c in CodeChunker(config).chunk_file(f)}
+        assert chunks["Service.name"].content.startswith("    @property")
+        assert "@functools.cache" in chunks["Service.load"].content
+
+    def test_nested_function_stays_in_parent(self, config, tmp_project):
+        code = "def outer():\n    def inner():\n        return 1\n    return inner()\n"
+        f = tmp_project / "nested.py"
+        f.write_text(code, encoding="utf-8")
+
+        chunks = CodeChunker(config).chunk_file(f)
+        assert [c.name for c in chunks] == ["outer"]
+        assert chunks[0].end_line == 4
+
+    def test_huge_class_split_into_methods(self, config, tmp_project):
+        methods = "\n".join(
+            f"    def m_{i}(self) -> int:\n" + "".join(
+                f"        x = {j}\n" for j in range(5)
+            ) + "        return x\n"
+            for i in range(40)
+        )
+        f = tmp_project / "huge.py"
+        f.write_text(f"class Huge:\n    \"\"\"Big.\"\"\"\n\n{methods}", encoding="utf-8")
+
+        chunks = CodeChunker(config).chunk_file(f)
+        max_lines = config.rag.chunk_max_lines
+        assert len([c for c in chunks if c.name.startswith("Huge.m_")]) == 40
+        assert all(c.end_line - c.start_line + 1 <= max_lines for c in chunks)
+
+    def test_syntax_error_falls_back_to_regex(self, config, tmp_project):
+        code = "def ok():\n    return 1\n\ndef broken(:\n    pass\n"
+        f = tmp_project / "broken.py"
+        f.write_text(code, encoding="utf-8")
+
+        chunks = CodeChunker(config).chunk_file(f)
+        assert "ok" in {c.name for c in chunks}
+
+
+class WordCounter(TokenCounter):
+    """공백 단위 단어를 토큰 하나로 세는 결정적 카운터."""
+
+    def __init__(self) -> None:
+        super().__init__("test-model")
+        self._loaded = True
+
+    def count(self, text: str) -> int:
+        return len(text.split())
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return " ".join(text.split()[:max_tokens])
+
+
+def make_chunk(lines: list[str], start_line: int = 1) -> CodeChunk:
+    return CodeChunk(
+        file_path="f.py",
+        content="\n".join(lines),
+        start_line=start_line,
+        end_line=start_line + len(lines) - 1,
+        chunk_type=ChunkType.FUNCTION,
+        language="python",
+        name="f",
+    )
+
+
+class TestTokenBudget:
+    """임베딩 토큰 한도 기반 분할 테스트."""
+
+    def test_small_chunk_untouched(self):
+        budget = TokenBudget(WordCounter(), max_tokens=12, overlap_lines=1)
+        stats = TokenFitStats()
+        chunk = make_chunk(["a b", "c d"])
+        assert budget.fit([chunk], stats) == [chunk]
+        assert stats.split_chunks == 0
+
+    def test_oversized_chunk_split_with_overlap(self):
+        # 특수 토큰 2개를 빼면 조각당 10 토큰
+        budget = TokenBudget(WordCounter(), max_tokens=12, overlap_lines=1)
+        stats = TokenFitStats()
+        lines = [f"w{i} x y z" for i in range(10)]  # 라인당 4 토큰
+
+        pieces = budget.fit([make_chunk(lines, start_line=11)], stats)
+
+        assert stats.split_chunks == 1
+        assert stats.truncated_chunks == 0
+        assert len(pieces) > 1
+        assert all(len(p.content.split()) <= 10 for p in pieces)
+        assert pieces[0].start_line == 11
+        assert pieces[-1].end_line == 20
+        # 조각 사이 1라인 겹침
+        assert pieces[1].start_line == pieces[0].end_line
+        assert len({p.chunk_id for p in pieces}) == len(pieces)
+
+    def test_overlong_line_truncated(self):
+        budget = TokenBudget(WordCounter(), max_tokens=7, overlap_lines=0)
+        stats = TokenFitStats()
+        pieces = budget.fit([make_chunk(["short", "x " * 20, "tail"])], stats)
+
+        assert stats.truncated_chunks == 1
+        assert all(len(p.content.split()) <= 5 for p in pieces)
+        assert pieces[-1].content == "tail"
+
+    def test_approximate_counter_without_tokenizer(self):
+        counter = TokenCounter("test-model")
+        counter._loaded = True  # 토크나이저 로드 생략 → 근사 카운트
+        assert counter.count("def add(a, b):") == 8
+        assert counter.truncate("alpha beta gamma", 2) == "alpha beta "
+
+    def test_chunker_applies_token_limit(self, config, tmp_project):
+        body = "".join(f"    value_{i} = compute(value_{i - 1}, factor={i})\n" for i in range(1, 28))
+        f = tmp_project / "dense.py"
+        f.write_text(f"def dense(value_0: int) -> int:\n{body}    return value_0\n", encoding="utf-8")
+
+        stats = TokenFitStats()
+        chunks = CodeChunker(config).chunk_file(f, stats)
+
+        assert stats.split_chunks == 1
+        assert len(chunks) > 1
+        assert all(c.name == "dense" for c in chunks)
+
+    def test_token_limit_disabled(self, config, tmp_project):
+        from dataclasses import replace
+
+        body = "".join(f"    value_{i} = compute(value_{i - 1}, factor={i})\n" for i in range(1, 28))
+        f = tmp_project / "dense.py"
+        f.write_text(f"def dense(value_0: int) -> int:\n{body}    return value_0\n", encoding="utf-8")
+
+        no_limit = replace(config, rag=replace(config.rag, chunk_max_tokens=0))
+        assert len(CodeChunker(no_limit).chunk_file(f)) == 1
+
+
+class TestStreamingChunker:
+    """대용량 파일 스트리밍 청킹 테스트."""
+
+    @pytest.fixture
+    def stream_config(self, config):
+        from dataclasses import replace
+
+        return replace(
+            config, rag=replace(config.rag, stream_threshold_bytes=64, chunk_max_tokens=0)
+        )
+
+    def test_small_file_not_streamed(self, config, sample_python_file):
+        assert not CodeChunker(config).should_stream(sample_python_file)
+
+    def test_sql_dump_split_into_blocks(self, stream_config, tmp_project):
+        f = tmp_project / "dump.sql"
+        f.write_text(
+            "".join(f"INSERT INTO t VALUES ({i});\n" for i in range(100)), encoding="utf-8"
+        )
+        chunker = CodeChunker(stream_config)
+        assert chunker.should_stream(f)
+
+        chunks = list(chunker.iter_chunks(f))
+        assert all(c.chunk_type == ChunkType.BLOCK for c in chunks)
+        assert chunks[0].start_line == 1
+        assert chunks[-1].end_line == 100
+        # 30라인 블록, 3라인 겹침
+        assert chunks[1].start_line == chunks[0].end_line - 2
+        assert all(c.end_line - c.start_line + 1 <= 30 for c in chunks)
+
+    def test_streaming_is_lazy(self, stream_config, tmp_project):
+        f = tmp_project / "big.sql"
+        f.write_text("SELECT 1;\n" * 1000, encoding="utf-8")
+
+        chunks = CodeChunker(stream_config).iter_chunks(f)
+        first = next(chunks)
+        assert first.start_line == 1
+        chunks.close()
+
+    def test_definitions_start_new_chunks(self, stream_config, tmp_project):
+        f = tmp_project / "bundle.js"
+        f.write_text(
+            "const VERSION = 1;\n"
+            "function alpha() {\n  return 1;\n}\n"
+            "export async function beta() {\n  return 2;\n}\n",
+            encoding="utf-8",
+        )
+
+        chunks = list(CodeChunker(stream_config).iter_chunks(f))
+        assert [(c.name, c.start_line) for c in chunks] == [
+            ("", 1), ("alpha", 2), ("beta", 5)
+        ]
+        assert chunks[1].chunk_type == ChunkType.FUNCTION
+
+    def test_overlong_line_clipped(self, stream_config, tmp_project):
+        from src.layer2_rag.chunker import MAX_STREAM_LINE_CHARS
+
+        f = tmp_project / "bundle.min.js"
+        f.write_text("x" * (MAX_STREAM_LINE_CHARS * 3) + "\nvar tail = 1;\n", encoding="utf-8")
+
+        stats = TokenFitStats()
+        chunks = list(CodeChunker(stream_config).iter_chunks(f, stats))
+        assert stats.truncated_lines == 1
+        assert len(chunks[0].content.split("\n")[0]) == MAX_STREAM_LINE_CHARS
+        assert chunks[-1].content.endswith("var tail = 1;")
+        assert chunks[-1].end_line == 2
+
+    def test_line_at_limit_counted_once_per_line(self, stream_config, tmp_project):
+        from src.layer2_rag.chunker import MAX_STREAM_LINE_CHARS
+
+        f = tmp_project / "edge.js"
+        f.write_text(
+            "a" * MAX_STREAM_LINE_CHARS + "\n" + "b" * (MAX_STREAM_LINE_CHARS + 5) + "\nvar c = 1;",
+            encoding="utf-8",
+        )
+
+        stats = TokenFitStats()
+        chunks = list(CodeChunker(stream_config).iter_chunks(f, stats))
+        assert stats.truncated_lines == 2
+        assert stats.truncated_chunks == 0
+        assert chunks[-1].end_line == 3
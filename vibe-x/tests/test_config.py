@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from src.shared.config import (
-    PathConfig, RagConfig, GateConfig, VibeXConfig, load_config,
+    DashboardConfig, PathConfig, RagConfig, GateConfig, VibeXConfig, load_config,
 )
 
 
@@ -13,6 +13,8 @@ class TestPathConfig:
         config = PathConfig()
         assert config.vibe_x_root == config.project_root / "vibe-x"
         assert config.chroma_db_path == config.vibe_x_root / ".chromadb"
+        assert config.index_manifest_path == config.vibe_x_root / ".index-manifest.db"
+        assert config.keyword_index_path == config.vibe_x_root / ".keyword-index.db"
         assert config.memory_path == config.vibe_x_root / "memory.md"
         assert config.coding_rules_path == config.vibe_x_root / "coding-rules.md"
         assert config.adr_dir == config.vibe_x_root / "docs" / "adr"
@@ -32,8 +34,19 @@ class TestRagConfig:
         assert config.collection_name == "vibe_x_codebase"
         assert config.chunk_max_lines == 50
         assert config.chunk_overlap_lines == 5
+        assert config.chunk_max_tokens == 256
         assert config.search_top_k == 10
+        assert config.hybrid_keyword_weight == 0.5
+        assert config.rrf_k == 60
+        assert config.query_embedding_cache_size == 1024
+        assert config.result_cache_ttl_seconds == 30.0
         assert config.embedding_model == "all-MiniLM-L6-v2"
+        assert config.embedding_batch_size == 64
+        assert config.upsert_batch_size == 1024
+        assert config.stream_threshold_bytes == 4 * 1024 * 1024
+        assert config.watch_debounce_seconds < config.watch_max_delay_seconds
+        assert config.respect_gitignore is True
+        assert config.use_git_ls_files is False
 
     def test_supported_extensions(self):
         config = RagConfig()
@@ -56,6 +69,22 @@ class TestGateConfig:
         assert config.max_function_lines == 50
         assert config.required_type_hints is True
         assert "console.log" in config.forbidden_patterns
+        assert config.parallel_gates is True
+        assert config.max_parallel_gates >= 4
+        assert config.max_parallel_files >= 1
+        assert config.cache_results is True
+
+
+class TestDashboardConfig:
+    """DashboardConfig 실행기 설정 테스트."""
+
+    def test_defaults(self):
+        config = DashboardConfig()
+        limits = dict(config.executor_limits)
+        assert limits["index"] == 1
+        assert limits["search"] >= limits["gate"]
+        assert config.default_executor_limit >= 1
+        assert VibeXConfig().dashboard == config
 
 
 class TestLoadConfig:
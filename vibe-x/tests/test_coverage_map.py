@@ -0,0 +1,145 @@
+"""커버리지 맵 기반 Gate 3 테스트 선별 테스트."""
+
+import ast
+import subprocess
+from dataclasses import replace
+
+import pytest
+
+from src.shared.file_context import function_spans
+from src.layer3_agents.coverage_map import CoverageMap, changed_hunks, enclosing_function
+from src.layer3_agents.integration_agent import IntegrationAgent
+
+CALC = '''import math
+
+
+def add(a, b):
+    return a + b
+
+
+def mul(a, b):
+    return a * b
+
+
+class Shape:
+    @staticmethod
+    def area(r):
+        return math.pi * r * r
+'''
+
+TEST_CALC = '''from app.calc import add, mul, Shape
+
+
+def test_add():
+    assert add(1, 2) == 3
+
+
+def test_mul():
+    assert mul(2, 3) == 6
+
+
+class TestShape:
+    def test_area(self):
+        assert Shape.area(1) > 3
+'''
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=root, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def recorded(config, tmp_project):
+    files = {
+        "app/__init__.py": "",
+        "app/calc.py": CALC,
+        "tests/test_calc.py": TEST_CALC,
+    }
+    for rel, content in files.items():
+        path = tmp_project / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    _git(tmp_project, "init", "-q")
+    _git(tmp_project, "add", "app", "tests")
+    _git(tmp_project, "commit", "-q", "-m", "init")
+
+    coverage = CoverageMap(config)
+    summary = coverage.record()
+    assert summary == {"tests": 3, "files": 2, "returncode": 0}
+    return tmp_project
+
+
+def _edit(path, old, new):
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+class TestHelpers:
+    """hunk 파싱과 함수 범위 테스트."""
+
+    def test_function_spans_nested(self):
+        code = "class A:\n    @dec\n    def f(self):\n        def g():\n            pass\n"
+        spans = function_spans(ast.parse(code))
+        assert spans == [(2, 5, "A.f", 3), (4, 5, "A.f.<locals>.g", 4)]
+        assert enclosing_function(spans, 5) == "A.f.<locals>.g"
+        assert enclosing_function(spans, 2) == "A.f"
+        assert enclosing_function(spans, 1) is None
+
+    def test_changed_hunks(self, recorded):
+        calc = recorded / "app" / "calc.py"
+        _edit(calc, "return a * b", "return b * a")
+        hunks = changed_hunks(recorded, calc)
+        assert [(h.old_start, h.old_count, h.new_start, h.new_count) for h in hunks] == [
+            (9, 1, 9, 1)
+        ]
+
+
+class TestCoverageMap:
+    """기록/선별 테스트."""
+
+    def test_function_change_selects_covering_test(self, config, recorded):
+        calc = recorded / "app" / "calc.py"
+        _edit(calc, "return a * b", "return b * a")
+        selection = CoverageMap(config).select([calc])
+        assert selection.tests == {recorded / "tests" / "test_calc.py": ["test_mul"]}
+
+    def test_method_change(self, config, recorded):
+        calc = recorded / "app" / "calc.py"
+        _edit(calc, "math.pi * r * r", "math.pi * r ** 2")
+        selection = CoverageMap(config).select([calc])
+        assert selection.tests == {recorded / "tests" / "test_calc.py": ["TestShape::test_area"]}
+
+    def test_module_level_change_selects_all(self, config, recorded):
+        calc = recorded / "app" / "calc.py"
+        _edit(calc, "import math\n", "import math\nimport os\n")
+        selection = CoverageMap(config).select([calc])
+        assert selection.test_count == 3
+
+    def test_unknown_and_test_files(self, config, recorded):
+        new = recorded / "app" / "new.py"
+        new.write_text("x = 1\n")
+        test_file = recorded / "tests" / "test_calc.py"
+        selection = CoverageMap(config).select([new, test_file])
+        assert selection.unresolved == [new]
+        assert selection.whole_files == [test_file]
+        assert selection.tests == {}
+
+    def test_unavailable_without_record(self, config):
+        assert not CoverageMap(config).available
+
+
+class TestGate3CoverageSelection:
+    """Gate 3의 커버리지 선별 테스트."""
+
+    def test_runs_only_selected_tests(self, config, recorded):
+        enabled = replace(config, gate=replace(config.gate, coverage_selection=True))
+        calc = recorded / "app" / "calc.py"
+        _edit(calc, "return a + b", "return b + a")
+
+        seen = []
+        result = IntegrationAgent(enabled, on_test=seen.append).run([calc])
+        assert [o.nodeid.split("::", 1)[1] for o in seen] == ["test_add"]
+        assert result.details[0] == "[선별] 커버리지 맵: 테스트 1개, 전체 실행 파일 0개"
+        assert "  ✓ test_calc.py (1 passed)" in result.details
@@ -5,6 +5,7 @@ M2(RAG), M3(Pipeline/Collab), M4(Alert/Health/QA) 전 범위를 포함한다.
 """
 
 import sys
+import time
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -372,6 +373,54 @@ class TestPipelineAPI:
         assert isinstance(body["gates"], list)
         assert len(body["gates"]) > 0
 
+    def test_pipeline_batch(self, client: TestClient) -> None:
+        targets = [
+            PROJECT_ROOT / "src" / "shared" / "types.py",
+            PROJECT_ROOT / "src" / "shared" / "line_index.py",
+        ]
+        resp = client.post("/api/pipeline/batch", json={
+            "files": [str(t) for t in targets] + ["/nonexistent/file.py"],
+            "author": "e2e-test",
+        })
+        body = resp.json()
+        assert body["success"] is True
+        assert sorted(body["files"]) == sorted(str(t) for t in targets)
+        assert body["missing"] == ["/nonexistent/file.py"]
+        assert [g["gate_number"] for g in body["changeset"]["gates"]] == [3, 6]
+
+    def test_pipeline_batch_no_files(self, client: TestClient) -> None:
+        resp = client.post("/api/pipeline/batch", json={"files": ["/nonexistent/file.py"]})
+        body = resp.json()
+        assert body["success"] is False
+
+    def test_pipeline_background_task(self) -> None:
+        target = PROJECT_ROOT / "src" / "shared" / "types.py"
+        with TestClient(app) as client:
+            resp = client.post("/api/pipeline", json={
+                "file_path": str(target),
+                "author": "e2e-test",
+                "background": True,
+            })
+            body = resp.json()
+            assert body["success"] is True
+            task_id = body["task_id"]
+
+            deadline = time.monotonic() + 30
+            task = client.get(f"/api/tasks/{task_id}").json()
+            while task["status"] not in ("done", "failed") and time.monotonic() < deadline:
+                time.sleep(0.1)
+                task = client.get(f"/api/tasks/{task_id}").json()
+
+            assert task["status"] == "done"
+            assert task["result"]["gates"]
+            listing = client.get("/api/tasks").json()
+            assert task_id in [t["task_id"] for t in listing["tasks"]]
+            assert "pipeline" in listing["executors"]
+
+    def test_unknown_task(self, client: TestClient) -> None:
+        resp = client.get("/api/tasks/nope")
+        assert "error" in resp.json()
+
 
 # ---------------------------------------------------------------------------
 # 11. Gate Check API
@@ -891,6 +940,31 @@ class TestMetaAPI:
         assert "count" in data
         assert isinstance(data["files"], list)
 
+    def test_batch_analyze_background(self) -> None:
+        """백그라운드 배치 분석은 task_id를 반환하고 진행 상황을 남긴다."""
+        test_dir = str(Path(__file__).parent)
+        with TestClient(app) as client:
+            body = client.post(
+                "/api/meta/batch-analyze",
+                json={"directory": test_dir, "background": True},
+            ).json()
+            assert body["success"] is True
+
+            deadline = time.monotonic() + 30
+            task = client.get(f"/api/tasks/{body['task_id']}").json()
+            while task["status"] not in ("done", "failed") and time.monotonic() < deadline:
+                time.sleep(0.05)
+                task = client.get(f"/api/tasks/{body['task_id']}").json()
+
+            assert task["status"] == "done"
+            assert task["progress"]["stage"] == "done"
+            assert task["progress"]["files_done"] == task["progress"]["files_total"]
+            assert task["result"]["count"] == len(task["result"]["files"])
+
+    def test_cancel_unknown_task(self, client: TestClient) -> None:
+        resp = client.post("/api/tasks/nope/cancel")
+        assert resp.json()["success"] is False
+
     def test_index_metas(self, client: TestClient) -> None:
         """메타 인덱싱 API가 동작한다."""
         resp = client.post("/api/meta/index")
@@ -0,0 +1,183 @@
+"""대시보드 작업 실행기 테스트."""
+
+import asyncio
+import threading
+import time
+
+from src.shared.config import DashboardConfig
+from src.layer5_dashboard.executors import BackgroundTasks, WorkExecutor
+
+
+def _executor(**limits: int) -> WorkExecutor:
+    return WorkExecutor(DashboardConfig(executor_limits=tuple(limits.items())))
+
+
+class TestWorkExecutor:
+    """종류별 스레드 풀 실행 테스트."""
+
+    def test_limit_bounds_concurrency(self):
+        executor = _executor(index=1)
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def job() -> None:
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+
+        async def main() -> None:
+            await asyncio.gather(*(executor.run("index", job) for _ in range(4)))
+
+        asyncio.run(main())
+        executor.shutdown()
+        assert active["max"] == 1
+
+    def test_event_loop_stays_responsive(self):
+        executor = _executor(gate=1)
+        ticks: list[int] = []
+
+        async def ticker() -> None:
+            for i in range(5):
+                ticks.append(i)
+                await asyncio.sleep(0.01)
+
+        async def main() -> str:
+            result, _ = await asyncio.gather(
+                executor.run("gate", lambda: time.sleep(0.2) or "done"), ticker()
+            )
+            return result
+
+        assert asyncio.run(main()) == "done"
+        executor.shutdown()
+        assert ticks == [0, 1, 2, 3, 4]
+
+    def test_cancel_before_start_releases_waiting(self):
+        executor = _executor(index=1)
+        release = threading.Event()
+
+        async def main() -> None:
+            blocker = asyncio.ensure_future(executor.run("index", release.wait))
+            queued = asyncio.ensure_future(executor.run("index", lambda: "never"))
+            await asyncio.sleep(0.05)
+            assert executor.stats()["index"]["waiting"] == 1
+
+            queued.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            await blocker
+
+        asyncio.run(main())
+        executor.shutdown()
+        assert executor.stats()["index"] == {"limit": 1, "running": 0, "waiting": 0}
+
+    def test_unknown_kind_uses_default_limit(self):
+        executor = WorkExecutor(DashboardConfig(default_executor_limit=3))
+        assert executor.limit("unknown") == 3
+        assert asyncio.run(executor.run("unknown", sum, [1, 2])) == 3
+        assert executor.stats()["unknown"] == {"limit": 3, "running": 0, "waiting": 0}
+        executor.shutdown()
+
+
+class TestBackgroundTasks:
+    """백그라운드 작업 상태 전이 테스트."""
+
+    def test_done_and_failed(self):
+        updates: list[tuple[str, str]] = []
+
+        async def listener(task) -> None:
+            updates.append((task.task_id, task.status))
+
+        async def ok(task) -> int:
+            return 42
+
+        async def boom(task) -> None:
+            raise RuntimeError("boom")
+
+        async def main():
+            tasks = BackgroundTasks(listener=listener)
+            good = tasks.submit("index", ok)
+            bad = tasks.submit("index", boom)
+            await asyncio.sleep(0.05)
+            return tasks, good, bad
+
+        tasks, good, bad = asyncio.run(main())
+        assert good.status == "done" and good.result == 42
+        assert bad.status == "failed" and bad.error == "boom"
+        assert (good.task_id, "running") in updates
+        assert (good.task_id, "done") in updates
+        assert tasks.get(good.task_id) is good
+
+    def test_finished_tasks_evicted(self):
+        async def ok(task) -> None:
+            return None
+
+        async def main() -> BackgroundTasks:
+            tasks = BackgroundTasks(max_finished=2)
+            for _ in range(5):
+                tasks.submit("meta", ok)
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+            return tasks
+
+        tasks = asyncio.run(main())
+        assert len(tasks.list()) <= 3
+
+    def test_duplicate_key_merged(self):
+        async def main():
+            tasks = BackgroundTasks()
+            release = asyncio.Event()
+
+            async def job(task) -> str:
+                await release.wait()
+                return task.task_id
+
+            first = tasks.submit("index", job, key="index:/repo")
+            second = tasks.submit("index", job, key="index:/repo")
+            other = tasks.submit("index", job, key="index:/other")
+            release.set()
+            await asyncio.sleep(0.01)
+            third = tasks.submit("index", job, key="index:/repo")
+            release.set()
+            await asyncio.sleep(0.01)
+            return first, second, other, third
+
+        first, second, other, third = asyncio.run(main())
+        assert second is first and first.merged == 1
+        assert other is not first
+        assert third is not first  # 끝난 작업에는 병합하지 않음
+
+    def test_cancel_and_progress(self):
+        executor = _executor(index=1)
+        updates: list[dict | None] = []
+
+        async def listener(task) -> None:
+            updates.append(task.progress)
+
+        def work(task) -> int:
+            done = 0
+            for _ in range(100):
+                if task.cancel_event.is_set():
+                    break
+                done += 1
+                tasks.report(task, {"files_done": done})
+                time.sleep(0.005)
+            return done
+
+        async def main():
+            job = tasks.submit("index", lambda task: executor.run("index", work, task))
+            await asyncio.sleep(0.05)
+            tasks.cancel(job.task_id)
+            while not job.finished:
+                await asyncio.sleep(0.01)
+            return job
+
+        tasks = BackgroundTasks(listener=listener)
+        job = asyncio.run(main())
+        executor.shutdown()
+        assert job.status == "cancelled"
+        assert 0 < job.result < 100
+        assert job.progress == {"files_done": job.result}
+        assert any(u and u["files_done"] >= 1 for u in updates)
@@ -0,0 +1,121 @@
+"""프로젝트 파일 탐색기 테스트."""
+
+import subprocess
+
+import pytest
+
+from src.shared.file_walker import (
+    is_path_ignored, parse_gitignore, staged_files, walk_files,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "proj"
+    for rel in (
+        "src/app.py",
+        "src/app.log",
+        "src/gen/out.py",
+        "src/keep/important.py",
+        "node_modules/pkg/index.js",
+        "build/out.js",
+        "docs/readme.md",
+        "docs/draft_notes.md",
+        "_test_scratch.py",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x\n", encoding="utf-8")
+    (root / ".gitignore").write_text(
+        "# generated\n*.log\n/build/\ngen/\n_test_*.py\n", encoding="utf-8"
+    )
+    (root / "docs" / ".gitignore").write_text("draft_*\n", encoding="utf-8")
+    return root
+
+
+def _rel(root, files):
+    return [f.relative_to(root).as_posix() for f in files]
+
+
+class TestParseGitignore:
+    """gitignore 패턴 변환 테스트."""
+
+    def test_unanchored_matches_any_depth(self):
+        (rule,) = parse_gitignore("*.log")
+        assert rule.matches("a.log", False)
+        assert rule.matches("x/y/a.log", False)
+        assert not rule.matches("a.log.txt", False)
+
+    def test_anchored_and_dir_only(self):
+        (rule,) = parse_gitignore("/build/")
+        assert rule.matches("build", True)
+        assert not rule.matches("build", False)
+        assert not rule.matches("src/build", True)
+
+    def test_double_star(self):
+        (rule,) = parse_gitignore("docs/**/tmp")
+        assert rule.matches("docs/tmp", True)
+        assert rule.matches("docs/a/b/tmp", True)
+
+
+class TestWalkFiles:
+    """scandir 기반 탐색 테스트."""
+
+    def test_prunes_ignored_dirs_and_gitignore(self, tree):
+        files = walk_files(tree, ignored_dirs=("node_modules",))
+        assert _rel(tree, files) == [
+            ".gitignore",
+            "docs/.gitignore",
+            "docs/readme.md",
+            "src/app.py",
+            "src/keep/important.py",
+        ]
+
+    def test_extensions_filter(self, tree):
+        files = walk_files(tree, extensions=(".py",), ignored_dirs=("node_modules",))
+        assert _rel(tree, files) == ["src/app.py", "src/keep/important.py"]
+
+    def test_negation_reincludes(self, tree):
+        (tree / ".gitignore").write_text("*.py\n!important.py\n", encoding="utf-8")
+        files = walk_files(tree, extensions=(".py",))
+        assert _rel(tree, files) == ["src/keep/important.py"]
+
+    def test_gitignore_disabled(self, tree):
+        files = walk_files(tree, extensions=(".py",), use_gitignore=False)
+        assert "src/gen/out.py" in _rel(tree, files)
+        assert "_test_scratch.py" in _rel(tree, files)
+
+    def test_git_ls_files_matches_scan(self, tree):
+        try:
+            subprocess.run(["git", "init", "-q"], cwd=tree, check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git 사용 불가")
+        scanned = walk_files(tree, ignored_dirs=("node_modules", ".git"))
+        listed = walk_files(tree, ignored_dirs=("node_modules", ".git"), use_git=True)
+        assert listed == scanned
+
+    def test_git_ls_files_falls_back_outside_repo(self, tree):
+        files = walk_files(tree, extensions=(".py",), use_git=True)
+        assert "src/app.py" in _rel(tree, files)
+
+    def test_is_path_ignored(self, tree):
+        assert is_path_ignored(tree, tree / "src" / "gen" / "new.py")
+        assert is_path_ignored(tree, tree / "docs" / "draft_2.md")
+        assert not is_path_ignored(tree, tree / "docs" / "final.md")
+        assert not is_path_ignored(tree, tree / "src" / "app.py")
+
+    def test_staged_files(self, tree):
+        try:
+            subprocess.run(["git", "init", "-q"], cwd=tree, check=True, capture_output=True)
+            subprocess.run(
+                ["git", "add", "src/app.py", "docs/readme.md"],
+                cwd=tree, check=True, capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git 사용 불가")
+        assert _rel(tree, staged_files(tree / "src")) == ["docs/readme.md", "src/app.py"]
+        assert _rel(tree, staged_files(tree, extensions=(".py",))) == ["src/app.py"]
+
+    def test_staged_files_outside_repo(self, tree):
+        with pytest.raises(RuntimeError):
+            staged_files(tree)
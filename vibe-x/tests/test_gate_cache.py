@@ -0,0 +1,173 @@
+"""Gate 결과 캐시 테스트."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from src.shared.file_context import FileAnalysisContext
+from src.shared.types import GateResult, GateStatus
+from src.layer2_rag.gate_basic import BasicGate
+from src.layer3_agents.gate_cache import GateResultCache
+from src.layer3_agents.gate_runner import GateChainRunner
+from src.layer5_dashboard.metrics import MetricsCollector
+
+
+class CountingRun:
+    """호출 횟수를 세는 Gate 실행 대역."""
+
+    def __init__(self, gate_number: int = 1, status: GateStatus = GateStatus.WARNING) -> None:
+        self.calls = 0
+        self.gate_number = gate_number
+        self.status = status
+
+    def __call__(self) -> GateResult:
+        self.calls += 1
+        return GateResult(
+            gate_number=self.gate_number,
+            gate_name="Syntax Agent",
+            status=self.status,
+            message="1개 이슈",
+            details=["L1: 이슈"],
+        )
+
+
+def _context(tmp_project, name="mod.py", content="x = 1\n"):
+    f = tmp_project / name
+    f.write_text(content, encoding="utf-8")
+    return FileAnalysisContext.from_path(f)
+
+
+class TestGateResultCache:
+    """캐시 적중/무효화 테스트."""
+
+    def test_hit_returns_same_result_without_running(self, config, tmp_project):
+        cache = GateResultCache(config)
+        context = _context(tmp_project)
+        run = CountingRun()
+
+        first = cache.get_or_run(1, context, run)
+        second = cache.get_or_run(1, _context(tmp_project), run)
+        assert run.calls == 1
+        assert (second.gate_number, second.status, second.message, second.details) == (
+            first.gate_number, first.status, first.message, first.details
+        )
+
+    def test_content_change_misses(self, config, tmp_project):
+        cache = GateResultCache(config)
+        run = CountingRun()
+        cache.get_or_run(1, _context(tmp_project, content="x = 1\n"), run)
+        cache.get_or_run(1, _context(tmp_project, content="x = 2\n"), run)
+        assert run.calls == 2
+
+    def test_rules_file_change_invalidates(self, config, tmp_project):
+        cache = GateResultCache(config)
+        run = CountingRun(gate_number=2)
+        rules = config.paths.coding_rules_path
+        rules.write_text("# rules v1\n", encoding="utf-8")
+        cache.get_or_run(2, _context(tmp_project), run)
+        cache.get_or_run(2, _context(tmp_project), run)
+        assert run.calls == 1
+
+        rules.write_text("# rules v2 - changed\n", encoding="utf-8")
+        cache.get_or_run(2, _context(tmp_project), run)
+        assert run.calls == 2
+
+    def test_gate_config_change_invalidates(self, config, tmp_project):
+        run = CountingRun(gate_number=2)
+        GateResultCache(config).get_or_run(2, _context(tmp_project), run)
+        stricter = replace(config, gate=replace(config.gate, max_function_lines=10))
+        GateResultCache(stricter).get_or_run(2, _context(tmp_project), run)
+        assert run.calls == 2
+
+    def test_uncacheable_gate_and_missing_file(self, config, tmp_project):
+        cache = GateResultCache(config)
+        run = CountingRun(gate_number=3)
+        context = _context(tmp_project)
+        cache.get_or_run(3, context, run)
+        cache.get_or_run(3, context, run)
+        missing = FileAnalysisContext.from_path(tmp_project / "missing.py")
+        assert cache.key(1, missing) is None
+        assert run.calls == 2
+
+    def test_lru_eviction_by_entries(self, config, tmp_project):
+        small = replace(config, gate=replace(config.gate, cache_max_entries=2))
+        cache = GateResultCache(small)
+        contexts = [_context(tmp_project, f"m{i}.py", f"x = {i}\n") for i in range(3)]
+        cache.get_or_run(1, contexts[0], CountingRun())
+        time.sleep(0.01)
+        cache.get_or_run(1, contexts[1], CountingRun())
+        time.sleep(0.01)
+        cache.get(1, contexts[0])  # m0을 최근 사용으로 갱신
+        time.sleep(0.01)
+        cache.get_or_run(1, contexts[2], CountingRun())
+
+        assert cache.stats()["entries"] == 2
+        assert cache.get(1, contexts[0]) is not None
+        assert cache.get(1, contexts[1]) is None
+
+    def test_size_eviction(self, config, tmp_project):
+        tiny = replace(config, gate=replace(config.gate, cache_max_bytes=200))
+        cache = GateResultCache(tiny)
+        for i in range(5):
+            cache.get_or_run(1, _context(tmp_project, f"m{i}.py", f"x = {i}\n"), CountingRun())
+        assert 0 < cache.stats()["bytes"] <= 200
+
+    def test_stats_hit_rate(self, config, tmp_project):
+        cache = GateResultCache(config)
+        run = CountingRun()
+        for _ in range(4):
+            cache.get_or_run(1, _context(tmp_project), run)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (3, 1)
+        assert stats["hit_rate"] == 75.0
+        assert stats["per_gate"][1]["hits"] == 3
+
+        assert MetricsCollector(config).get_dashboard_data()["gate_cache"]["hits"] == 3
+
+
+class TestRunnerCache:
+    """파이프라인의 캐시 사용 테스트."""
+
+    def test_pipeline_reuses_cached_results(self, config, sample_python_file, monkeypatch):
+        calls = []
+        original = BasicGate.run_gate1
+        monkeypatch.setattr(
+            BasicGate, "run_gate1",
+            lambda self, *args: calls.append(1) or original(self, *args),
+        )
+        first = GateChainRunner(config).run_all(sample_python_file)
+        second = GateChainRunner(config).run_all(sample_python_file)
+
+        assert calls == [1]
+        assert [(g.gate_number, g.status, g.details) for g in second.gate_results] == [
+            (g.gate_number, g.status, g.details) for g in first.gate_results
+        ]
+
+    def test_cache_disabled(self, config, sample_python_file, monkeypatch):
+        uncached = replace(config, gate=replace(config.gate, cache_results=False))
+        calls = []
+        original = BasicGate.run_gate1
+        monkeypatch.setattr(
+            BasicGate, "run_gate1",
+            lambda self, *args: calls.append(1) or original(self, *args),
+        )
+        GateChainRunner(uncached).run_all(sample_python_file)
+        GateChainRunner(uncached).run_all(sample_python_file)
+        assert calls == [1, 1]
+        assert not uncached.paths.gate_cache_path.exists()
+
+    def test_cache_created_once_across_threads(self, config, monkeypatch):
+        created = []
+        original = GateResultCache.__init__
+
+        def slow_init(self, *args):
+            time.sleep(0.05)
+            created.append(self)
+            original(self, *args)
+
+        monkeypatch.setattr(GateResultCache, "__init__", slow_init)
+        runner = GateChainRunner(config)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            caches = list(pool.map(lambda _: runner._result_cache(), range(8)))
+        assert len(created) == 1
+        assert all(c is created[0] for c in caches)
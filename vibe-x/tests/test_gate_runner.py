@@ -0,0 +1,171 @@
+"""6-Gate 파이프라인 스케줄러 테스트."""
+
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from src.shared.types import GateResult, GateStatus
+from src.layer3_agents.gate_runner import FailPolicy, GateChainRunner
+
+
+class FakeRunner(GateChainRunner):
+    """Gate 실행을 지연/결과 지정이 가능한 대역으로 바꾼 러너."""
+
+    def __init__(self, config, delays=None, statuses=None, failing_files=()) -> None:
+        super().__init__(config)
+        self.delays = delays or {}
+        self.statuses = statuses or {}
+        self.failing_files = set(failing_files)  # Gate 1이 실패하는 파일
+        self.changesets: list[list[Path]] = []  # Gate 3이 받은 변경 세트
+        self.called: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _fake(self, gate_number: int) -> GateResult:
+        with self._lock:
+            self.called.append(gate_number)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delays.get(gate_number, 0.01))
+        with self._lock:
+            self.active -= 1
+        return GateResult(
+            gate_number=gate_number,
+            gate_name=f"Gate {gate_number}",
+            status=self.statuses.get(gate_number, GateStatus.PASSED),
+            message="",
+        )
+
+    def _run_gate_1(self, file_path, context):
+        result = self._fake(1)
+        if file_path in self.failing_files:
+            result.status = GateStatus.FAILED
+        return result
+
+    def _run_gate_2(self, file_path, context):
+        return self._fake(2)
+
+    def _run_gate_3(self, changed_files):
+        self.changesets.append(list(changed_files))
+        return self._fake(3)
+
+    def _run_gate_4(self, file_path, context):
+        return self._fake(4)
+
+    def _run_gate_5(self, file_path, context):
+        return self._fake(5)
+
+    def _run_gate_6(self, changed_files, author):
+        return self._fake(6)
+
+
+TARGET = Path("target.py")
+
+
+class TestParallelScheduling:
+    """병렬 실행과 결과 순서 테스트."""
+
+    def test_independent_gates_run_concurrently(self, config):
+        runner = FakeRunner(config, delays={3: 0.3, 4: 0.2, 5: 0.2, 6: 0.2})
+        start = time.perf_counter()
+        result = runner.run_all(TARGET)
+        elapsed = time.perf_counter() - start
+
+        assert runner.max_active == 4
+        assert elapsed < 0.7  # 순차 실행이면 0.9초 이상
+        assert result.overall_status == GateStatus.PASSED
+
+    def test_output_order_preserved(self, config):
+        runner = FakeRunner(config, delays={3: 0.2, 4: 0.1, 5: 0.05, 6: 0.01})
+        result = runner.run_all(TARGET)
+        assert [g.gate_number for g in result.gate_results] == [1, 2, 3, 4, 5, 6]
+
+    def test_gate_timings_recorded(self, config):
+        runner = FakeRunner(config, delays={4: 0.1})
+        result = runner.run_all(TARGET)
+        assert list(result.gate_timings) == [1, 2, 3, 4, 5, 6]
+        assert result.gate_timings[4] >= 0.1
+
+    def test_sequential_when_disabled(self, config):
+        sequential = replace(config, gate=replace(config.gate, parallel_gates=False))
+        runner = FakeRunner(sequential)
+        result = runner.run_all(TARGET)
+        assert runner.max_active == 1
+        assert runner.called == [1, 2, 3, 4, 5, 6]
+        assert len(result.gate_results) == 6
+
+
+class TestFailPolicy:
+    """STOP/WARN/BYPASS 정책 유지 테스트."""
+
+    def test_stop_gate_blocks_later_gates(self, config):
+        runner = FakeRunner(config, statuses={1: GateStatus.FAILED})
+        result = runner.run_all(TARGET)
+        assert runner.called == [1]
+        assert result.stopped_at == 1
+        assert result.overall_status == GateStatus.FAILED
+        assert [g.gate_number for g in result.gate_results] == [1]
+
+    def test_stop_policy_on_gate3_acts_as_barrier(self, config):
+        runner = FakeRunner(config, statuses={3: GateStatus.FAILED})
+        runner.set_policy(3, FailPolicy.STOP)
+        result = runner.run_all(TARGET)
+        assert sorted(runner.called) == [1, 2, 3]
+        assert result.stopped_at == 3
+
+    def test_warn_failure_continues(self, config):
+        runner = FakeRunner(config, statuses={4: GateStatus.FAILED, 5: GateStatus.WARNING})
+        result = runner.run_all(TARGET)
+        assert len(result.gate_results) == 6
+        assert result.stopped_at is None
+        assert result.overall_status == GateStatus.FAILED
+
+    def test_bypass_ignores_stop_gate_failure(self, config):
+        runner = FakeRunner(config, statuses={2: GateStatus.FAILED})
+        runner.set_policy(2, FailPolicy.BYPASS)
+        result = runner.run_all(TARGET)
+        assert len(result.gate_results) == 6
+        assert result.stopped_at is None
+
+
+class TestBatchPipeline:
+    """배치 파이프라인 테스트."""
+
+    FILES = [Path(f"f{i}.py") for i in range(6)]
+
+    def test_changeset_gates_run_once(self, config):
+        runner = FakeRunner(config)
+        batch = runner.run_batch(self.FILES)
+        assert runner.called.count(3) == 1
+        assert runner.called.count(6) == 1
+        assert runner.called.count(1) == len(self.FILES)
+        assert runner.changesets == [self.FILES]
+        assert list(batch.file_results) == [str(f) for f in self.FILES]
+        for result in batch.file_results.values():
+            assert [g.gate_number for g in result.gate_results] == [1, 2, 4, 5]
+        assert [g.gate_number for g in batch.changeset_result.gate_results] == [3, 6]
+        assert batch.overall_status == GateStatus.PASSED
+
+    def test_files_run_in_parallel(self, config):
+        runner = FakeRunner(config, delays={4: 0.2, 5: 0.2})
+        start = time.perf_counter()
+        runner.run_batch(self.FILES[:4])
+        assert time.perf_counter() - start < 0.6  # 파일 순차 실행이면 0.8초 이상
+        assert runner.max_active > 2
+
+    def test_stopped_file_excluded_from_changeset(self, config):
+        runner = FakeRunner(config, failing_files=[self.FILES[0]])
+        batch = runner.run_batch(self.FILES)
+        assert batch.stopped_files == [str(self.FILES[0])]
+        assert runner.changesets == [self.FILES[1:]]
+        assert batch.overall_status == GateStatus.FAILED
+        assert "중단:1" in batch.summary
+
+    def test_all_files_stopped_skips_changeset(self, config):
+        runner = FakeRunner(config, failing_files=self.FILES[:2])
+        batch = runner.run_batch(self.FILES[:2])
+        assert 3 not in runner.called and 6 not in runner.called
+        assert batch.changeset_result.gate_results == []
+        assert batch.overall_status == GateStatus.FAILED
@@ -1,6 +1,12 @@
 """품질 게이트 테스트 (Gate 1~5)."""
 
 from pathlib import Path
+from dataclasses import replace
+
+import pytest
+
+from src.shared.file_context import FileAnalysisContext
+from src.shared.literal_matcher import LiteralMatcher
 from src.shared.types import GateStatus
 from src.layer2_rag.gate_basic import BasicGate
 from src.layer3_agents.review_agent import ReviewAgent
@@ -66,6 +72,67 @@ class TestGate2Rules:
         assert result.status in (GateStatus.WARNING, GateStatus.FAILED)
         assert any("금지 패턴" in d for d in result.details)
 
+    def test_forbidden_patterns_reported_by_pattern_then_line(self, config, tmp_project):
+        patterns = ("hack", "TODO: hack", "hack")
+        custom = replace(config, gate=replace(config.gate, forbidden_patterns=patterns))
+        f = tmp_project / "bad.py"
+        f.write_text("a = 1  # TODO: hack\nb = 2\nc = 3  # hack hack\n", encoding="utf-8")
+
+        details = BasicGate(custom).run_gate2(f).details
+        assert details == [
+            "L1: 금지 패턴 'hack' 발견",
+            "L3: 금지 패턴 'hack' 발견",
+            "L1: 금지 패턴 'TODO: hack' 발견",
+            "L1: 금지 패턴 'hack' 발견",
+            "L3: 금지 패턴 'hack' 발견",
+        ]
+
+    def test_code_rules_once_per_line(self, config, tmp_project):
+        code = (
+            "let a: any = 1000 + 2000;\n"
+            "const port = 8080;\n"
+            "if (x >= 300) {}\n"
+        )
+        f = tmp_project / "app.ts"
+        f.write_text(code, encoding="utf-8")
+
+        details = BasicGate(config).run_gate2(f).details
+        assert details == [
+            "L1: 매직 넘버 의심 - 상수로 추출 권장",
+            "L1: 'any' 타입 사용 - 구체적 타입 또는 'unknown' 사용",
+            "L3: 매직 넘버 의심 - 상수로 추출 권장",
+        ]
+
+    def test_function_length_uses_ast_spans(self, config, tmp_project):
+        code = (
+            "def outer():\n"
+            "    def inner():\n"
+            "        return 1\n"
+            "    x = inner()\n"
+            "    return x\n"
+            "\n"
+            "class A:\n"
+            "    async def run(self):\n"
+            "        a = 1\n"
+            "        b = 2\n"
+            "        return a + b\n"
+            "\n"
+            "def last():\n"
+            "    a = 1\n"
+            "    b = 2\n"
+            "    return a + b\n"
+        )
+        short = replace(config, gate=replace(config.gate, max_function_lines=3))
+        f = tmp_project / "funcs.py"
+        f.write_text(code, encoding="utf-8")
+
+        details = BasicGate(short).run_gate2(f).details
+        assert details == [
+            "L1: 'outer' 함수 5줄 (최대 3줄)",
+            "L8: 'A.run' 함수 4줄 (최대 3줄)",
+            "L13: 'last' 함수 4줄 (최대 3줄)",
+        ]
+
     def test_run_all(self, config, sample_python_file):
         gate = BasicGate(config)
         results = gate.run_all(sample_python_file)
@@ -74,6 +141,22 @@ class TestGate2Rules:
         assert results[1].gate_number == 2
 
 
+class TestLiteralMatcher:
+    """결합 리터럴 매처 테스트."""
+
+    def test_overlapping_and_prefix_patterns(self):
+        matcher = LiteralMatcher(("no", "noqa", "qa", "a.b"))
+        assert list(matcher.finditer("x noqa a.b")) == [(2, 0), (2, 1), (4, 2), (7, 3)]
+
+    def test_repeated_occurrences(self):
+        matcher = LiteralMatcher(("aa",))
+        assert [pos for pos, _ in matcher.finditer("aaaa")] == [0, 1, 2]
+
+    def test_empty_patterns_ignored(self):
+        assert list(LiteralMatcher(("",)).finditer("abc")) == []
+        assert list(LiteralMatcher(()).finditer("abc")) == []
+
+
 class TestGate4Review:
     """Gate 4: Review Agent 테스트."""
 
@@ -155,3 +238,63 @@ class TestGate5Architecture:
         agent = ArchitectureAgent(config)
         result = agent.run(f)
         assert any("ARCH-004" in d for d in result.details)
+
+
+class TestFileAnalysisContext:
+    """Gate 간 공유 컨텍스트 테스트."""
+
+    def _run_all(self, config, f, context=None):
+        results = [
+            *BasicGate(config).run_all(f, context),
+            ReviewAgent(config).run(f, context),
+            ArchitectureAgent(config).run(f, context),
+        ]
+        return [(r.gate_number, r.status, r.message, r.details) for r in results]
+
+    def test_shared_context_same_results(self, config, sample_bad_python_file, tmp_project):
+        crlf = tmp_project / "crlf.py"
+        crlf.write_bytes(b"x = 1000\r\neval(data)\r\n")
+        latin = tmp_project / "latin.py"
+        latin.write_bytes(b"name = '\xe9'\n")
+
+        for f in (sample_bad_python_file, crlf, latin):
+            expected = self._run_all(config, f)
+            shared = self._run_all(config, f, FileAnalysisContext.from_path(f))
+            assert shared == expected
+
+    def test_file_read_once(self, config, sample_python_file, monkeypatch):
+        reads = []
+        original = Path.read_bytes
+        monkeypatch.setattr(
+            Path, "read_bytes", lambda self: reads.append(self) or original(self)
+        )
+
+        context = FileAnalysisContext.from_path(sample_python_file)
+        self._run_all(config, sample_python_file, context)
+        assert reads == [sample_python_file]
+
+    def test_lazy_tree_and_line_index(self, tmp_project):
+        f = tmp_project / "mod.py"
+        f.write_text("a = 1\nb = 2\n", encoding="utf-8")
+        context = FileAnalysisContext.from_path(f)
+        assert context.tree is not None and context.tree is context.tree
+        assert context.line_index.line_of(context.content.index("b")) == 2
+
+        broken = tmp_project / "broken.py"
+        broken.write_text("def (:\n", encoding="utf-8")
+        assert FileAnalysisContext.from_path(broken).tree is None
+
+    def test_function_spans_shared(self, tmp_project, monkeypatch):
+        f = tmp_project / "mod.py"
+        f.write_text("@dec\ndef f():\n    pass\n", encoding="utf-8")
+        context = FileAnalysisContext.from_path(f)
+        assert context.function_spans == [(1, 3, "f", 2)]
+
+        monkeypatch.setattr("ast.parse", lambda *a, **k: pytest.fail("reparsed"))
+        assert context.function_spans is context.function_spans
+        assert FileAnalysisContext(tmp_project / "a.ts", b"function f() {}").function_spans == []
+
+    def test_missing_file(self, config, tmp_project):
+        context = FileAnalysisContext.from_path(tmp_project / "missing.py")
+        assert context.read_error is not None
+        assert ReviewAgent(config).run(context.path, context).status == GateStatus.SKIPPED
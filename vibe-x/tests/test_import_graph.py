@@ -0,0 +1,108 @@
+"""import 의존성 그래프 / Gate 3 영향 분석 테스트."""
+
+import pytest
+
+from src.layer3_agents.import_graph import ImportGraph, module_name, parse_imports
+from src.layer3_agents.integration_agent import IntegrationAgent
+
+
+@pytest.fixture
+def project(tmp_project):
+    """src/core ← src/service ← src/api, tests/test_service.py 구조."""
+    files = {
+        "src/__init__.py": "",
+        "src/core/__init__.py": "",
+        "src/core/models.py": "class Model:\n    pass\n",
+        "src/core/util.py": "from .models import Model\n",
+        "src/service.py": "from src.core import util\n",
+        "src/api.py": "def handler():\n    from src.service import run\n",
+        "src/standalone.py": "import os\n",
+        "tests/test_service.py": "from src.service import run\n",
+        "tests/test_other.py": "import src.standalone\n",
+    }
+    for rel, content in files.items():
+        path = tmp_project / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return tmp_project
+
+
+class TestParseImports:
+    """AST import 추출 테스트."""
+
+    def test_relative_and_lazy_imports(self):
+        code = "from . import a\nfrom ..b import c\ndef f():\n    import d.e\n"
+        names = parse_imports(code, "pkg.sub.mod", is_package=False)
+        assert {"pkg.sub", "pkg.sub.a", "pkg.b", "pkg.b.c", "d.e"} <= set(names)
+
+    def test_syntax_error(self):
+        assert parse_imports("def (:\n", "m", is_package=False) == []
+
+    def test_module_name(self):
+        assert module_name("src/core/__init__.py") == "src.core"
+        assert module_name("src/core/util.py") == "src.core.util"
+
+
+class TestImportGraph:
+    """그래프 구성/순회/영속화 테스트."""
+
+    def test_forward_and_reverse_edges(self, config, project):
+        graph = ImportGraph(config)
+        graph.refresh()
+        assert graph.imports_of("src/core/util.py") == {"src/core/models.py"}
+        assert graph.importers_of("src/service.py") == {"src/api.py", "tests/test_service.py"}
+
+    def test_dependents_depth_and_exclusion(self, config, project):
+        graph = ImportGraph(config)
+        graph.refresh()
+        depths = graph.dependents({"src/core/models.py"}, max_depth=3, exclude_prefix="tests/")
+        assert depths == {
+            "src/core/models.py": 0,
+            "src/core/util.py": 1,
+            "src/service.py": 2,
+            "src/api.py": 3,
+        }
+        assert "src/api.py" not in graph.dependents({"src/core/models.py"}, max_depth=2)
+
+    def test_persisted_and_incremental(self, config, project, monkeypatch):
+        assert ImportGraph(config).refresh() == 9
+
+        parsed = []
+        original = ImportGraph._parse
+        monkeypatch.setattr(
+            ImportGraph, "_parse",
+            lambda self, rel, path: parsed.append(rel) or original(self, rel, path),
+        )
+        graph = ImportGraph(config)
+        assert graph.refresh() == 0
+        assert graph.importers_of("src/core/util.py") == {"src/service.py"}
+
+        (project / "src" / "standalone.py").write_text("from src.api import handler\n")
+        (project / "tests" / "test_other.py").unlink()
+        assert graph.refresh() == 2
+        assert parsed == ["src/standalone.py"]
+        assert "src/standalone.py" in graph.importers_of("src/api.py")
+        assert "tests/test_other.py" not in graph
+
+
+class TestIntegrationImpact:
+    """IntegrationAgent의 그래프 기반 영향 분석 테스트."""
+
+    def test_impact_and_related_tests(self, config, project):
+        agent = IntegrationAgent(config)
+        agent.graph.refresh()
+        changed = [project / "src" / "core" / "models.py"]
+
+        impact = agent._analyze_impact(changed)
+        assert impact == ["src.api", "src.core.models", "src.core.util", "src.service"]
+        assert agent._find_related_tests(changed, impact) == [
+            project / "tests" / "test_service.py"
+        ]
+
+    def test_file_outside_graph(self, config, project):
+        agent = IntegrationAgent(config)
+        agent.graph.refresh()
+        other = project / "scripts" / "tool.py"
+        other.parent.mkdir()
+        other.write_text("x = 1\n")
+        assert agent._analyze_impact([other]) == ["scripts.tool"]
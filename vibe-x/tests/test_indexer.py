@@ -0,0 +1,350 @@
+"""코드베이스 인덱서 증분 인덱싱 테스트."""
+
+import os
+import threading
+from dataclasses import replace
+
+import pytest
+
+from src.shared.types import ChunkType, CodeChunk
+from src.shared import progress as progress_module
+from src.layer2_rag import indexer as indexer_module
+from src.layer2_rag.indexer import CodebaseIndexer
+from src.layer2_rag.manifest import FileManifest
+from src.layer2_rag.vector_db import BulkWriter
+
+
+class InMemoryStore:
+    """임베딩 없이 청크 ID만 보관하는 VectorStore 대역."""
+
+    def __init__(self) -> None:
+        self.chunks: dict[str, CodeChunk] = {}
+        self.add_calls = 0
+
+    def add_chunks(self, chunks: list[CodeChunk]) -> int:
+        self._upsert_batch(chunks)
+        return len(chunks)
+
+    def bulk_writer(self) -> BulkWriter:
+        return BulkWriter(self, batch_size=2)
+
+    def _upsert_batch(self, chunks: list[CodeChunk]) -> None:
+        self.add_calls += 1
+        for chunk in chunks:
+            self.chunks[chunk.chunk_id] = chunk
+
+    def delete_by_file(self, file_path: str) -> None:
+        self.chunks = {
+            k: v for k, v in self.chunks.items() if v.file_path != file_path
+        }
+
+    def delete_by_ids(self, chunk_ids: list[str]) -> None:
+        for chunk_id in chunk_ids:
+            self.chunks.pop(chunk_id, None)
+
+    def count(self) -> int:
+        return len(self.chunks)
+
+    def keyword_count(self) -> int:
+        return len(self.chunks)
+
+    def files(self) -> set[str]:
+        return {c.file_path for c in self.chunks.values()}
+
+
+@pytest.fixture
+def src_tree(tmp_project):
+    """인덱싱 대상 소스 트리."""
+    root = tmp_project / "app"
+    root.mkdir()
+    (root / "a.py").write_text("def a():\n    return 1\n", encoding="utf-8")
+    (root / "b.py").write_text("def b():\n    return 2\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def indexer(config):
+    idx = CodebaseIndexer(config)
+    idx._store = InMemoryStore()
+    return idx
+
+
+class TestIncrementalIndexing:
+    """매니페스트 기반 증분 인덱싱 검증."""
+
+    def test_first_run_indexes_all(self, indexer, src_tree):
+        stats = indexer.index_project(src_tree)
+        assert stats.indexed_files == 2
+        assert stats.unchanged_files == 0
+        assert len(indexer._store.files()) == 2
+
+    def test_second_run_skips_unchanged(self, indexer, src_tree):
+        indexer.index_project(src_tree)
+        calls = indexer._store.add_calls
+
+        stats = indexer.index_project(src_tree)
+        assert stats.unchanged_files == 2
+        assert stats.indexed_files == 0
+        assert indexer._store.add_calls == calls
+
+    def test_changed_file_reindexed(self, indexer, src_tree):
+        indexer.index_project(src_tree)
+        (src_tree / "a.py").write_text(
+            "def a():\n    return 1\n\n\ndef a2():\n    return 3\n", encoding="utf-8"
+        )
+
+        stats = indexer.index_project(src_tree)
+        assert stats.indexed_files == 1
+        assert stats.unchanged_files == 1
+        names = {c.name for c in indexer._store.chunks.values()}
+        assert "a2" in names
+
+    def test_deleted_file_purged(self, indexer, src_tree):
+        indexer.index_project(src_tree)
+        (src_tree / "b.py").unlink()
+
+        stats = indexer.index_project(src_tree)
+        assert stats.deleted_files == 1
+        assert str(src_tree / "b.py") not in indexer._store.files()
+
+    def test_manifest_persisted(self, config, indexer, src_tree):
+        indexer.index_project(src_tree)
+
+        manifest = FileManifest(config)
+        entry = manifest.get(str(src_tree / "a.py"))
+        assert entry is not None
+        assert entry.chunk_ids
+        assert len(entry.content_hash) == 64
+
+    def test_concurrent_manifest_writers_merge(self, config, src_tree):
+        first, second = FileManifest(config), FileManifest(config)
+        a, b = src_tree / "a.py", src_tree / "b.py"
+        first.record(a, a.stat(), "ha", ["a:1"])
+        second.record(b, b.stat(), "hb", ["b:1"])
+        first.save()
+        second.save()
+        second.remove(str(b))
+        first.save()
+        second.save()
+
+        merged = FileManifest(config)
+        assert merged.paths_under(src_tree) == {str(a)}
+        assert first.get(str(a)).chunk_ids == ["a:1"]
+        for m in (first, second, merged):
+            m.close()
+
+    def test_failed_flush_keeps_previous_chunks_and_manifest(self, indexer, src_tree, monkeypatch):
+        indexer.index_project(src_tree)
+        target = str(src_tree / "a.py")
+        before = dict(indexer._store.chunks)
+        entry = indexer._manifest.get(target)
+        (src_tree / "a.py").write_text("def a():\n    return 42\n\n\ndef z():\n    pass\n")
+
+        def fail(chunks):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(indexer._store, "_upsert_batch", fail)
+        with pytest.raises(RuntimeError, match="disk full"):
+            indexer.index_project(src_tree)
+
+        assert indexer._store.chunks == before
+        assert indexer._manifest.get(target) is entry
+        monkeypatch.undo()
+        stats = indexer.index_project(src_tree)
+        assert stats.indexed_files == 1
+        assert "z" in {c.name for c in indexer._store.chunks.values()}
+
+    def test_duplicate_chunk_ids_counted_once(self, indexer, src_tree, monkeypatch, caplog):
+        chunk_file = indexer._chunker.chunk_file
+
+        def duplicated(file_path, token_stats=None):
+            chunks = chunk_file(file_path, token_stats)
+            return chunks + chunks[:1]
+
+        monkeypatch.setattr(indexer._chunker, "chunk_file", duplicated)
+        stats = indexer.index_project(src_tree)
+
+        assert stats.total_chunks == indexer._store.count()
+        entry = indexer._manifest.get(str(src_tree / "a.py"))
+        assert len(entry.chunk_ids) == len(set(entry.chunk_ids))
+        assert "중복 chunk_id" in caplog.text
+
+    def test_full_reindex_ignores_manifest(self, indexer, src_tree):
+        indexer.index_project(src_tree)
+        stats = indexer.index_project(src_tree, full=True)
+        assert stats.indexed_files == 2
+        assert stats.unchanged_files == 0
+
+    def test_full_reindex_purges_deleted_files(self, indexer, src_tree):
+        indexer.index_project(src_tree)
+        (src_tree / "b.py").unlink()
+
+        stats = indexer.index_project(src_tree, full=True)
+        assert stats.deleted_files == 1
+        assert indexer._store.files() == {str(src_tree / "a.py")}
+
+    def test_touch_without_change_is_unchanged(self, indexer, src_tree):
+        indexer.index_project(src_tree)
+        target = src_tree / "a.py"
+        st = target.stat()
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+        stats = indexer.index_project(src_tree)
+        assert stats.unchanged_files == 2
+
+
+class TestParallelChunking:
+    """프로세스 풀 청킹 파이프라인 검증."""
+
+    def test_parallel_matches_sequential(self, config, src_tree, monkeypatch):
+        for i in range(6):
+            (src_tree / f"mod_{i}.py").write_text(
+                f"def f_{i}():\n    return {i}\n", encoding="utf-8"
+            )
+
+        sequential = CodebaseIndexer(replace(config, rag=replace(config.rag, index_workers=1)))
+        sequential._store = InMemoryStore()
+        sequential.index_project(src_tree, full=True)
+
+        monkeypatch.setattr(indexer_module, "PARALLEL_MIN_FILES", 1)
+        parallel = CodebaseIndexer(replace(config, rag=replace(config.rag, index_workers=2)))
+        parallel._store = InMemoryStore()
+        stats = parallel.index_project(src_tree, full=True)
+
+        assert stats.workers == 2
+        assert stats.indexed_files == 8
+        assert set(parallel._store.chunks) == set(sequential._store.chunks)
+
+    def test_stage_timings_reported(self, indexer, src_tree):
+        stats = indexer.index_project(src_tree)
+        for stage in ("collect", "diff", "chunk_cpu", "write", "pipeline", "purge"):
+            assert stage in stats.stage_seconds
+
+    def test_token_split_counts_reported(self, indexer, src_tree):
+        body = "".join(f"    v_{i} = compute(v_{i - 1}, factor={i})\n" for i in range(1, 28))
+        (src_tree / "dense.py").write_text(
+            f"def dense(v_0: int) -> int:\n{body}    return v_0\n", encoding="utf-8"
+        )
+
+        stats = indexer.index_project(src_tree)
+        assert stats.split_chunks == 1
+        assert stats.total_chunks > 3
+
+    def test_large_files_streamed(self, config, src_tree):
+        (src_tree / "dump.sql").write_text("SELECT 1;\n" * 200, encoding="utf-8")
+        streaming = replace(config, rag=replace(config.rag, stream_threshold_bytes=512))
+        idx = CodebaseIndexer(streaming)
+        idx._store = InMemoryStore()
+
+        stats = idx.index_project(src_tree)
+        assert stats.streamed_files == 1
+        assert stats.indexed_files == 3
+        assert "stream" in stats.stage_seconds
+        entry = FileManifest(streaming).get(str(src_tree / "dump.sql"))
+        assert entry is not None and len(entry.chunk_ids) > 1
+
+        assert idx.index_project(src_tree).unchanged_files == 3
+
+
+class TestProgressAndCancel:
+    """진행 콜백과 협조적 취소 테스트."""
+
+    def test_progress_reported(self, indexer, src_tree):
+        events = []
+        stats = indexer.index_project(src_tree, progress=events.append)
+
+        stages = [e.stage for e in events]
+        assert stages[0] == "collect"
+        assert stages[-1] == "done"
+        final = events[-1]
+        assert final.files_done == final.files_total == 2
+        assert final.chunks_written == stats.total_chunks
+        assert final.eta_seconds == 0.0
+
+    def test_cancel_stops_at_file_boundary(self, indexer, src_tree, monkeypatch):
+        monkeypatch.setattr(progress_module, "PROGRESS_INTERVAL_SECONDS", 0.0)
+        (src_tree / "c.py").write_text("def c():\n    return 3\n", encoding="utf-8")
+        cancel = threading.Event()
+
+        def on_progress(event):
+            if event.stage == "chunk" and event.files_done == 1:
+                cancel.set()
+
+        stats = indexer.index_project(src_tree, progress=on_progress, cancel=cancel)
+
+        assert stats.cancelled is True
+        assert stats.indexed_files == 1
+
+        # 이미 저장된 파일은 매니페스트에 남아 다음 실행이 이어서 처리
+        resumed = indexer.index_project(src_tree)
+        assert resumed.unchanged_files == 1
+        assert resumed.indexed_files == 2
+
+
+class TestIndexFile:
+    """단일 파일 인덱싱 테스트."""
+
+    def test_unchanged_file_not_rechunked(self, indexer, src_tree):
+        target = src_tree / "a.py"
+        assert indexer.index_file(target) == 1
+        calls = indexer._store.add_calls
+
+        assert indexer.index_file(target) == 1
+        assert indexer._store.add_calls == calls
+
+        target.write_text("def a():\n    return 10\n", encoding="utf-8")
+        indexer.index_file(target)
+        assert indexer._store.add_calls == calls + 1
+
+    def test_deleted_file_purged(self, indexer, src_tree):
+        target = src_tree / "a.py"
+        indexer.index_file(target)
+        target.unlink()
+        assert indexer.index_file(target) == 0
+        assert str(target.resolve()) not in indexer._store.files()
+
+
+class TestCollectFiles:
+    """인덱싱 대상 수집 테스트."""
+
+    def test_ignored_dirs_and_gitignore_skipped(self, indexer, src_tree):
+        (src_tree / "node_modules" / "pkg").mkdir(parents=True)
+        (src_tree / "node_modules" / "pkg" / "index.js").write_text("x\n", encoding="utf-8")
+        (src_tree / "generated.py").write_text("X = 1\n", encoding="utf-8")
+        (src_tree / ".gitignore").write_text("generated.py\n", encoding="utf-8")
+
+        stats = indexer.index_project(src_tree)
+        assert stats.total_files == 2
+        assert indexer._store.files() == {str(src_tree / "a.py"), str(src_tree / "b.py")}
+
+
+class TestBulkWriter:
+    """BulkWriter 저장 완료 콜백 테스트."""
+
+    def _chunk(self, i: int) -> CodeChunk:
+        return CodeChunk(f"f{i}.py", "x", 1, 1, ChunkType.BLOCK, "python")
+
+    def test_callback_after_chunks_stored(self):
+        store = InMemoryStore()
+        stored = []
+        writer = BulkWriter(store, batch_size=2)
+        writer.add([self._chunk(1)], on_stored=lambda: stored.append("a"))
+        assert stored == []
+        writer.add([self._chunk(2), self._chunk(3)], on_stored=lambda: stored.append("b"))
+        assert stored == ["a"]
+        writer.add([], on_stored=lambda: stored.append("empty"))
+        writer.flush()
+        assert stored == ["a", "b", "empty"]
+
+    def test_no_callbacks_after_failed_batch(self, monkeypatch):
+        store = InMemoryStore()
+        stored = []
+        writer = BulkWriter(store, batch_size=2)
+        writer.add([self._chunk(1)], on_stored=lambda: stored.append("a"))
+        monkeypatch.setattr(store, "_upsert_batch", lambda chunks: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            writer.add([self._chunk(2)], on_stored=lambda: stored.append("b"))
+        monkeypatch.undo()
+        writer.add([self._chunk(3), self._chunk(4)], on_stored=lambda: stored.append("c"))
+        writer.flush()
+        assert stored == []
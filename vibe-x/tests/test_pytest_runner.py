@@ -0,0 +1,136 @@
+"""Gate 3 pytest 실행기 테스트."""
+
+import multiprocessing
+from dataclasses import replace
+
+import pytest
+
+from src.layer3_agents.integration_agent import IntegrationAgent
+from src.layer3_agents.pytest_runner import WORKER_ERROR_CODE, PytestRunner, _warm_shard
+
+ALPHA = """
+import pytest
+
+def test_ok():
+    assert True
+
+def test_fail():
+    assert 1 == 2
+
+@pytest.mark.skip(reason="x")
+def test_skipped():
+    pass
+"""
+
+BETA = """
+def test_one():
+    assert True
+
+def test_two():
+    assert True
+"""
+
+
+@pytest.fixture
+def test_files(tmp_project):
+    tests_dir = tmp_project / "tests"
+    tests_dir.mkdir()
+    files = []
+    for name, content in (("test_alpha.py", ALPHA), ("test_beta.py", BETA)):
+        path = tests_dir / name
+        path.write_text(content, encoding="utf-8")
+        files.append(path)
+    return files
+
+
+class TestPytestRunner:
+    """단일 실행/샤드/스트리밍 테스트."""
+
+    def test_single_invocation_streams_results(self, config, test_files):
+        streamed = []
+        shards = PytestRunner(config, on_result=streamed.append).run(test_files)
+
+        assert len(shards) == 1
+        assert sorted((o.nodeid.split("/")[-1], o.outcome) for o in streamed) == [
+            ("test_alpha.py::test_fail", "failed"),
+            ("test_alpha.py::test_ok", "passed"),
+            ("test_alpha.py::test_skipped", "skipped"),
+            ("test_beta.py::test_one", "passed"),
+            ("test_beta.py::test_two", "passed"),
+        ]
+        by_file = shards[0].outcomes_by_file()
+        assert len(by_file[test_files[1]]) == 2
+        failed = [o for o in by_file[test_files[0]] if o.outcome == "failed"]
+        assert "assert 1 == 2" in failed[0].message
+
+    def test_shards_split_files(self, config, test_files):
+        sharded = replace(config, gate=replace(config.gate, test_shards=4))
+        runner = PytestRunner(sharded)
+        assert sorted(len(s) for s in runner.shard(test_files)) == [1, 1]
+
+        shards = runner.run(test_files)
+        assert sorted(len(s.outcomes) for s in shards) == [2, 3]
+
+    def test_selection_is_per_call(self, config, test_files):
+        runner = PytestRunner(config)
+        selected = runner.run(test_files, {test_files[0]: ["test_ok"]})
+        assert sorted(o.nodeid.split("::")[1] for o in selected[0].outcomes) == [
+            "test_ok", "test_one", "test_two"
+        ]
+        assert len(runner.run(test_files)[0].outcomes) == 5
+
+    def test_collection_error(self, config, tmp_project):
+        broken = tmp_project / "test_broken.py"
+        broken.write_text("import not_a_module_xyz\n", encoding="utf-8")
+        shard = PytestRunner(config).run([broken])[0]
+        assert shard.returncode != 0
+        assert [o.outcome for o in shard.outcomes] == ["error"]
+
+    def test_timeout_per_shard(self, config, tmp_project):
+        slow = tmp_project / "test_slow.py"
+        slow.write_text("import time\n\ndef test_slow():\n    time.sleep(30)\n")
+        shard = PytestRunner(config, timeout=2).run([slow])[0]
+        assert shard.timed_out
+
+    def test_warm_workers(self, config, test_files):
+        warm = replace(
+            config,
+            gate=replace(config.gate, warm_test_workers=True, test_worker_preload=("pytest",)),
+        )
+        streamed = []
+        shards = PytestRunner(warm, on_result=streamed.append).run(test_files)
+        assert shards[0].returncode == 1
+        assert sorted(o.outcome for o in streamed) == [
+            "failed", "passed", "passed", "passed", "skipped"
+        ]
+
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="fork 필요"
+    )
+    def test_warm_worker_reports_pytest_crash(self, tmp_project, monkeypatch):
+        def crash(*args, **kwargs):
+            raise RuntimeError("plugin exploded")
+
+        monkeypatch.setattr(pytest, "main", crash)
+        ctx = multiprocessing.get_context("fork")
+        messages = ctx.Queue()
+        proc = ctx.Process(target=_warm_shard, args=([], str(tmp_project), messages))
+        proc.start()
+        message = messages.get(timeout=10)
+        proc.join(timeout=10)
+        assert message == ("done", WORKER_ERROR_CODE, ["pytest 실행 오류: plugin exploded"])
+
+
+class TestIntegrationRunTests:
+    """IntegrationAgent의 파일 단위 결과 분류 테스트."""
+
+    def test_classification(self, config, test_files):
+        seen = []
+        agent = IntegrationAgent(config, on_test=seen.append)
+        passed, failed, errors = agent._run_tests(test_files)
+
+        assert passed == ["test_beta.py (2 passed)"]
+        assert failed == ["test_alpha.py: tests/test_alpha.py::test_fail"]
+        assert errors == []
+        assert len(seen) == 5
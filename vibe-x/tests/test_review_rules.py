@@ -0,0 +1,129 @@
+"""Gate 4 AST 규칙 엔진 테스트."""
+
+import ast
+import textwrap
+
+from src.shared.types import GateStatus
+from src.layer3_agents.review_agent import ReviewAgent
+from src.layer3_agents.review_rules import RuleEngine
+
+
+def _codes(code: str) -> list[tuple[str, int]]:
+    report = RuleEngine().run(ast.parse(textwrap.dedent(code)))
+    return [(f.code, f.line) for f in report.findings]
+
+
+class TestSecurityRules:
+    """보안 규칙 테스트."""
+
+    def test_eval_vs_method(self):
+        assert _codes("model.eval()\neval(x)\n") == [("SEC-002", 2)]
+
+    def test_pickle_alias(self):
+        code = """
+        import pickle as pk
+        from pickle import loads
+        pk.loads(data)
+        loads(data)
+        json.loads(data)
+        """
+        assert _codes(code) == [("SEC-005", 4), ("SEC-005", 5)]
+
+    def test_formatted_sql_only(self):
+        code = """
+        cursor.execute(f"SELECT * FROM users WHERE id = {uid}")
+        cursor.execute("SELECT * FROM users WHERE id = ?", (uid,))
+        db.executemany("DELETE FROM t WHERE id = %s" % uid)
+        """
+        assert _codes(code) == [("SEC-003", 2), ("SEC-003", 4)]
+
+    def test_shell_true_via_from_import(self):
+        code = "from subprocess import run\nrun(cmd, shell=True)\nrun(cmd, shell=False)\n"
+        assert _codes(code) == [("SEC-004", 2)]
+
+    def test_secret_targets(self):
+        code = 'db_password = "supersecret1"\nmax_tokens = "1234567890"\nconnect(api_key="abcdefgh1")\n'
+        assert _codes(code) == [("SEC-001", 1), ("SEC-001", 3)]
+
+
+class TestPerformanceRules:
+    """성능 규칙 테스트."""
+
+    def test_call_in_loop_body_only(self):
+        code = """
+        for row in session.query(User):
+            total += row.value
+        for uid in ids:
+            cursor.execute("SELECT 1", (uid,))
+        names = [db.query(i) for i in ids]
+        for uid in ids:
+            def later():
+                return db.query(uid)
+        """
+        assert _codes(code) == [("PERF-001", 5), ("PERF-001", 6)]
+
+    def test_triple_loop_reported_once(self):
+        code = """
+        for a in x:
+            for b in y:
+                while c:
+                    for d in z:
+                        pass
+        """
+        assert _codes(code) == [("PERF-004", 4)]
+
+    def test_unbounded_load_and_sleep(self):
+        code = "rows = db.find()\nrows = db.find().limit(10)\ntime.sleep(30)\ntime.sleep(1)\n"
+        assert _codes("import time\n" + code) == [("PERF-002", 2), ("PERF-003", 4)]
+
+
+class TestNesting:
+    """실제 블록 중첩 깊이 테스트."""
+
+    def test_deep_nesting(self):
+        code = """
+        def f():
+            if a:
+                for b in c:
+                    with d:
+                        try:
+                            x = 1
+                        except E:
+                            y = 2
+        """
+        assert _codes(code) == [("CMPLX-002", 7)]
+
+    def test_elif_and_continuation_lines_are_not_nesting(self):
+        code = """
+        def f():
+            if a:
+                pass
+            elif b:
+                pass
+            elif c:
+                if d:
+                    call(1,
+                                 2,
+                                          3)
+        """
+        assert _codes(code) == []
+
+
+class TestReviewAgentDispatch:
+    """ReviewAgent의 AST/정규식 선택 테스트."""
+
+    def test_python_uses_ast(self, config, tmp_project):
+        f = tmp_project / "model.py"
+        f.write_text("def run(model):\n    model.eval()\n", encoding="utf-8")
+        assert ReviewAgent(config).run(f).status == GateStatus.PASSED
+
+    def test_non_python_uses_regex(self, config, tmp_project):
+        f = tmp_project / "app.js"
+        f.write_text("function run(x) {\n  return eval(x);\n}\n", encoding="utf-8")
+        result = ReviewAgent(config).run(f)
+        assert result.details == ["[SEC-002] L2: eval/exec 사용 (코드 인젝션 위험)"]
+
+    def test_syntax_error_falls_back_to_regex(self, config, tmp_project):
+        f = tmp_project / "broken.py"
+        f.write_text("def run(x:\n    eval(x)\n", encoding="utf-8")
+        assert any("SEC-002" in d for d in ReviewAgent(config).run(f).details)
@@ -0,0 +1,309 @@
+"""BM25 키워드 색인 + 하이브리드 검색 테스트."""
+
+import pytest
+
+from src.shared.types import CodeChunk, ChunkType, SearchResult
+from src.layer2_rag.keyword_index import KeywordIndex, tokenize_code
+from src.layer2_rag.query_cache import TTLCache
+from src.layer2_rag.path_filter import normalize_filter, path_prefixes, relative_path
+from src.layer2_rag import registry
+from src.layer2_rag.searcher import CodeSearcher, build_where, reciprocal_rank_fusion
+from src.layer2_rag.vector_db import VectorStore
+
+
+def _chunk(name: str, content: str, file_path: str = "src/mod.py", line: int = 1) -> CodeChunk:
+    return CodeChunk(
+        file_path=file_path,
+        content=content,
+        start_line=line,
+        end_line=line + content.count("\n"),
+        chunk_type=ChunkType.FUNCTION,
+        language="python",
+        name=name,
+    )
+
+
+def _result(chunk_id: str, distance: float = 0.5) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id, content="", file_path="f.py",
+        start_line=1, end_line=1, distance=distance,
+    )
+
+
+@pytest.fixture
+def keywords(config):
+    index = KeywordIndex(config)
+    index.upsert([
+        _chunk("_detect_overlap", "def _detect_overlap(a, b):\n    return a & b", line=1),
+        _chunk("record_gate", "def record_gate(self):\n    if len(h) > MAX_GATE_HISTORY:\n        h.pop()", line=10),
+        _chunk("load_config", "def load_config():\n    return VibeXConfig()", "src/config.py"),
+    ])
+    yield index
+    index.close()
+
+
+class TestTokenizeCode:
+    """코드 토큰화 테스트."""
+
+    def test_identifier_and_parts(self):
+        terms = list(tokenize_code("_detect_overlap"))
+        assert terms == ["_detect_overlap", "detect", "overlap"]
+
+    def test_camel_case_split(self):
+        assert list(tokenize_code("CodeSearcher")) == ["codesearcher", "code", "searcher"]
+
+    def test_short_tokens_dropped(self):
+        assert list(tokenize_code("a = b")) == []
+
+
+class TestKeywordIndex:
+    """SQLite FTS5 BM25 색인 테스트."""
+
+    def test_exact_identifier_ranks_first(self, keywords):
+        results = keywords.search("_detect_overlap", top_k=5)
+        assert results[0].metadata["name"] == "_detect_overlap"
+        assert results[0].relevance_score == 1.0
+
+    def test_constant_found_in_body(self, keywords):
+        results = keywords.search("MAX_GATE_HISTORY", top_k=5)
+        assert [r.metadata["name"] for r in results] == ["record_gate"]
+        assert results[0].start_line == 10
+
+    def test_upsert_replaces_same_id(self, keywords):
+        keywords.upsert([_chunk("_detect_overlap", "def _detect_overlap():\n    pass")])
+        assert keywords.count() == 3
+        assert "pass" in keywords.search("_detect_overlap", 1)[0].content
+
+    def test_delete_by_ids_and_file(self, keywords):
+        keywords.delete_ids(["src/mod.py:1-2"])
+        assert not keywords.search("_detect_overlap", 5)
+
+        keywords.delete_file("src/config.py")
+        assert keywords.count() == 1
+
+    def test_persisted_across_instances(self, config, keywords):
+        reopened = KeywordIndex(config)
+        assert reopened.count() == 3
+        reopened.close()
+
+    def test_clear(self, keywords):
+        keywords.clear()
+        assert keywords.count() == 0
+        assert keywords.search("load_config", 5) == []
+
+
+class TestReciprocalRankFusion:
+    """RRF 융합 테스트."""
+
+    def test_overlap_ranked_first(self):
+        fused = reciprocal_rank_fusion(
+            [_result("a"), _result("b")], [_result("b"), _result("c")], 0.5, 60
+        )
+        assert [r.chunk_id for r in fused] == ["b", "a", "c"]
+        assert fused[0].metadata["rrf_score"] > fused[1].metadata["rrf_score"]
+
+    def test_weight_biases_keyword_side(self):
+        fused = reciprocal_rank_fusion([_result("v")], [_result("k")], 0.9, 60)
+        assert fused[0].chunk_id == "k"
+
+
+class FakeStore:
+    """검색 호출을 기록하는 VectorStore 대역."""
+
+    def __init__(self, keywords: KeywordIndex) -> None:
+        self.keywords = keywords
+        self.vector_calls = 0
+        self.list_metadata = True
+        self.result_cache = TTLCache(0, 0)
+
+    def generation(self) -> int:
+        return self.keywords.generation()
+
+    def search(self, query, top_k=None, where=None):
+        self.vector_calls += 1
+        return [_result("src/config.py:1-2", 0.2)]
+
+    def keyword_search(self, query, top_k=None, **filters):
+        return self.keywords.search(query, top_k or 10, **filters)
+
+    def count(self) -> int:
+        return self.keywords.count()
+
+
+class TestHybridSearch:
+    """CodeSearcher 하이브리드 검색 테스트."""
+
+    @pytest.fixture
+    def searcher(self, config, keywords):
+        s = CodeSearcher(config)
+        s._store = FakeStore(keywords)
+        return s
+
+    def test_identifier_query_skips_embedding(self, searcher):
+        results = searcher.search("_detect_overlap")
+        assert results[0].metadata["name"] == "_detect_overlap"
+        assert searcher._store.vector_calls == 0
+
+    def test_natural_language_query_fused(self, searcher):
+        results = searcher.search("detect overlap")
+        assert searcher._store.vector_calls == 1
+        ids = [r.chunk_id for r in results]
+        assert "src/config.py:1-2" in ids and "src/mod.py:1-2" in ids
+
+    def test_vector_mode(self, searcher):
+        results = searcher.search("_detect_overlap", mode="vector")
+        assert [r.chunk_id for r in results] == ["src/config.py:1-2"]
+
+    def test_invalid_mode(self, searcher):
+        with pytest.raises(ValueError):
+            searcher.search("x", mode="fuzzy")
+
+
+class HashEmbedder:
+    """텍스트 길이로 결정적인 벡터를 만드는 임베더 대역 (모델 다운로드 없음)."""
+
+    def encode(self, texts, batch_size, **kwargs):
+        return [[float(len(t) % 7 + 1), float(len(t) % 5 + 1), 1.0] for t in texts]
+
+
+class TestPathFilter:
+    """경로 접두사 유틸리티 테스트."""
+
+    def test_prefixes(self):
+        assert path_prefixes("src/layer2_rag/chunker.py") == [
+            "src", "src/layer2_rag", "src/layer2_rag/chunker.py"
+        ]
+
+    def test_relative_to_root(self, tmp_project):
+        root = tmp_project.resolve()
+        assert relative_path(str(root / "src" / "a.py"), root) == "src/a.py"
+        assert relative_path("/elsewhere/a.py", root) == "/elsewhere/a.py"
+
+    def test_normalize(self, tmp_project):
+        assert normalize_filter("./src/layer2_rag/", tmp_project) == "src/layer2_rag"
+        assert normalize_filter(str(tmp_project / "src"), tmp_project) == "src"
+
+    def test_build_where(self):
+        assert build_where(None, None) is None
+        assert build_where("python", None) == {"language": "python"}
+        assert build_where("python", "src") == {
+            "$and": [{"language": "python"}, {"path_prefixes": {"$contains": "src"}}]
+        }
+
+
+class TestFilterPushdown:
+    """ChromaDB where 절 필터 적용 검증 (실제 PersistentClient 사용)."""
+
+    @pytest.fixture(params=[True, False], ids=["list-metadata", "post-filter"])
+    def searcher(self, request, config, tmp_project):
+        store = VectorStore(config)
+        store._embedder = HashEmbedder()
+        store._embedder_loaded = True
+        # False: 리스트 메타데이터를 받지 않는 ChromaDB와 같은 경로
+        store.list_metadata = request.param
+
+        root = tmp_project.resolve()
+        chunks = [
+            _chunk(f"noise_{i}", f"def noise_{i}():\n    pass", str(root / "other" / f"n{i}.py"))
+            for i in range(12)
+        ]
+        for name in ("a", "b"):
+            path = str(root / "src" / "layer2_rag" / f"{name}.py")
+            chunks.append(_chunk(f"wanted_{name}", f"def wanted_{name}():\n    pass", path))
+        ts = _chunk("ts_fn", "function tsFn() {}", str(root / "src" / "web.ts"))
+        ts.language = "typescript"
+        chunks.append(ts)
+        store.add_chunks(chunks)
+
+        s = CodeSearcher(config)
+        s._store = store
+        yield s
+        store.keywords.close()
+
+    def test_directory_prefix_returns_full_top_k(self, searcher):
+        results = searcher.search("function", top_k=2, file_filter="src/layer2_rag", mode="vector")
+        assert sorted(r.metadata["name"] for r in results) == ["wanted_a", "wanted_b"]
+
+    def test_path_prefixes_stored_only_when_supported(self, searcher):
+        store = searcher._store
+        stored = store.collection.get(limit=1, include=["metadatas"])["metadatas"][0]
+        assert ("path_prefixes" in stored) is store.list_metadata
+
+    def test_language_pushed_down(self, searcher):
+        results = searcher.search("function", top_k=3, language_filter="typescript", mode="vector")
+        assert [r.metadata["name"] for r in results] == ["ts_fn"]
+
+    def test_substring_filter_over_fetches(self, searcher):
+        results = searcher.search("function", top_k=2, file_filter="layer2", mode="vector")
+        assert sorted(r.metadata["name"] for r in results) == ["wanted_a", "wanted_b"]
+
+    def test_keyword_path_uses_same_filters(self, searcher):
+        results = searcher.search("pass", top_k=5, file_filter="src/layer2_rag", mode="keyword")
+        assert sorted(r.metadata["name"] for r in results) == ["wanted_a", "wanted_b"]
+
+    def test_repeated_query_served_from_cache(self, searcher):
+        first = searcher.search("function", top_k=2, file_filter="src/layer2_rag")
+        second = searcher.search("function", top_k=2, file_filter="src/layer2_rag")
+        assert [r.chunk_id for r in first] == [r.chunk_id for r in second]
+        assert searcher._store.result_cache.stats()["hits"] == 1
+
+    def test_cached_results_not_shared_with_callers(self, searcher):
+        first = searcher.search("function", top_k=2, file_filter="src/layer2_rag")
+        first[0].metadata["name"] = "mutated"
+        first[0].distance = 9.0
+
+        second = searcher.search("function", top_k=2, file_filter="src/layer2_rag")
+        assert second[0] is not first[0]
+        assert second[0].metadata["name"] != "mutated"
+        assert second[0].distance != 9.0
+
+    def test_index_write_invalidates_cached_results(self, config, searcher):
+        searcher.search("wanted", top_k=5, mode="keyword")
+
+        # 다른 프로세스(인덱서)의 쓰기도 세대 번호로 감지된다
+        other = KeywordIndex(config)
+        other.upsert([_chunk("wanted_c", "def wanted_c():\n    pass", "src/layer2_rag/c.py")])
+        other.close()
+
+        results = searcher.search("wanted", top_k=5, mode="keyword")
+        assert "wanted_c" in {r.metadata["name"] for r in results}
+        assert searcher._store.result_cache.stats()["hits"] == 0
+
+
+class TestRegistry:
+    """프로세스 공용 VectorStore/CodeSearcher 레지스트리 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_registry(self):
+        registry.clear_registry()
+        yield
+        registry.clear_registry()
+
+    def test_same_config_shares_instances(self, config):
+        assert registry.get_store(config) is registry.get_store(config)
+        searcher = registry.get_searcher(config)
+        assert searcher is registry.get_searcher(config)
+        assert searcher._store is registry.get_store(config)
+
+    def test_different_project_gets_own_store(self, config, tmp_path):
+        from dataclasses import replace
+
+        other = replace(config, paths=replace(config.paths, project_root=tmp_path / "other"))
+        assert registry.get_store(config) is not registry.get_store(other)
+
+    def test_concurrent_first_access_creates_one_store(self, config):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            stores = list(pool.map(lambda _: registry.get_store(config), range(32)))
+        assert len({id(s) for s in stores}) == 1
+
+    def test_warm_up_loads_embedder_once(self, config):
+        store = registry.get_store(config)
+        store._collection = type("C", (), {"count": lambda self: 0})()
+        store._embedder = HashEmbedder()
+        store._embedder_loaded = True
+
+        assert registry.warm_up(config) >= 0
+        assert store._query_embeddings.stats()["size"] == 1
+        store.keywords.close()
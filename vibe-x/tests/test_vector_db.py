@@ -0,0 +1,150 @@
+"""벡터 저장소 배치 임베딩/일괄 저장 테스트."""
+
+import pytest
+
+from src.shared.config import RagConfig, VibeXConfig, PathConfig
+from src.shared.types import CodeChunk, ChunkType
+from src.layer2_rag import query_cache
+from src.layer2_rag.query_cache import LRUCache, TTLCache
+from src.layer2_rag.vector_db import VectorStore
+
+
+class FakeCollection:
+    """upsert 호출만 기록하는 ChromaDB 컬렉션 대역."""
+
+    def __init__(self) -> None:
+        self.upserts: list[dict] = []
+
+    def upsert(self, **kwargs) -> None:
+        self.upserts.append(kwargs)
+
+
+class FakeClient:
+    def get_max_batch_size(self) -> int:
+        return 1000
+
+
+class FakeEmbedder:
+    """encode 호출 시 받은 batch_size를 기록한다."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def encode(self, texts, batch_size, **kwargs):
+        self.batch_sizes.append(batch_size)
+        return [[0.1, 0.2] for _ in texts]
+
+
+def _chunks(count: int, file_path: str = "a.py") -> list[CodeChunk]:
+    return [
+        CodeChunk(
+            file_path=file_path,
+            content=f"x_{i} = {i}",
+            start_line=i + 1,
+            end_line=i + 1,
+            chunk_type=ChunkType.BLOCK,
+            language="python",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def store(tmp_project):
+    config = VibeXConfig(
+        paths=PathConfig(project_root=tmp_project),
+        rag=RagConfig(embedding_batch_size=8, upsert_batch_size=10),
+    )
+    s = VectorStore(config)
+    s._client = FakeClient()
+    s._collection = FakeCollection()
+    s._embedder = FakeEmbedder()
+    s._embedder_loaded = True
+    return s
+
+
+class TestBatchedUpsert:
+    """배치 임베딩 + upsert 검증."""
+
+    def test_add_chunks_splits_into_batches(self, store):
+        store.add_chunks(_chunks(25))
+        sizes = [len(u["ids"]) for u in store._collection.upserts]
+        assert sizes == [10, 10, 5]
+        assert store._embedder.batch_sizes == [8, 8, 8]
+
+    def test_embeddings_passed_explicitly(self, store):
+        store.add_chunks(_chunks(3))
+        upsert = store._collection.upserts[0]
+        assert len(upsert["embeddings"]) == 3
+
+    def test_duplicate_ids_in_batch_deduplicated(self, store):
+        chunks = _chunks(2) + _chunks(2)
+        store.add_chunks(chunks)
+        assert len(store._collection.upserts[0]["ids"]) == 2
+
+    def test_bulk_writer_buffers_across_files(self, store):
+        with store.bulk_writer() as writer:
+            for n in range(7):
+                writer.add(_chunks(3, file_path=f"f{n}.py"))
+            assert len(store._collection.upserts) == 2
+
+        sizes = [len(u["ids"]) for u in store._collection.upserts]
+        assert sizes == [10, 10, 1]
+        assert writer.written == 21
+
+    def test_without_embedder_falls_back_to_chroma(self, store):
+        store._embedder = None
+        store.add_chunks(_chunks(2))
+        assert "embeddings" not in store._collection.upserts[0]
+
+
+class TestQueryCaches:
+    """질의 임베딩 LRU / 결과 TTL 캐시 검증."""
+
+    def test_lru_evicts_oldest(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl_expires(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+        cache = TTLCache(10, ttl_seconds=5)
+        cache.put("q", ["r"])
+        assert cache.get("q") == ["r"]
+        now[0] += 6
+        assert cache.get("q") is None
+
+    def test_zero_size_disables(self):
+        cache = TTLCache(10, ttl_seconds=0)
+        cache.put("q", 1)
+        assert cache.get("q") is None
+
+    def test_query_embedding_cached_by_normalized_text(self, store):
+        first = store.embed_query("find  config loader")
+        second = store.embed_query(" find config loader ")
+        assert first == second
+        assert len(store._embedder.batch_sizes) == 1
+
+        stats = store._query_embeddings.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_write_clears_result_cache(self, store):
+        store.result_cache.put("key", ["cached"])
+        generation = store.generation()
+        store.add_chunks(_chunks(1))
+        assert store.result_cache.get("key") is None
+        assert store.generation() > generation
+
+    def test_stats_expose_cache_counters(self, store):
+        store._collection.count = lambda: 0
+        store.embed_query("q")
+        cache = store.get_stats()["cache"]
+        assert cache["query_embedding"]["misses"] == 1
+        assert "hits" in cache["result"]
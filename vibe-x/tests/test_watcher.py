@@ -0,0 +1,154 @@
+"""파일 변경 감시 데몬 테스트."""
+
+import threading
+import time
+from pathlib import Path
+
+from src.layer2_rag.indexer import CodebaseIndexer
+from src.layer2_rag.watcher import ChangeDebouncer, IndexWatcher
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingIndexer(CodebaseIndexer):
+    """index_file 호출만 기록하는 인덱서 대역."""
+
+    def __init__(self, config) -> None:
+        super().__init__(config, store=object())
+        self.calls: list[Path] = []
+        self.indexed: set[str] = set()
+
+    def index_file(self, file_path: Path) -> int:
+        self.calls.append(file_path)
+        return 1
+
+    def indexed_paths_under(self, root: Path) -> set[str]:
+        prefix = f"{root.resolve()}/"
+        return {p for p in self.indexed if p.startswith(prefix)}
+
+
+class TestChangeDebouncer:
+    """이벤트 병합/지연 규칙 테스트."""
+
+    def test_burst_coalesced_into_one(self):
+        clock = FakeClock()
+        debouncer = ChangeDebouncer(1.0, 10.0, clock=clock)
+        for _ in range(20):
+            debouncer.add("/p/a.py")
+            clock.now += 0.1
+            assert debouncer.pop_ready() == []
+
+        clock.now += 1.0
+        assert debouncer.pop_ready() == ["/p/a.py"]
+        assert debouncer.coalesced == 19
+        assert len(debouncer) == 0
+
+    def test_max_delay_bounds_continuous_saves(self):
+        clock = FakeClock()
+        debouncer = ChangeDebouncer(1.0, 3.0, clock=clock)
+        ready: list[str] = []
+        for _ in range(40):
+            debouncer.add("/p/a.py")
+            clock.now += 0.5
+            ready += debouncer.pop_ready()
+        assert 1 <= len(ready) <= 7  # 20초 동안 최대 3초마다 한 번
+
+    def test_files_independent(self):
+        clock = FakeClock()
+        debouncer = ChangeDebouncer(1.0, 10.0, clock=clock)
+        debouncer.add("/p/a.py")
+        clock.now += 0.8
+        debouncer.add("/p/b.py")
+        clock.now += 0.3
+        assert debouncer.pop_ready() == ["/p/a.py"]
+        clock.now += 1.0
+        assert debouncer.pop_ready() == ["/p/b.py"]
+
+
+class TestIndexWatcher:
+    """이벤트 필터링과 인덱싱 호출 테스트."""
+
+    def _watcher(self, config, clock):
+        indexer = RecordingIndexer(config)
+        return IndexWatcher(config, indexer, ChangeDebouncer(1.0, 10.0, clock=clock)), indexer
+
+    def test_repeated_saves_indexed_once(self, config, tmp_project):
+        clock = FakeClock()
+        watcher, indexer = self._watcher(config, clock)
+        target = tmp_project / "a.py"
+        target.write_text("x = 1\n", encoding="utf-8")
+        for _ in range(20):
+            watcher.notify(str(target))
+
+        clock.now += 2.0
+        assert watcher.process_pending() == 1
+        assert indexer.calls == [target.resolve()]
+        assert watcher.indexed_files == 1
+
+    def test_ignored_and_state_files_skipped(self, config, tmp_project):
+        clock = FakeClock()
+        watcher, indexer = self._watcher(config, clock)
+        watcher.notify(str(tmp_project / "node_modules" / "lib.js"))
+        watcher.notify(str(tmp_project / "image.png"))
+        watcher.notify(str(config.paths.index_manifest_path))
+        watcher.notify(str(config.paths.chroma_db_path / "chroma.sqlite3.json"))
+        watcher.notify(str(config.paths.vibe_x_root / ".state" / "metrics.json"))
+
+        clock.now += 2.0
+        assert watcher.process_pending() == 0
+        assert indexer.calls == []
+
+    def test_rename_and_delete(self, config, tmp_project):
+        clock = FakeClock()
+        watcher, indexer = self._watcher(config, clock)
+        old, new = tmp_project / "old.py", tmp_project / "new.py"
+        new.write_text("y = 2\n", encoding="utf-8")
+        watcher.notify(str(old))
+        watcher.notify(str(new))
+
+        clock.now += 2.0
+        watcher.process_pending()
+        assert set(indexer.calls) == {old.resolve(), new.resolve()}
+        assert watcher.indexed_files == 1
+        assert watcher.removed_files == 1
+
+    def test_directory_move_rechecks_indexed_files(self, config, tmp_project):
+        clock = FakeClock()
+        watcher, indexer = self._watcher(config, clock)
+        gone = tmp_project / "pkg" / "mod.py"
+        indexer.indexed = {str(gone.resolve())}
+        moved = tmp_project / "pkg2"
+        moved.mkdir()
+        (moved / "mod.py").write_text("z = 3\n", encoding="utf-8")
+
+        watcher.notify_tree(str(tmp_project / "pkg"))
+        watcher.notify_tree(str(moved))
+        clock.now += 2.0
+        watcher.process_pending()
+        assert set(indexer.calls) == {gone.resolve(), (moved / "mod.py").resolve()}
+
+    def test_observer_reindexes_saved_file(self, config, tmp_project):
+        indexer = RecordingIndexer(config)
+        watcher = IndexWatcher(config, indexer, ChangeDebouncer(0.2, 5.0))
+        thread = threading.Thread(target=watcher.run, args=(tmp_project, False), daemon=True)
+        thread.start()
+        try:
+            time.sleep(0.3)
+            target = tmp_project / "live.py"
+            for i in range(5):
+                target.write_text(f"v = {i}\n", encoding="utf-8")
+            deadline = time.monotonic() + 5
+            while not indexer.calls and time.monotonic() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.3)
+        finally:
+            watcher.stop()
+            thread.join(timeout=5)
+
+        assert indexer.calls == [target.resolve()]